@@ -30,21 +30,22 @@ class OTM:
         if type == "dataflow":
             return self.dataflows
 
-    def json(self):
-        json = {
+    def json_header(self):
+        return {
             "otmVersion": self.version,
             "project": {
                 "name": self.project_name,
                 "id": self.project_id
             },
-            "representations": [],
-            "trustZones": [],
-            "components": [],
-            "dataflows": []
+            "representations": [representation.json() for representation in self.representations]
         }
 
-        for representation in self.representations:
-            json["representations"].append(representation.json())
+    def json(self):
+        json = self.json_header()
+        json["trustZones"] = []
+        json["components"] = []
+        json["dataflows"] = []
+
         for trustzone in self.trustzones:
             json["trustZones"].append(trustzone.json())
         for component in self.components:
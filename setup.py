@@ -26,12 +26,11 @@ setup(
         'click==8.1.3',
         'uvicorn==0.20.0',
         'shapely==2.0.1',
-        'vsdx==0.5.13',
+        'vsdx==0.6.1',
         'python-magic==0.4.27',
         'setuptools==65.5.1',
         'defusedxml==0.7.1',
-        'networkx==3.0',
-        'pygraphviz==1.10'
+        'networkx==3.0'
     ],
     use_scm_version={
         'write_to': 'startleft/version.py',
@@ -51,6 +50,12 @@ setup(
             'deepdiff==6.2.3',
             'httpx==0.23.3',
             'pytest-mock==3.10.0'
+        ],
+        "tfplan-incremental": [
+            'ijson==3.2.0'
+        ],
+        "tfgraph-pygraphviz": [
+            'pygraphviz==1.10'
         ]
     },
     entry_points='''
@@ -1,14 +1,40 @@
+import io
 import os
+import shutil
 import tempfile
-from magic import Magic
+import threading
+
+from magic import Magic, MagicException, MAGIC_PARAM_BYTES_MAX
+
+# Maximum number of bytes of a buffer read to detect its MIME type. By default, the same number that libmagic reads
+MIME_SNIFF_BYTES_ENV_VAR = 'STARTLEFT_MIME_SNIFF_BYTES'
+
+_mime_detectors = threading.local()
 
 
 def copy_to_disk(diag_file: tempfile.SpooledTemporaryFile, suffix: str):
     with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as ntf:
-        ntf.write(diag_file.read())
+        shutil.copyfileobj(diag_file, ntf)
         return ntf
 
 
+def copy_to_memory_or_disk(diag_file: tempfile.SpooledTemporaryFile, suffix: str, max_memory_bytes: int):
+    """
+    :return: a BytesIO with the contents of the file or, if they are bigger than max_memory_bytes, a temporary file
+    with them that must be deleted after being used
+    """
+    if get_file_size(diag_file) > max_memory_bytes:
+        return copy_to_disk(diag_file, suffix)
+    return io.BytesIO(diag_file.read())
+
+
+def get_file_size(file) -> int:
+    position = file.tell()
+    size = file.seek(0, os.SEEK_END)
+    file.seek(position)
+    return size - position
+
+
 def delete(filename: str):
     os.unlink(filename)
 
@@ -23,9 +49,37 @@ def read_byte_data(data: bytes, encoding: str = 'utf-8') -> str:
     return data.decode(encoding)
 
 
+def get_mime_detector() -> Magic:
+    """
+    Loading the libmagic database is expensive, so the detector is created once per thread, since it cannot be used by
+    several threads at the same time
+    """
+    detector = getattr(_mime_detectors, 'detector', None)
+    if detector is None:
+        detector = Magic(mime=True)
+        _mime_detectors.detector = detector
+        _mime_detectors.sniff_bytes = get_mime_sniff_bytes(detector)
+    return detector
+
+
+def get_mime_sniff_bytes(detector: Magic) -> int:
+    sniff_bytes = os.getenv(MIME_SNIFF_BYTES_ENV_VAR)
+    if sniff_bytes:
+        return int(sniff_bytes)
+
+    try:
+        return detector.getparam(MAGIC_PARAM_BYTES_MAX)
+    except (NotImplementedError, MagicException):
+        return 0
+
+
 def get_file_type_by_content(file_content: bytes) -> str:
-    return Magic(mime=True).from_buffer(file_content)
+    detector = get_mime_detector()
+    sniff_bytes = _mime_detectors.sniff_bytes
+    if 0 < sniff_bytes < len(file_content):
+        file_content = file_content[:sniff_bytes]
+    return detector.from_buffer(file_content)
 
 
 def get_file_type_by_name(file_name: str) -> str:
-    return Magic(mime=True).from_file(file_name)
+    return get_mime_detector().from_file(file_name)
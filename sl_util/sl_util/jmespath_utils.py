@@ -0,0 +1,125 @@
+"""
+Registry of compiled JMESPath expressions. The mappings use the same few expressions for every resource, so they are
+compiled once, ideally when the mapping file is loaded, and the parsed expressions are kept in a bounded LRU cache.
+"""
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Iterable, Callable, Union
+
+import jmespath
+from jmespath.exceptions import JMESPathError
+from jmespath.parser import ParsedResult
+
+logger = logging.getLogger(__name__)
+
+JMESPATH_CACHE_SIZE_ENV_VAR = 'STARTLEFT_JMESPATH_CACHE_SIZE'
+DEFAULT_JMESPATH_CACHE_SIZE = 1024
+
+# Mapping attributes whose values are JMESPath expressions
+JMESPATH_MAPPING_KEYS = ('$root', '$path', '$findFirst', '$ref', 'searchPath')
+
+
+class JMESPathExpressionRegistry:
+
+    def __init__(self, maxsize: int = DEFAULT_JMESPATH_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.__expressions = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def compile(self, expression: str) -> ParsedResult:
+        with self.__lock:
+            parsed_result = self.__expressions.get(expression)
+            if parsed_result is not None:
+                self.__expressions.move_to_end(expression)
+                self.hits += 1
+                return parsed_result
+            self.misses += 1
+
+        return self.__add(expression)
+
+    def precompile(self, expressions: Iterable[str]):
+        """
+        Adds the expressions to the registry without counting them as hits or misses. Invalid expressions are
+        ignored, so their errors are raised when they are searched
+        """
+        for expression in expressions:
+            with self.__lock:
+                if expression in self.__expressions:
+                    continue
+            try:
+                self.__add(expression)
+            except JMESPathError as e:
+                logger.debug(f'Unable to precompile JMESPath expression {expression}: {e}')
+
+    def __add(self, expression: str) -> ParsedResult:
+        parsed_result = jmespath.compile(expression)
+
+        with self.__lock:
+            self.__expressions[expression] = parsed_result
+            while len(self.__expressions) > self.maxsize:
+                self.__expressions.popitem(last=False)
+
+        return parsed_result
+
+    def clear(self):
+        with self.__lock:
+            self.__expressions.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        with self.__lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0,
+                'size': len(self.__expressions),
+                'maxsize': self.maxsize
+            }
+
+
+expression_registry = JMESPathExpressionRegistry(
+    int(os.getenv(JMESPATH_CACHE_SIZE_ENV_VAR, DEFAULT_JMESPATH_CACHE_SIZE)))
+
+
+def compile_expression(expression: str) -> ParsedResult:
+    return expression_registry.compile(expression)
+
+
+def search(expression: str, data, options: jmespath.Options = None):
+    return compile_expression(expression).search(data, options=options)
+
+
+def get_mapping_expressions(mapping: Union[dict, list],
+                            build_expressions: Callable[[dict], Iterable[str]] = None) -> Iterable[str]:
+    """
+    Finds the JMESPath expressions of a mapping
+    :param mapping: the mapping, or any part of it
+    :param build_expressions: optional function returning the expressions composed at runtime from a mapping object
+    """
+    if isinstance(mapping, list):
+        for element in mapping:
+            yield from get_mapping_expressions(element, build_expressions)
+
+    if isinstance(mapping, dict):
+        if build_expressions:
+            yield from build_expressions(mapping)
+
+        for key, value in mapping.items():
+            if key in JMESPATH_MAPPING_KEYS:
+                if isinstance(value, str):
+                    yield value
+                elif isinstance(value, list):
+                    yield from (expression for expression in value if isinstance(expression, str))
+
+            yield from get_mapping_expressions(value, build_expressions)
+
+
+def precompile_mapping_expressions(mapping: dict, build_expressions: Callable[[dict], Iterable[str]] = None):
+    expression_registry.precompile(get_mapping_expressions(mapping, build_expressions))
+    logger.debug(f'JMESPath expressions registry: {expression_registry.stats()}')
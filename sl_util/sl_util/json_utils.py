@@ -1,5 +1,6 @@
 import json
 import logging
+from typing import Iterator, Optional, TextIO
 
 import yaml
 
@@ -16,9 +17,79 @@ def is_json(source: bytes):
         return False
 
 
-def get_otm_as_json(otm: OTM):
+OTM_JSON_INDENT = 2
+OTM_JSON_CHUNK_SIZE = 64 * 1024
+
+
+def iter_otm_json(otm: OTM, indent: Optional[int] = OTM_JSON_INDENT) -> Iterator[str]:
+    """
+    Encodes the OTM in chunks, one per element, so the whole OTM dict and its JSON string are never built at once.
+    With the default indent the result is byte-identical to json.dumps(otm.json(), indent=2)
+    :param indent: the indentation of the JSON, or None for a compact JSON without whitespaces
+    """
+    encoder = json.JSONEncoder(indent=indent, separators=(',', ': ') if indent is not None else (',', ':'))
+    newline = '\n' if indent is not None else ''
+    indentation = ' ' * indent if indent is not None else ''
+
+    def encode(value, level: int) -> str:
+        encoded = encoder.encode(value)
+        return encoded.replace('\n', '\n' + indentation * level) if newline else encoded
+
+    def encode_elements(elements: list) -> Iterator[str]:
+        if not elements:
+            yield '[]'
+            return
+
+        yield '['
+        for index, element in enumerate(elements):
+            yield (',' if index else '') + newline + indentation * 2 + encode(element.json(), 2)
+        yield newline + indentation + ']'
+
+    header = otm.json_header()
+    members = [(key, value, False) for key, value in header.items()]
+    members.extend([('trustZones', otm.trustzones, True),
+                    ('components', otm.components, True),
+                    ('dataflows', otm.dataflows, True)])
+    members.extend([(key, elements, True) for key, elements in (('threats', otm.threats),
+                                                                ('mitigations', otm.mitigations)) if elements])
+
+    yield '{'
+    for index, (key, value, is_element_list) in enumerate(members):
+        yield (',' if index else '') + newline + indentation + encoder.encode(key) + encoder.key_separator
+        if is_element_list:
+            yield from encode_elements(value)
+        else:
+            yield encode(value, 1)
+    yield newline + '}'
+
+
+def iter_otm_json_chunks(otm: OTM, indent: Optional[int] = OTM_JSON_INDENT,
+                         chunk_size: int = OTM_JSON_CHUNK_SIZE) -> Iterator[str]:
+    """
+    Groups the encoded OTM elements in chunks of at least chunk_size characters, suitable for streaming responses
+    """
+    buffer = []
+    buffer_size = 0
+    for encoded in iter_otm_json(otm, indent):
+        buffer.append(encoded)
+        buffer_size += len(encoded)
+        if buffer_size >= chunk_size:
+            yield ''.join(buffer)
+            buffer = []
+            buffer_size = 0
+
+    if buffer:
+        yield ''.join(buffer)
+
+
+def write_otm_json(otm: OTM, file: TextIO, indent: Optional[int] = OTM_JSON_INDENT):
+    for chunk in iter_otm_json(otm, indent):
+        file.write(chunk)
+
+
+def get_otm_as_json(otm: OTM, indent: Optional[int] = OTM_JSON_INDENT):
     logger.info("getting OTM contents as JSON")
-    return json.dumps(otm.json(), indent=2)
+    return ''.join(iter_otm_json(otm, indent))
 
 
 def yaml_data_as_str(data) -> str:
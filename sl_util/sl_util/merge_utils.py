@@ -0,0 +1,49 @@
+"""
+Merge of the documents loaded from several files, like the Terraform, CloudFormation or mapping files.
+"""
+from typing import Any, Dict
+
+
+class DocumentMerger:
+    """
+    Merges documents with the same result than deepmerge's always_merger: dicts are merged key by key, lists are
+    appended, sets are joined and any other value is overridden by the new one.
+
+    The always_merger copies the merged list every time a list is appended, so merging many files with long lists,
+    like the Terraform resources, is quadratic. This merger only copies a list the first time something is appended
+    to it, so the lists of the merged documents are never modified, and extends its own copy the next times. So every
+    document is walked once, and the already merged data is never walked again.
+    """
+
+    def __init__(self):
+        # The lists created by this merger, by id. They are kept so their ids are not reused
+        self.__own_lists: Dict[int, list] = {}
+
+    def merge(self, base: Any, nxt: Any) -> Any:
+        """
+        :param base: the merged document. Its dicts are updated in place, like the always_merger does
+        :param nxt: the document to merge
+        :return: the merged document
+        """
+        if isinstance(base, dict) and isinstance(nxt, dict):
+            for key, value in nxt.items():
+                base[key] = self.merge(base[key], value) if key in base else value
+            return base
+
+        if isinstance(base, list) and isinstance(nxt, list):
+            if id(base) in self.__own_lists:
+                base.extend(nxt)
+                return base
+
+            merged_list = base + nxt
+            self.__own_lists[id(merged_list)] = merged_list
+            return merged_list
+
+        if isinstance(base, set) and isinstance(nxt, set):
+            return base | nxt
+
+        return nxt
+
+
+def merge_documents(base: Any, nxt: Any) -> Any:
+    return DocumentMerger().merge(base, nxt)
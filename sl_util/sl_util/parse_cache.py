@@ -0,0 +1,272 @@
+"""
+Process-wide cache of parsed sources. The clients usually send the same IaC and threat model files again and again,
+so the trees returned by the parsers are kept, keyed by the SHA-256 of the source contents, in a size-bounded
+in-memory LRU cache and, optionally, in a second tier shared between processes, like a cache folder.
+
+The trees are stored pickled in memory. Every lookup unpickles a new copy, so the callers can modify them (like
+TerraformLoader does when it squashes the resources) without affecting the cached ones.
+
+The trees are stored as JSON in the cache folder, so reading its files never runs code, and the folder is only used if
+it belongs to the current user and the other users cannot write in it.
+"""
+import hashlib
+import json
+import logging
+import os
+import pickle
+import stat
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Union, Optional, Callable, Any
+
+logger = logging.getLogger(__name__)
+
+PARSE_CACHE_SIZE_ENV_VAR = 'STARTLEFT_PARSE_CACHE_SIZE'
+PARSE_CACHE_MAX_BYTES_ENV_VAR = 'STARTLEFT_PARSE_CACHE_MAX_BYTES'
+PARSE_CACHE_DIR_ENV_VAR = 'STARTLEFT_PARSE_CACHE_DIR'
+PARSE_CACHE_DIR_MAX_BYTES_ENV_VAR = 'STARTLEFT_PARSE_CACHE_DIR_MAX_BYTES'
+DEFAULT_PARSE_CACHE_SIZE = 128
+DEFAULT_PARSE_CACHE_MAX_BYTES = 32 * 1024 * 1024
+DEFAULT_PARSE_CACHE_DIR_MAX_BYTES = 1024 * 1024 * 1024
+
+PARSE_CACHE_FILE_EXTENSION = '.json'
+
+
+def get_source_digest(source: Union[bytes, str]) -> str:
+    return hashlib.sha256(source if isinstance(source, bytes) else source.encode()).hexdigest()
+
+
+def get_parse_cache_key(parser: str, source: Union[bytes, str]) -> str:
+    """
+    :param parser: the name of the parser, including its version if the parsed trees change between versions
+    :param source: the contents of the source
+    """
+    return f'{parser}-{get_source_digest(source)}'
+
+
+def check_parse_cache_directory(directory: str):
+    """
+    :raises ValueError: if the folder does not belong to the current user or other users can write in it
+    """
+    if os.name != 'posix':
+        return
+
+    directory_stat = os.stat(directory)
+    if directory_stat.st_uid != os.getuid():
+        raise ValueError(f'Parse cache folder {directory} does not belong to the current user')
+    if directory_stat.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+        raise ValueError(f'Parse cache folder {directory} is writable by other users')
+
+
+def to_json(tree: Any) -> Optional[str]:
+    """
+    :return: the tree as JSON, or None if it cannot be read back as the same tree, like trees with tuples or non
+    string keys
+    """
+    try:
+        data = json.dumps(tree, allow_nan=False)
+    except (TypeError, ValueError):
+        return None
+    return data if json.loads(data) == tree else None
+
+
+class DirectoryParseCacheStorage:
+    """
+    Second tier of the parse cache, which keeps the trees as JSON files of a folder. When the files exceed the maximum
+    size, the least recently used ones are removed
+    """
+
+    def __init__(self, directory: str, max_bytes: int = DEFAULT_PARSE_CACHE_DIR_MAX_BYTES):
+        """
+        :raises ValueError: if the folder does not belong to the current user or other users can write in it
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        check_parse_cache_directory(directory)
+
+    def __get_path(self, key: str) -> str:
+        return os.path.join(self.directory, key + PARSE_CACHE_FILE_EXTENSION)
+
+    def get(self, key: str) -> Any:
+        """
+        :return: the stored tree, or None if it is not stored or its file is not valid
+        """
+        path = self.__get_path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                tree = json.load(f)
+            os.utime(path)
+            return tree
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key: str, tree: Any):
+        data = to_json(tree)
+        if data is None:
+            return
+
+        try:
+            fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(data)
+            os.replace(temp_path, self.__get_path(key))
+            self.__evict()
+        except OSError as e:
+            logger.warning(f'Unable to store parsed source in cache folder {self.directory}: {e}')
+
+    def __evict(self):
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(PARSE_CACHE_FILE_EXTENSION):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total_bytes = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_bytes <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total_bytes -= size
+
+
+class ParseCache:
+    """
+    LRU cache of pickled parsed trees, bounded by number of entries and total size, backed by an optional storage
+    with get(key) and put(key, tree) methods
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_PARSE_CACHE_SIZE, max_bytes: int = DEFAULT_PARSE_CACHE_MAX_BYTES,
+                 storage: DirectoryParseCacheStorage = None):
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.storage = storage
+        self.hits = 0
+        self.storage_hits = 0
+        self.misses = 0
+        self.__entries = OrderedDict()
+        self.__bytes = 0
+        self.__lock = threading.Lock()
+
+    def is_cacheable(self, source) -> bool:
+        return (self.maxsize > 0 or self.storage is not None) and isinstance(source, (bytes, str))
+
+    def lookup(self, parser: str, source: Union[bytes, str]) -> Any:
+        """
+        :return: a copy of the parsed tree of the source, or None if it is not cached
+        """
+        if not self.is_cacheable(source):
+            return None
+
+        key = get_parse_cache_key(parser, source)
+        with self.__lock:
+            data = self.__entries.get(key)
+            if data is not None:
+                self.__entries.move_to_end(key)
+                self.hits += 1
+
+        tree = None
+        if data is not None:
+            try:
+                tree = pickle.loads(data)
+            except Exception as e:
+                logger.warning(f'Unable to read parsed source {key} from cache: {e}')
+        elif self.storage is not None:
+            tree = self.storage.get(key)
+            if tree is not None:
+                self.__put_entry(key, pickle.dumps(tree, protocol=pickle.HIGHEST_PROTOCOL))
+                with self.__lock:
+                    self.storage_hits += 1
+
+        if tree is None:
+            with self.__lock:
+                self.misses += 1
+            logger.debug(f'Parsed source not found in cache: {self.stats()}')
+            return None
+
+        logger.debug(f'Parsed source found in cache: {self.stats()}')
+        return tree
+
+    def store(self, parser: str, source: Union[bytes, str], tree: Any):
+        """
+        Stores a copy of the parsed tree of the source, so it can be modified after being stored
+        """
+        if not self.is_cacheable(source) or tree is None:
+            return
+
+        key = get_parse_cache_key(parser, source)
+        data = pickle.dumps(tree, protocol=pickle.HIGHEST_PROTOCOL)
+        self.__put_entry(key, data)
+        if self.storage is not None:
+            self.storage.put(key, tree)
+
+    def get(self, parser: str, source: Union[bytes, str], parse: Callable[[], Any]) -> Any:
+        """
+        :param parser: the name of the parser
+        :param source: the contents of the source
+        :param parse: the function that parses the source when it is not cached. If it raises an error, nothing is
+        cached
+        :return: a copy of the parsed tree
+        """
+        tree = self.lookup(parser, source)
+        if tree is None:
+            tree = parse()
+            self.store(parser, source, tree)
+
+        return tree
+
+    def __put_entry(self, key: str, data: bytes):
+        if self.maxsize <= 0 or len(data) > self.max_bytes:
+            return
+
+        with self.__lock:
+            if key in self.__entries:
+                self.__bytes -= len(self.__entries[key])
+            self.__entries[key] = data
+            self.__entries.move_to_end(key)
+            self.__bytes += len(data)
+            while len(self.__entries) > self.maxsize or self.__bytes > self.max_bytes:
+                _, evicted = self.__entries.popitem(last=False)
+                self.__bytes -= len(evicted)
+
+    def clear(self):
+        with self.__lock:
+            self.__entries.clear()
+            self.__bytes = 0
+            self.hits = 0
+            self.storage_hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        with self.__lock:
+            return {'hits': self.hits, 'storage_hits': self.storage_hits, 'misses': self.misses,
+                    'size': len(self.__entries), 'bytes': self.__bytes, 'maxsize': self.maxsize,
+                    'max_bytes': self.max_bytes}
+
+
+def build_parse_cache_storage() -> Optional[DirectoryParseCacheStorage]:
+    directory = os.getenv(PARSE_CACHE_DIR_ENV_VAR)
+    if not directory:
+        return None
+
+    try:
+        return DirectoryParseCacheStorage(
+            directory, int(os.getenv(PARSE_CACHE_DIR_MAX_BYTES_ENV_VAR, DEFAULT_PARSE_CACHE_DIR_MAX_BYTES)))
+    except (OSError, ValueError) as e:
+        logger.warning(f'Parse cache folder is not used: {e}')
+        return None
+
+
+def build_parse_cache() -> ParseCache:
+    storage = build_parse_cache_storage()
+
+    return ParseCache(int(os.getenv(PARSE_CACHE_SIZE_ENV_VAR, DEFAULT_PARSE_CACHE_SIZE)),
+                      int(os.getenv(PARSE_CACHE_MAX_BYTES_ENV_VAR, DEFAULT_PARSE_CACHE_MAX_BYTES)),
+                      storage)
+
+
+parse_cache = build_parse_cache()
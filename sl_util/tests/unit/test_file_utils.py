@@ -0,0 +1,98 @@
+import threading
+from io import BytesIO
+from tempfile import SpooledTemporaryFile
+from unittest.mock import patch
+
+from magic import Magic
+
+from sl_util.sl_util import file_utils
+from sl_util.sl_util.file_utils import get_mime_detector, get_file_type_by_content, get_file_type_by_name, \
+    MIME_SNIFF_BYTES_ENV_VAR, copy_to_memory_or_disk, get_byte_data, delete
+
+JSON_CONTENT = b'{"resource_changes": [{"address": "aws_vpc.vpc"}]}'
+
+
+class TestFileUtils:
+
+    def setup_method(self):
+        file_utils._mime_detectors = threading.local()
+
+    def test_detector_reused_in_thread(self):
+        # GIVEN a detector already used in the current thread
+        detector = get_mime_detector()
+
+        # WHEN a file type is detected
+        get_file_type_by_content(JSON_CONTENT)
+
+        # THEN the same detector is used
+        assert get_mime_detector() is detector
+
+    def test_threads_do_not_share_detectors(self):
+        # GIVEN the detector of the current thread
+        detector = get_mime_detector()
+
+        # WHEN other thread gets its detector
+        detectors = []
+        thread = threading.Thread(target=lambda: detectors.append(get_mime_detector()))
+        thread.start()
+        thread.join()
+
+        # THEN it is a different one
+        assert detectors[0] is not detector
+
+    @patch('magic.Magic.from_buffer', return_value='application/json')
+    def test_only_prefix_sniffed(self, from_buffer, monkeypatch):
+        # GIVEN a limit of bytes to sniff
+        monkeypatch.setenv(MIME_SNIFF_BYTES_ENV_VAR, '10')
+
+        # WHEN the type of a longer content is detected
+        get_file_type_by_content(JSON_CONTENT)
+
+        # THEN only its first bytes are sniffed
+        from_buffer.assert_called_once_with(JSON_CONTENT[:10])
+
+    def test_same_types_as_new_detector(self, tmp_path):
+        # GIVEN some contents
+        contents = [JSON_CONTENT, b'Resources:\n  VPC:\n    Type: AWS::EC2::VPC\n', b'<?xml version="1.0"?><a/>',
+                    b'resource "aws_vpc" "vpc" {}\n' * 100000]
+
+        for content in contents:
+            file = tmp_path / 'source'
+            file.write_bytes(content)
+
+            # WHEN their types are detected
+            # THEN they are the same detected by a new detector
+            assert get_file_type_by_content(content) == Magic(mime=True).from_buffer(content)
+            assert get_file_type_by_name(str(file)) == Magic(mime=True).from_file(str(file))
+
+
+class TestCopyToMemoryOrDisk:
+
+    def test_small_file_copied_to_memory(self):
+        # GIVEN an uploaded file smaller than the limit
+        upload = SpooledTemporaryFile()
+        upload.write(JSON_CONTENT)
+        upload.seek(0)
+
+        # WHEN it is copied
+        copy = copy_to_memory_or_disk(upload, '.json', len(JSON_CONTENT))
+
+        # THEN it is kept in memory
+        assert isinstance(copy, BytesIO)
+        assert copy.getvalue() == JSON_CONTENT
+
+    def test_big_file_copied_to_disk(self):
+        # GIVEN an uploaded file bigger than the limit
+        upload = SpooledTemporaryFile()
+        upload.write(JSON_CONTENT)
+        upload.seek(0)
+
+        # WHEN it is copied
+        copy = copy_to_memory_or_disk(upload, '.json', len(JSON_CONTENT) - 1)
+
+        # THEN it is written to a temporary file
+        try:
+            assert copy.name.endswith('.json')
+            assert get_byte_data(copy.name) == JSON_CONTENT
+        finally:
+            delete(copy.name)
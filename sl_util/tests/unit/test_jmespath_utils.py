@@ -0,0 +1,70 @@
+from pytest import raises
+from jmespath.exceptions import ParseError
+
+from sl_util.sl_util.jmespath_utils import JMESPathExpressionRegistry, get_mapping_expressions
+
+
+class TestJMESPathUtils:
+
+    def test_expressions_compiled_once(self):
+        # GIVEN an expressions registry
+        registry = JMESPathExpressionRegistry()
+
+        # WHEN the same expression is compiled twice
+        first = registry.compile('Resources.*.Type')
+        second = registry.compile('Resources.*.Type')
+
+        # THEN the parsed expression is reused
+        assert first is second
+        assert first.search({'Resources': {'a': {'Type': 'AWS::EC2::VPC'}}}) == ['AWS::EC2::VPC']
+
+        # AND the hit rate is available
+        assert registry.stats() == {'hits': 1, 'misses': 1, 'hit_rate': 0.5, 'size': 1, 'maxsize': 1024}
+
+    def test_least_recently_used_evicted(self):
+        # GIVEN an expressions registry with room for two expressions
+        registry = JMESPathExpressionRegistry(maxsize=2)
+        first = registry.compile('a')
+        registry.compile('b')
+
+        # WHEN the first expression is used again and a third one is added
+        registry.compile('a')
+        registry.compile('c')
+
+        # THEN the least recently used expression is evicted
+        assert registry.compile('a') is first
+        assert registry.stats()['size'] == 2
+        assert registry.stats()['misses'] == 3
+
+    def test_invalid_expressions(self):
+        # GIVEN an expressions registry
+        registry = JMESPathExpressionRegistry()
+
+        # WHEN an invalid expression is precompiled
+        registry.precompile(['a[', 'b'])
+
+        # THEN it is ignored
+        assert registry.stats()['size'] == 1
+
+        # AND the error is raised when it is compiled for searching
+        with raises(ParseError):
+            registry.compile('a[')
+
+    def test_get_mapping_expressions(self):
+        # GIVEN a mapping with JMESPath expressions
+        mapping = {
+            'trustzones': [{'id': 'tz', '$source': {'$root': 'Resources'}}],
+            'components': [
+                {'$source': {'$path': {'$searchParams': {'searchPath': 'Properties.VpcId', 'defaultValue': 'a'}}},
+                 'name': {'$findFirst': ['Properties.Name', 'Properties.Id']}},
+                {'$source': {'$search': {'$type': 'component', '$ref': 'Ref', '$path': 'Properties.Id'}}},
+                {'name': {'$format': '{name}'}}
+            ]
+        }
+
+        # WHEN the expressions of the mapping are got
+        expressions = list(get_mapping_expressions(mapping))
+
+        # THEN all the expressions are found
+        assert sorted(expressions) == sorted(['Resources', 'Properties.VpcId', 'Properties.Name', 'Properties.Id',
+                                              'Ref', 'Properties.Id'])
@@ -0,0 +1,79 @@
+import io
+import json
+
+from pytest import mark, param
+
+from otm.otm.entity.mitigation import Mitigation
+from otm.otm.entity.otm import OTM
+from otm.otm.entity.parent_type import ParentType
+from otm.otm.entity.representation import RepresentationType
+from otm.otm.entity.threat import Threat
+from otm.otm.provider import Provider
+from sl_util.sl_util.json_utils import iter_otm_json, iter_otm_json_chunks, write_otm_json, get_otm_as_json
+
+
+class DummyProvider(str, Provider):
+    DUMMY = ("DUMMY", "Dummy", RepresentationType.DIAGRAM)
+
+
+def build_empty_otm() -> OTM:
+    return OTM('project-name', 'project-id', DummyProvider.DUMMY)
+
+
+def build_otm() -> OTM:
+    otm = build_empty_otm()
+    otm.add_trustzone(id='tz', name='Trustzone "quoted"', type='tz-type', properties={'key': 'value'})
+    for index in range(3):
+        otm.add_component(id=f'c{index}', name=f'Componént\n{index}', type='c-type', parent='tz',
+                          parent_type=ParentType.TRUST_ZONE, tags=['tag-1', 'tag-2'])
+    otm.add_dataflow(id='df', name='Dataflow', source_node='c0', destination_node='c1', bidirectional=False)
+    otm.threats.append(Threat('threat', 'Threat', 'Spoofing', description='Description'))
+    otm.mitigations.append(Mitigation('mitigation', 'Mitigation'))
+    return otm
+
+
+class TestJsonUtils:
+
+    @mark.parametrize('otm', [param(build_empty_otm(), id='empty'), param(build_otm(), id='full')])
+    @mark.parametrize('indent', [param(2, id='indent-2'), param(4, id='indent-4'), param(0, id='indent-0')])
+    def test_otm_json_identical_to_json_dumps(self, otm: OTM, indent: int):
+        # GIVEN an OTM
+        # WHEN the OTM is encoded in chunks
+        encoded = ''.join(iter_otm_json(otm, indent))
+
+        # THEN the result is byte-identical to the dumped OTM dict
+        assert encoded == json.dumps(otm.json(), indent=indent)
+
+    @mark.parametrize('otm', [param(build_empty_otm(), id='empty'), param(build_otm(), id='full')])
+    def test_compact_otm_json(self, otm: OTM):
+        # GIVEN an OTM
+        # WHEN the OTM is encoded in compact mode
+        encoded = get_otm_as_json(otm, indent=None)
+
+        # THEN the result has no whitespaces between tokens
+        assert encoded == json.dumps(otm.json(), separators=(',', ':'))
+
+    def test_write_otm_json(self):
+        # GIVEN an OTM and an output file
+        otm = build_otm()
+        file = io.StringIO()
+
+        # WHEN write_otm_json is invoked
+        write_otm_json(otm, file)
+
+        # THEN the file has the pretty printed OTM
+        assert file.getvalue() == json.dumps(otm.json(), indent=2)
+
+    def test_otm_json_chunks(self):
+        # GIVEN an OTM
+        otm = build_otm()
+
+        # WHEN the OTM is encoded in small chunks
+        chunks = list(iter_otm_json_chunks(otm, chunk_size=100))
+
+        # THEN every chunk but the last one has at least the chunk size
+        assert len(chunks) > 1
+        assert all(len(chunk) >= 100 for chunk in chunks[:-1])
+
+        # AND the chunks compose the whole OTM
+        assert ''.join(chunks) == json.dumps(otm.json(), indent=2)
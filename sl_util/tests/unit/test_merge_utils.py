@@ -0,0 +1,80 @@
+import copy
+
+from deepmerge import always_merger
+from pytest import mark, param
+
+from sl_util.sl_util.merge_utils import DocumentMerger, merge_documents
+
+HCL2_DOCUMENTS = [
+    {'resource': [{'aws_vpc': {'vpc': {'cidr_block': '10.0.0.0/16'}}}], 'variable': [{'region': {}}]},
+    {'resource': [{'aws_subnet': {'subnet': {'vpc_id': 'aws_vpc.vpc.id'}}}], 'locals': [{'name': 'app'}]},
+    {'resource': [{'aws_instance': {'instance': {}}}], 'variable': [{'size': {}}, {'count': {}}]}
+]
+
+CFT_DOCUMENTS = [
+    {'AWSTemplateFormatVersion': '2010-09-09', 'Resources': {'VPC': {'Type': 'AWS::EC2::VPC'}}},
+    {'Resources': {'Subnet': {'Type': 'AWS::EC2::Subnet'}}, 'Parameters': {'Name': {'Type': 'String'}}},
+    {'AWSTemplateFormatVersion': '2010-09-10', 'Resources': {'VPC': {'Properties': {'CidrBlock': '10.0.0.0/16'}}}}
+]
+
+MAPPING_DOCUMENTS = [
+    {'trustzones': [{'id': 'tz', 'name': 'Public'}], 'components': [{'type': 'vpc'}], 'dataflows': []},
+    {'components': [{'type': 'subnet'}], 'lookup': {'a': 'b'}, 'tags': {'x'}},
+    {'trustzones': None, 'lookup': {'c': 'd'}, 'tags': {'y'}}
+]
+
+
+def merge_with_always_merger(documents: list):
+    merged = None
+    for document in copy.deepcopy(documents):
+        merged = always_merger.merge(merged, document)
+    return merged
+
+
+class TestDocumentMerger:
+
+    @mark.parametrize('documents', [
+        param(HCL2_DOCUMENTS, id='hcl2'),
+        param(CFT_DOCUMENTS, id='cft'),
+        param(MAPPING_DOCUMENTS, id='mapping'),
+        param([{'a': [1]}, {'a': {'b': 2}}, {'a': [3]}, {'a': 'c'}], id='type conflicts')
+    ])
+    def test_same_result_as_always_merger(self, documents: list):
+        # GIVEN some documents loaded from several files
+        merger = DocumentMerger()
+
+        # WHEN they are merged
+        merged = None
+        for document in copy.deepcopy(documents):
+            merged = merger.merge(merged, document)
+
+        # THEN the merged document is the same as the one merged by the always_merger
+        assert merged == merge_with_always_merger(documents)
+
+    def test_merged_lists_are_not_modified(self):
+        # GIVEN some documents with lists
+        documents = copy.deepcopy(HCL2_DOCUMENTS)
+        first_resources = documents[0]['resource']
+
+        # WHEN they are merged
+        merger = DocumentMerger()
+        merged = {}
+        for document in documents:
+            merged = merger.merge(merged, document)
+
+        # THEN the lists of the documents keep their elements
+        assert first_resources == HCL2_DOCUMENTS[0]['resource']
+        assert documents[1]['resource'] == HCL2_DOCUMENTS[1]['resource']
+
+        # AND the merged list contains the elements of all the lists in order
+        assert [list(resource)[0] for resource in merged['resource']] == ['aws_vpc', 'aws_subnet', 'aws_instance']
+
+    def test_merge_documents(self):
+        # GIVEN a document
+        base = {'resource': [{'aws_vpc': {}}]}
+
+        # WHEN other document is merged into it
+        merge_documents(base, {'resource': [{'aws_subnet': {}}], 'variable': []})
+
+        # THEN the document is updated in place
+        assert base == {'resource': [{'aws_vpc': {}}, {'aws_subnet': {}}], 'variable': []}
@@ -0,0 +1,179 @@
+import os
+from unittest.mock import MagicMock
+
+from pytest import raises
+
+from sl_util.sl_util.parse_cache import ParseCache, DirectoryParseCacheStorage, get_parse_cache_key, \
+    build_parse_cache_storage, PARSE_CACHE_DIR_ENV_VAR
+
+SOURCE = b'resource "aws_vpc" "vpc" {}'
+TREE = {'resource': [{'aws_vpc': {'vpc': {}}}]}
+
+
+class TestParseCache:
+
+    def test_parsed_tree_cached_by_content(self):
+        # GIVEN a parse cache
+        cache = ParseCache()
+        parse = MagicMock(return_value=TREE)
+
+        # WHEN the same source is parsed twice
+        first = cache.get('hcl2', SOURCE, parse)
+        second = cache.get('hcl2', bytes(SOURCE), parse)
+
+        # THEN the source is parsed once
+        assert parse.call_count == 1
+        assert cache.stats()['hits'] == 1
+        assert cache.stats()['misses'] == 1
+
+        # AND the trees are equal
+        assert first == second == TREE
+
+    def test_cached_trees_are_not_modified(self):
+        # GIVEN a cached tree
+        cache = ParseCache()
+        tree = cache.get('hcl2', SOURCE, lambda: {'resource': [{'aws_vpc': {'vpc': {}}}]})
+
+        # WHEN the returned tree is modified
+        tree['resource'][0]['resource_type'] = 'aws_vpc'
+
+        # THEN the cached tree keeps the parsed data
+        assert cache.lookup('hcl2', SOURCE) == TREE
+
+    def test_parsers_do_not_share_trees(self):
+        # GIVEN a source parsed with a parser
+        cache = ParseCache()
+        cache.store('hcl2', SOURCE, TREE)
+
+        # WHEN it is looked up for other parser
+        # THEN it is not found
+        assert cache.lookup('cft', SOURCE) is None
+        assert get_parse_cache_key('hcl2', SOURCE) != get_parse_cache_key('cft', SOURCE)
+
+    def test_parse_errors_are_not_cached(self):
+        # GIVEN a parse cache
+        cache = ParseCache()
+
+        # WHEN the parser fails
+        with raises(ValueError):
+            cache.get('hcl2', SOURCE, MagicMock(side_effect=ValueError()))
+
+        # THEN nothing is cached
+        assert cache.stats()['size'] == 0
+
+    def test_least_recently_used_evicted(self):
+        # GIVEN a parse cache limited by the number of trees and their size
+        cache = ParseCache(maxsize=2, max_bytes=1024)
+        cache.store('hcl2', b'first', 'first')
+        cache.store('hcl2', b'second', 'second')
+
+        # WHEN the first tree is used again and a third one is added
+        cache.lookup('hcl2', b'first')
+        cache.store('hcl2', b'third', 'third')
+
+        # THEN the least recently used tree is evicted
+        assert cache.lookup('hcl2', b'second') is None
+        assert cache.lookup('hcl2', b'first') == 'first'
+
+        # AND the trees bigger than the limit are never stored
+        cache.store('hcl2', b'big', 'x' * 2048)
+        assert cache.lookup('hcl2', b'big') is None
+        assert cache.stats()['bytes'] <= 1024
+
+    def test_disabled_cache(self):
+        # GIVEN a disabled parse cache
+        cache = ParseCache(maxsize=0)
+        parse = MagicMock(return_value=TREE)
+
+        # WHEN the same source is parsed twice
+        cache.get('hcl2', SOURCE, parse)
+        cache.get('hcl2', SOURCE, parse)
+
+        # THEN it is parsed every time
+        assert parse.call_count == 2
+
+
+class TestDirectoryParseCacheStorage:
+
+    def test_trees_shared_through_directory(self, tmp_path):
+        # GIVEN a tree parsed by a cache with a directory storage
+        ParseCache(storage=DirectoryParseCacheStorage(str(tmp_path))).store('hcl2', SOURCE, TREE)
+
+        # WHEN other cache with the same directory looks up the source
+        cache = ParseCache(storage=DirectoryParseCacheStorage(str(tmp_path)))
+        tree = cache.lookup('hcl2', SOURCE)
+
+        # THEN the tree is read from the directory
+        assert tree == TREE
+        assert cache.stats()['storage_hits'] == 1
+
+    def test_trees_stored_as_json(self, tmp_path):
+        # GIVEN a tree parsed by a cache with a directory storage
+        ParseCache(storage=DirectoryParseCacheStorage(str(tmp_path))).store('hcl2', SOURCE, TREE)
+
+        # WHEN the files of the directory are listed
+        # THEN the tree is stored as JSON
+        assert [file.name for file in tmp_path.iterdir()] == [get_parse_cache_key('hcl2', SOURCE) + '.json']
+
+    def test_trees_not_representable_as_json_not_stored(self, tmp_path):
+        # GIVEN a directory storage
+        storage = DirectoryParseCacheStorage(str(tmp_path))
+
+        # WHEN trees that are not read back the same from JSON are stored
+        storage.put('tuple', {'a': (1, 2)})
+        storage.put('keys', {1: 'a'})
+        storage.put('object', {'a': object()})
+
+        # THEN they are not stored
+        assert list(tmp_path.iterdir()) == []
+
+    def test_corrupted_files_are_misses(self, tmp_path):
+        # GIVEN a corrupted file in the cache directory
+        storage = DirectoryParseCacheStorage(str(tmp_path))
+        (tmp_path / (get_parse_cache_key('hcl2', SOURCE) + '.json')).write_bytes(b'corrupted')
+
+        # WHEN the source is looked up
+        cache = ParseCache(storage=storage)
+
+        # THEN it is not found
+        assert cache.lookup('hcl2', SOURCE) is None
+        assert cache.stats()['misses'] == 1
+
+    def test_least_recently_used_files_removed(self, tmp_path):
+        # GIVEN a cache directory with room for two files
+        storage = DirectoryParseCacheStorage(str(tmp_path), max_bytes=20)
+        storage.put('first', '0' * 8)
+        storage.put('second', '1' * 8)
+        os.utime(tmp_path / 'first.json', (0, 0))
+
+        # WHEN a third file is stored
+        storage.put('third', '2' * 8)
+
+        # THEN the least recently used file is removed
+        assert storage.get('first') is None
+        assert storage.get('second') == '1' * 8
+        assert storage.get('third') == '2' * 8
+
+    def test_directory_writable_by_other_users_not_used(self, tmp_path, monkeypatch):
+        # GIVEN a cache directory writable by other users
+        directory = tmp_path / 'cache'
+        directory.mkdir()
+        directory.chmod(0o777)
+
+        # WHEN a storage is created for it
+        # THEN it is refused
+        with raises(ValueError):
+            DirectoryParseCacheStorage(str(directory))
+
+        # AND the parse cache is built without storage
+        monkeypatch.setenv(PARSE_CACHE_DIR_ENV_VAR, str(directory))
+        assert build_parse_cache_storage() is None
+
+    def test_directory_of_other_user_not_used(self, tmp_path, monkeypatch):
+        # GIVEN a cache directory that belongs to other user
+        monkeypatch.setattr(os, 'getuid', lambda: os.stat(tmp_path).st_uid + 1)
+
+        # WHEN a storage is created for it
+        # THEN it is refused
+        with raises(ValueError):
+            DirectoryParseCacheStorage(str(tmp_path))
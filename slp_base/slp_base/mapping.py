@@ -4,6 +4,7 @@ import logging
 import yaml
 
 from slp_base.slp_base.errors import MappingFileNotValidError
+from slp_base.slp_base.mapping_cache import mapping_cache, get_mappings_key
 from slp_base.slp_base.schema import Schema
 
 logger = logging.getLogger(__name__)
@@ -107,5 +108,6 @@ def read_mapping_file(mapping_file: bytes):
 def validate_mapping_file(schema: Schema, mapping_file: bytes):
     validate_size(mapping_file)
     validate_type(mapping_file)
-    validate_schema(schema, mapping_file)
+    mapping_cache.get(get_mappings_key(f'schema:{schema.schema_path}', [mapping_file]),
+                      lambda: validate_schema(schema, mapping_file) or True)
     logger.info('Mapping files are valid')
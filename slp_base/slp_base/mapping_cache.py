@@ -0,0 +1,81 @@
+"""
+Process-wide cache of compiled mappings. The clients usually send the same mapping files with every request, so the
+result of validating, parsing, merging and pre-processing them is kept in a size-bounded LRU cache keyed by the
+SHA-256 of the mapping files contents.
+"""
+import copy
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable, Union, Any, Iterable, Tuple
+
+logger = logging.getLogger(__name__)
+
+MAPPING_CACHE_SIZE_ENV_VAR = 'STARTLEFT_MAPPING_CACHE_SIZE'
+DEFAULT_MAPPING_CACHE_SIZE = 64
+
+
+def get_mapping_digest(mapping_file: Union[bytes, str]) -> str:
+    if mapping_file is None:
+        return ''
+
+    return hashlib.sha256(mapping_file if isinstance(mapping_file, bytes) else mapping_file.encode()).hexdigest()
+
+
+def get_mappings_key(kind: str, mapping_files: Iterable[Union[bytes, str]]) -> Tuple:
+    return (kind,) + tuple(get_mapping_digest(mapping_file) for mapping_file in mapping_files)
+
+
+class MappingCache:
+    """
+    LRU cache of compiled mappings. The values are deep copied when they are returned, so the callers can modify them
+    without affecting the cached ones
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAPPING_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.__entries = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def get(self, key: Hashable, compile_mapping: Callable[[], Any]) -> Any:
+        """
+        :param key: the key of the compiled mapping, usually built with get_mappings_key
+        :param compile_mapping: the function that compiles the mapping when it is not cached. If it raises an error,
+        nothing is cached
+        :return: a copy of the compiled mapping
+        """
+        with self.__lock:
+            if key in self.__entries:
+                self.__entries.move_to_end(key)
+                self.hits += 1
+                logger.debug(f'Compiled mapping found in cache ({self.hits} hits, {self.misses} misses)')
+                return copy.deepcopy(self.__entries[key])
+            self.misses += 1
+
+        compiled_mapping = compile_mapping()
+
+        if self.maxsize > 0:
+            with self.__lock:
+                self.__entries[key] = compiled_mapping
+                self.__entries.move_to_end(key)
+                while len(self.__entries) > self.maxsize:
+                    self.__entries.popitem(last=False)
+
+        return copy.deepcopy(compiled_mapping)
+
+    def clear(self):
+        with self.__lock:
+            self.__entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        with self.__lock:
+            return {'hits': self.hits, 'misses': self.misses, 'size': len(self.__entries), 'maxsize': self.maxsize}
+
+
+mapping_cache = MappingCache(int(os.getenv(MAPPING_CACHE_SIZE_ENV_VAR, DEFAULT_MAPPING_CACHE_SIZE)))
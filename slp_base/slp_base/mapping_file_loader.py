@@ -1,10 +1,11 @@
 import logging
 
 import yaml
-from deepmerge import always_merger
 
+from sl_util.sl_util.merge_utils import DocumentMerger
 from slp_base import LoadingMappingFileError
 from slp_base.slp_base.mapping import validate_size, MappingLoader
+from slp_base.slp_base.mapping_cache import mapping_cache, get_mappings_key
 
 logger = logging.getLogger(__name__)
 
@@ -23,15 +24,7 @@ class MappingFileLoader(MappingLoader):
         validate_size(self.mapping_files[0])
 
         try:
-            for mapping_file_data in self.mapping_files:
-                if not mapping_file_data:
-                    continue
-                logger.info('Loading mapping data')
-
-                data = mapping_file_data if isinstance(mapping_file_data, str) else mapping_file_data.decode()
-                self.__load(yaml.load(data, Loader=yaml.BaseLoader))
-
-                logger.debug('Mapping files loaded successfully')
+            self.map = mapping_cache.get(get_mappings_key('merged', self.mapping_files), self.__merge_mapping_files)
         except Exception as e:
             raise LoadingMappingFileError('Error loading the mapping file. The mapping files are not valid.',
                                           e.__class__.__name__, str(e))
@@ -40,5 +33,17 @@ class MappingFileLoader(MappingLoader):
     def get_mappings(self):
         return self.map
 
-    def __load(self, mapping):
-        always_merger.merge(self.map, mapping)
+    def __merge_mapping_files(self) -> dict:
+        merged_mapping = {}
+        merger = DocumentMerger()
+        for mapping_file_data in self.mapping_files:
+            if not mapping_file_data:
+                continue
+            logger.info('Loading mapping data')
+
+            data = mapping_file_data if isinstance(mapping_file_data, str) else mapping_file_data.decode()
+            merger.merge(merged_mapping, yaml.load(data, Loader=yaml.BaseLoader))
+
+            logger.debug('Mapping files loaded successfully')
+
+        return merged_mapping
@@ -42,7 +42,7 @@ class OTMProcessor(metaclass=abc.ABCMeta):
 
         OTMRepresentationsPruner(otm).prune()
         OTMTrustZoneUnifier(otm).unify()
-        OTMValidator().validate(otm.json())
+        OTMValidator().validate(otm)
 
         return otm
 
@@ -1,11 +1,86 @@
 import logging
+from typing import Union, Iterable, Tuple
 
+from otm.otm.entity.otm import OTM
 from otm.otm.entity.parent_type import ParentType
 from slp_base.slp_base.errors import OTMResultError
 from slp_base.slp_base.schema import Schema
 
 logger = logging.getLogger(__name__)
 
+TRUSTZONES_SCHEMA = '#/properties/trustZones/items'
+COMPONENTS_SCHEMA = '#/properties/components/items'
+DATAFLOWS_SCHEMA = '#/properties/dataflows/items'
+THREATS_SCHEMA = '#/properties/threats/items'
+MITIGATIONS_SCHEMA = '#/properties/mitigations/items'
+
+
+class OTMIdsInconsistencies:
+    """
+    All the identifiers inconsistencies found in an OTM, grouped by category
+    """
+
+    def __init__(self):
+        self.repeated_ids = set()
+        self.wrong_component_parent_ids = set()
+        self.wrong_dataflow_source_ids = set()
+        self.wrong_dataflow_destination_ids = set()
+
+    @property
+    def consistent(self) -> bool:
+        return not (self.repeated_ids or
+                    self.wrong_component_parent_ids or
+                    self.wrong_dataflow_source_ids or
+                    self.wrong_dataflow_destination_ids)
+
+    def json(self) -> dict:
+        return {
+            'repeatedIds': sorted(self.repeated_ids, key=str),
+            'wrongComponentParentIds': sorted(self.wrong_component_parent_ids, key=str),
+            'wrongDataflowSourceIds': sorted(self.wrong_dataflow_source_ids, key=str),
+            'wrongDataflowDestinationIds': sorted(self.wrong_dataflow_destination_ids, key=str)
+        }
+
+
+def find_ids_inconsistencies(trustzones_ids: Iterable,
+                             components: Iterable[Tuple],
+                             dataflows: Iterable[Tuple]) -> OTMIdsInconsistencies:
+    """
+    Builds the identifiers index of the OTM in a single pass and checks every reference against it
+    :param trustzones_ids: the ids of the trustzones
+    :param components: the (id, parent id) tuples of the components
+    :param dataflows: the (id, source id, destination id) tuples of the dataflows
+    """
+    inconsistencies = OTMIdsInconsistencies()
+    all_valid_ids = set()
+    parent_ids = set()
+
+    def index_id(element_id):
+        if element_id in all_valid_ids:
+            inconsistencies.repeated_ids.add(element_id)
+        else:
+            all_valid_ids.add(element_id)
+
+    for trustzone_id in trustzones_ids:
+        index_id(trustzone_id)
+
+    for component_id, parent_id in components:
+        index_id(component_id)
+        parent_ids.add(parent_id)
+
+    inconsistencies.wrong_component_parent_ids.update(parent_ids - all_valid_ids)
+
+    for dataflow_id, source_id, destination_id in dataflows:
+        index_id(dataflow_id)
+
+        if source_id not in all_valid_ids:
+            inconsistencies.wrong_dataflow_source_ids.add(source_id)
+
+        if destination_id not in all_valid_ids:
+            inconsistencies.wrong_dataflow_destination_ids.add(destination_id)
+
+    return inconsistencies
+
 
 class OTMValidator:
     schema_filename = 'otm_schema.json'
@@ -13,14 +88,33 @@ class OTMValidator:
     def __init__(self):
         self.schema: Schema = Schema.from_package('otm', self.schema_filename)
 
-    def validate(self, otm):
+    def validate(self, otm: Union[OTM, dict]):
+        """
+        Validates the schema and the IDs consistency of an OTM, given either as the OTM entity or as its JSON dict
+        """
         self.__validate_otm_schema(otm)
         self.__check_otm_files(otm)
         logger.info('OTM file validated successfully')
 
-    def __validate_otm_schema(self, otm: {}):
+    def check_ids(self, otm: Union[OTM, dict]) -> OTMIdsInconsistencies:
+        if isinstance(otm, OTM):
+            return find_ids_inconsistencies(
+                (trustzone.id for trustzone in otm.trustzones),
+                ((component.id, component.parent) for component in otm.components),
+                ((dataflow.id, dataflow.source_node, dataflow.destination_node) for dataflow in otm.dataflows))
+
+        return find_ids_inconsistencies(
+            (trustzone['id'] for trustzone in otm['trustZones']),
+            ((component['id'], self.__get_parent_id(component)) for component in otm['components']),
+            ((dataflow['id'], dataflow['source'], dataflow['destination']) for dataflow in otm['dataflows']))
+
+    def __validate_otm_schema(self, otm: Union[OTM, dict]):
         logger.debug('Validating OTM file schema')
-        self.schema.validate(otm)
+        if isinstance(otm, OTM):
+            self.__validate_otm_entity_schema(otm)
+        else:
+            self.schema.validate(otm)
+
         if self.schema.valid:
             logger.info('OTM file schema is valid')
         if not self.schema.valid:
@@ -29,70 +123,47 @@ class OTMValidator:
             raise OTMResultError('OTM file does not comply with the schema', 'Schema error',
                                  str(self.schema.errors))
 
-    def __check_otm_files(self, otm):
+    def __validate_otm_entity_schema(self, otm: OTM):
+        """
+        Validates every element of the OTM against its own subschema, so the whole OTM JSON is never built
+        """
+        self.schema.validate(otm.json_header())
+
+        for elements, subschema in ((otm.trustzones, TRUSTZONES_SCHEMA),
+                                    (otm.components, COMPONENTS_SCHEMA),
+                                    (otm.dataflows, DATAFLOWS_SCHEMA),
+                                    (otm.threats, THREATS_SCHEMA),
+                                    (otm.mitigations, MITIGATIONS_SCHEMA)):
+            for element in elements:
+                if not self.schema.valid:
+                    return
+                self.schema.validate(element.json(), subschema)
+
+    def __check_otm_files(self, otm: Union[OTM, dict]):
         logger.debug('Checking IDs consistency on OTM file')
-        if self.__check_otm_ids(otm):
+        inconsistencies = self.check_ids(otm)
+        if inconsistencies.consistent:
             logger.info('OTM file has consistent IDs')
         else:
+            self.__log_inconsistencies(inconsistencies)
             msg = 'OTM file has inconsistent IDs'
             logger.error(msg)
             raise OTMResultError('Schema error', 'Parsing provided files result in an invalid OTM file', msg)
 
-    def __check_otm_ids(self, otm):
-        all_valid_ids = set()
-        repeated_ids = set()
-        parent_ids = set()
-        wrong_component_parent_ids = set()
-        wrong_dataflow_from_ids = set()
-        wrong_dataflow_to_ids = set()
-
-        for trustzone in otm['trustZones']:
-            if trustzone['id'] in all_valid_ids:
-                repeated_ids.add(trustzone['id'])
-            elif trustzone['id'] not in all_valid_ids:
-                all_valid_ids.add(trustzone['id'])
-
-        for component in otm['components']:
-            if component['id'] in all_valid_ids:
-                repeated_ids.add(component['id'])
-            elif component['id'] not in all_valid_ids:
-                all_valid_ids.add(component['id'])
-
-            component_parent_id = self.__get_parent_id(component)
-            parent_ids.add(component_parent_id)
-
-        for parent_id in parent_ids:
-            if parent_id not in all_valid_ids:
-                wrong_component_parent_ids.add(parent_id)
-
-        for dataflow in otm['dataflows']:
-            if dataflow['id'] in all_valid_ids:
-                repeated_ids.add(dataflow['id'])
-            elif dataflow['id'] not in all_valid_ids:
-                all_valid_ids.add(dataflow['id'])
-
-            if dataflow['source'] not in all_valid_ids:
-                wrong_dataflow_from_ids.add(dataflow['source'])
-
-            if dataflow['destination'] not in all_valid_ids:
-                wrong_dataflow_to_ids.add(dataflow['destination'])
-
-        if wrong_component_parent_ids:
-            logger.error(f"Component parent identifiers inconsistent: {wrong_component_parent_ids}")
-
-        if wrong_dataflow_from_ids:
-            logger.error(f"Dataflow 'source' identifiers inconsistent: {wrong_dataflow_from_ids}")
-
-        if wrong_dataflow_to_ids:
-            logger.error(f"Dataflow 'destination' identifiers inconsistent: {wrong_dataflow_to_ids}")
-
-        if repeated_ids:
-            logger.error(f"Repeated identifiers inconsistent: {repeated_ids}")
-
-        return (not wrong_component_parent_ids and
-                not wrong_dataflow_from_ids and
-                not wrong_dataflow_to_ids and
-                not repeated_ids)
+    @staticmethod
+    def __log_inconsistencies(inconsistencies: OTMIdsInconsistencies):
+        if inconsistencies.wrong_component_parent_ids:
+            logger.error(f"Component parent identifiers inconsistent: {inconsistencies.wrong_component_parent_ids}")
+
+        if inconsistencies.wrong_dataflow_source_ids:
+            logger.error(f"Dataflow 'source' identifiers inconsistent: {inconsistencies.wrong_dataflow_source_ids}")
+
+        if inconsistencies.wrong_dataflow_destination_ids:
+            logger.error(f"Dataflow 'destination' identifiers inconsistent: "
+                         f"{inconsistencies.wrong_dataflow_destination_ids}")
+
+        if inconsistencies.repeated_ids:
+            logger.error(f"Repeated identifiers inconsistent: {inconsistencies.repeated_ids}")
 
     @staticmethod
     def __get_parent_id(trustzone: dict):
@@ -1,41 +1,92 @@
 import json
 import logging
 import os
+from functools import lru_cache
 
 import jsonschema
 import pkg_resources
 import yaml
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
 
 logger = logging.getLogger(__name__)
 
 
+def load_schema_file(schema_path: str) -> dict:
+    logger.info(f"Loading schema file '{schema_path}'")
+    with open(schema_path, "r") as f:
+        return yaml.load(f, Loader=yaml.BaseLoader)
+
+
+class CompiledSchema:
+    """
+    Schema document along with its checked and instantiated validator. It is immutable, so the same instance is
+    shared by all the Schema objects of the process created for the same file
+    """
+
+    def __init__(self, schema_path: str):
+        self.schema_file = load_schema_file(schema_path)
+        self.schema_error = None
+
+        validator_class = validator_for(self.schema_file)
+        try:
+            validator_class.check_schema(self.schema_file)
+        except jsonschema.SchemaError as e:
+            self.schema_error = e
+
+        self.validator = validator_class(self.schema_file)
+        self.subschema_validators = {}
+
+    def get_error(self, document, subschema: str = None):
+        if self.schema_error:
+            return self.schema_error
+
+        return best_match(self.__get_validator(subschema).iter_errors(document))
+
+    def __get_validator(self, subschema: str = None):
+        """
+        :param subschema: JSON pointer reference to a subschema, as '#/properties/components/items'
+        """
+        if not subschema:
+            return self.validator
+
+        if subschema not in self.subschema_validators:
+            self.subschema_validators[subschema] = self.validator.evolve(schema={'$ref': subschema})
+
+        return self.subschema_validators[subschema]
+
+
+@lru_cache(maxsize=None)
+def get_compiled_schema(schema_path: str) -> CompiledSchema:
+    compiled_schema = CompiledSchema(schema_path)
+    logger.debug(f"Schema file '{schema_path}' compiled successfully")
+    return compiled_schema
+
+
+@lru_cache(maxsize=None)
+def get_package_schema_path(package: str, filename: str) -> str:
+    return pkg_resources.resource_filename(package, os.path.join('resources/schemas', filename))
+
+
 class Schema:
     def __init__(self, schema_path: str):
-        self.schema_file = self.__load_schema(schema_path)
-        logger.debug("Schema file loaded successfully")
+        self.schema_path = schema_path
+        self.compiled_schema = get_compiled_schema(schema_path)
+        self.schema_file = self.compiled_schema.schema_file
         self.errors = ""
         self.valid = None
 
-    def validate(self, document):
-        try:
-            jsonschema.validate(document, self.schema_file)
-            self.valid = True
-        except jsonschema.SchemaError as e:
-            self.errors = e.message
-            self.valid = False
-        except jsonschema.ValidationError as e:
-            self.errors = e.message
+    def validate(self, document, subschema: str = None):
+        error = self.compiled_schema.get_error(document, subschema)
+        if error:
+            self.errors = error.message
             self.valid = False
+        else:
+            self.valid = True
 
     def json(self):
         return json.dumps(self.schema_file, indent=2)
 
-    def __load_schema(self, schema_path):
-        logger.info(f"Loading schema file '{schema_path}'")
-        with open(schema_path, "r") as f:
-            return yaml.load(f, Loader=yaml.BaseLoader)
-
     @staticmethod
     def from_package(package: str, filename: str):
-        schema_path = pkg_resources.resource_filename(package, os.path.join('resources/schemas', filename))
-        return Schema(schema_path)
+        return Schema(get_package_schema_path(package, filename))
@@ -0,0 +1,107 @@
+from unittest.mock import MagicMock
+
+from pytest import raises, fixture
+
+from slp_base import MappingFileValidator, LoadingMappingFileError
+from slp_base.slp_base.mapping_cache import MappingCache, mapping_cache, get_mappings_key
+from slp_base.slp_base.mapping_file_loader import MappingFileLoader
+from slp_base.slp_base.schema import Schema
+from slp_base.tests.resources import test_resource_paths
+
+SAMPLE_MAPPING_FILE = test_resource_paths.mtmt_mapping_file
+ETM_MAPPING_SCHEMA = test_resource_paths.etm_mapping_schema
+
+
+def read_mapping_file(mapping_file: str) -> bytes:
+    with open(mapping_file, 'rb') as file:
+        return file.read()
+
+
+class TestMappingCache:
+
+    @fixture(autouse=True)
+    def clear_mapping_cache(self):
+        mapping_cache.clear()
+
+    def test_compiled_mapping_cached_by_content(self):
+        # GIVEN a mapping cache
+        cache = MappingCache()
+        compile_mapping = MagicMock(return_value={'components': []})
+
+        # WHEN the same content is requested twice
+        first = cache.get(get_mappings_key('merged', [b'mapping']), compile_mapping)
+        second = cache.get(get_mappings_key('merged', [b'mapping']), compile_mapping)
+
+        # THEN the mapping is compiled once
+        assert compile_mapping.call_count == 1
+        assert cache.stats() == {'hits': 1, 'misses': 1, 'size': 1, 'maxsize': 64}
+
+        # AND every caller receives its own copy
+        assert first == second
+        first['components'].append('component')
+        assert cache.get(get_mappings_key('merged', [b'mapping']), compile_mapping) == {'components': []}
+
+    def test_least_recently_used_evicted(self):
+        # GIVEN a mapping cache with room for two mappings
+        cache = MappingCache(maxsize=2)
+        cache.get('first', lambda: 1)
+        cache.get('second', lambda: 2)
+
+        # WHEN the first mapping is used again and a third one is added
+        cache.get('first', lambda: 1)
+        cache.get('third', lambda: 3)
+
+        # THEN the least recently used mapping is evicted
+        compile_mapping = MagicMock(return_value=2)
+        cache.get('second', compile_mapping)
+        assert compile_mapping.call_count == 1
+        assert cache.stats()['size'] == 2
+
+    def test_errors_not_cached(self):
+        # GIVEN a mapping cache and a mapping that fails to compile
+        cache = MappingCache()
+
+        # WHEN the mapping is requested
+        with raises(ValueError):
+            cache.get('invalid', MagicMock(side_effect=ValueError()))
+
+        # THEN nothing is cached
+        assert cache.stats()['size'] == 0
+
+    def test_mapping_file_loader_uses_cache(self):
+        # GIVEN a mapping file
+        mapping_file_data = read_mapping_file(SAMPLE_MAPPING_FILE)
+
+        # WHEN it is loaded twice
+        first = MappingFileLoader([mapping_file_data]).load()
+        second = MappingFileLoader([mapping_file_data]).load()
+
+        # THEN the second load is served from the cache
+        assert mapping_cache.stats()['hits'] == 1
+        assert first == second
+        assert first is not second
+
+    def test_invalid_mapping_file_not_cached(self):
+        # GIVEN an invalid YAML mapping file
+        mapping_file_data = b'trustzones: ['
+
+        # WHEN it is loaded
+        # THEN the error is raised every time
+        for _ in range(2):
+            with raises(LoadingMappingFileError):
+                MappingFileLoader([mapping_file_data]).load()
+
+        assert mapping_cache.stats()['size'] == 0
+
+    def test_mapping_file_validation_uses_cache(self, mocker):
+        # GIVEN a mapping file and its schema
+        mapping_file_data = read_mapping_file(SAMPLE_MAPPING_FILE)
+        schema = Schema(ETM_MAPPING_SCHEMA)
+        validate_spy = mocker.spy(schema, 'validate')
+
+        # WHEN it is validated twice
+        MappingFileValidator(schema, mapping_file_data).validate()
+        MappingFileValidator(schema, mapping_file_data).validate()
+
+        # THEN it is validated against the schema only once
+        assert validate_spy.call_count == 1
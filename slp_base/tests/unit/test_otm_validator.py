@@ -0,0 +1,84 @@
+from pytest import raises, mark, param
+
+from otm.otm.entity.otm import OTM
+from otm.otm.entity.parent_type import ParentType
+from otm.otm.entity.representation import RepresentationType
+from otm.otm.provider import Provider
+from slp_base.slp_base.errors import OTMResultError
+from slp_base.slp_base.otm_validator import OTMValidator
+
+
+class DummyProvider(str, Provider):
+    DUMMY = ("DUMMY", "Dummy", RepresentationType.DIAGRAM)
+
+
+def build_otm() -> OTM:
+    otm = OTM('project-name', 'project-id', DummyProvider.DUMMY)
+    otm.add_trustzone(id='tz', name='Trustzone', type='tz-type')
+    otm.add_component(id='c1', name='Component 1', type='c-type', parent='tz', parent_type=ParentType.TRUST_ZONE)
+    otm.add_component(id='c2', name='Component 2', type='c-type', parent='c1', parent_type=ParentType.COMPONENT)
+    otm.add_dataflow(id='df', name='Dataflow', source_node='c1', destination_node='c2')
+    return otm
+
+
+class TestOTMValidator:
+
+    @mark.parametrize('as_json', [param(False, id='entity'), param(True, id='json')])
+    def test_valid_otm(self, as_json: bool):
+        # GIVEN a valid OTM
+        otm = build_otm()
+
+        # WHEN OTMValidator::validate is invoked
+        # THEN no error is raised
+        OTMValidator().validate(otm.json() if as_json else otm)
+
+    @mark.parametrize('as_json', [param(False, id='entity'), param(True, id='json')])
+    def test_all_ids_inconsistencies_reported(self, as_json: bool):
+        # GIVEN an OTM with every kind of inconsistent id
+        otm = build_otm()
+        otm.add_component(id='tz', name='Repeated', type='c-type', parent='missing-parent',
+                          parent_type=ParentType.COMPONENT)
+        otm.add_dataflow(id='df-wrong', name='Wrong dataflow', source_node='missing-source',
+                         destination_node='missing-destination')
+
+        # WHEN OTMValidator::check_ids is invoked
+        inconsistencies = OTMValidator().check_ids(otm.json() if as_json else otm)
+
+        # THEN all the inconsistencies are returned at once
+        assert not inconsistencies.consistent
+        assert inconsistencies.json() == {
+            'repeatedIds': ['tz'],
+            'wrongComponentParentIds': ['missing-parent'],
+            'wrongDataflowSourceIds': ['missing-source'],
+            'wrongDataflowDestinationIds': ['missing-destination']
+        }
+
+        # AND the validation fails
+        with raises(OTMResultError) as error:
+            OTMValidator().validate(otm)
+
+        assert error.value.message == 'OTM file has inconsistent IDs'
+
+    def test_entity_schema_error(self):
+        # GIVEN an OTM with a component whose id is not a string
+        otm = build_otm()
+        otm.components[1].id = 2
+
+        # WHEN OTMValidator::validate is invoked
+        # THEN the schema error is raised
+        with raises(OTMResultError) as error:
+            OTMValidator().validate(otm)
+
+        assert error.value.detail == 'Schema error'
+        assert error.value.message == "2 is not of type 'string'"
+
+    def test_entity_validation_does_not_build_otm_json(self, mocker):
+        # GIVEN a valid OTM
+        otm = build_otm()
+        json_spy = mocker.spy(otm, 'json')
+
+        # WHEN OTMValidator::validate is invoked with the OTM entity
+        OTMValidator().validate(otm)
+
+        # THEN the whole OTM JSON is not built
+        assert json_spy.call_count == 0
@@ -1,9 +1,10 @@
 from unittest import TestCase
+from unittest.mock import patch
 
 import yaml
 
 from slp_base.slp_base.otm_validator import OTMValidator
-from slp_base.slp_base.schema import Schema
+from slp_base.slp_base.schema import Schema, get_compiled_schema, load_schema_file
 from slp_base.tests.resources import test_resource_paths
 
 SAMPLE_MAPPING_FILE = test_resource_paths.cft_mapping_no_dataflows
@@ -47,4 +48,27 @@ class TestSchema(TestCase):
         # then the OTM file is not valid
         assert not schema.valid
 
+    def test_compiled_schema_shared_by_package_schemas(self):
+        # Given two schemas created from the same package file
+        first_schema = Schema.from_package('otm', OTM_SCHEMA_FILENAME)
+        second_schema = Schema.from_package('otm', OTM_SCHEMA_FILENAME)
 
+        # then the compiled schema is loaded once and shared
+        assert first_schema.compiled_schema is second_schema.compiled_schema
+
+        # and the validation results are not shared
+        first_schema.validate({})
+        assert not first_schema.valid
+        assert second_schema.valid is None
+
+    def test_schema_file_loaded_once(self):
+        # Given the compiled schemas registry is empty
+        get_compiled_schema.cache_clear()
+
+        # when creating several schemas for the same file
+        with patch('slp_base.slp_base.schema.load_schema_file', wraps=load_schema_file) as load_mock:
+            for _ in range(3):
+                Schema(CFT_MAPPING_SCHEMA).validate({})
+
+        # then the schema file is only read once
+        assert load_mock.call_count == 1
@@ -1,15 +1,20 @@
 import logging
 
-from deepmerge import always_merger
+import yaml
 
 from yaml import BaseLoader, ScalarNode
 
 from sl_util.sl_util.json_utils import yaml_reader
+from sl_util.sl_util.merge_utils import DocumentMerger
+from sl_util.sl_util.parse_cache import parse_cache
 from slp_base.slp_base.errors import LoadingIacFileError
 from slp_base.slp_base.provider_loader import ProviderLoader
 
 logger = logging.getLogger(__name__)
 
+# Name of the parser in the parse cache keys, which changes with the PyYAML version
+CFT_PARSER = f'cft-yaml-{yaml.__version__}'
+
 
 def get_loader():
     loader = BaseLoader
@@ -35,6 +40,7 @@ class CloudformationLoader(ProviderLoader):
         self.sources = sources
         self.yaml_reader = yaml_reader
         self.cloudformation = None
+        self.merger = DocumentMerger()
 
     def load(self):
         self.__load_source_files()
@@ -53,13 +59,16 @@ class CloudformationLoader(ProviderLoader):
             raise_empty_sources_error()
 
     def __merge_cft_data(self, cft_data):
-        self.cloudformation = always_merger.merge(self.cloudformation, cft_data)
+        self.cloudformation = self.merger.merge(self.cloudformation, cft_data)
 
     def __load_cft_data(self, source) -> dict:
         try:
             logger.debug(f"Loading iac data and reading as string")
 
-            cft_data = self.yaml_reader(source, loader=get_loader())
+            if self.yaml_reader is yaml_reader:
+                cft_data = parse_cache.get(CFT_PARSER, source, lambda: self.yaml_reader(source, loader=get_loader()))
+            else:
+                cft_data = self.yaml_reader(source, loader=get_loader())
 
             logger.debug("Source data loaded successfully")
 
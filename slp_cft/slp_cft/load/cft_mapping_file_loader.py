@@ -1,5 +1,6 @@
 import logging
 
+from sl_util.sl_util.jmespath_utils import precompile_mapping_expressions
 from slp_base.slp_base.mapping_file_loader import MappingFileLoader
 
 logger = logging.getLogger(__name__)
@@ -9,3 +10,8 @@ class CloudformationMappingFileLoader(MappingFileLoader):
 
     def __init__(self, mapping_files: [bytes]):
         super(CloudformationMappingFileLoader, self).__init__(mapping_files)
+
+    def load(self) -> {}:
+        super().load()
+        precompile_mapping_expressions(self.map)
+        return self.map
@@ -2,7 +2,9 @@ import json
 import re
 
 import jmespath
-from deepmerge import always_merger
+
+from sl_util.sl_util.jmespath_utils import search as jmespath_search
+from sl_util.sl_util.merge_utils import merge_documents
 
 
 class CloudformationCustomFunctions(jmespath.functions.Functions):
@@ -74,13 +76,13 @@ class CloudformationSourceModel:
         self.jmespath_options = jmespath.Options(custom_functions=CloudformationCustomFunctions())
 
     def load(self, data):
-        always_merger.merge(self.data, data)
+        merge_documents(self.data, data)
 
     def json(self):
         return json.dumps(self.data, indent=2)
 
     def query(self, query):
-        return jmespath.search(query, self.data, options=self.jmespath_options)
+        return jmespath_search(query, self.data, options=self.jmespath_options)
 
     def search(self, obj, source=None):
         if isinstance(obj, str):
@@ -118,7 +120,7 @@ class CloudformationSourceModel:
                 return self.search(obj["$singleton"], source)
 
             if "$root" in obj:
-                return jmespath.search(obj["$root"], self.data, options=self.jmespath_options)
+                return jmespath_search(obj["$root"], self.data, options=self.jmespath_options)
 
             if "$path" in obj:
                 if "$searchParams" in obj["$path"]:
@@ -138,9 +140,9 @@ class CloudformationSourceModel:
             if "$search" in obj:
                 results = []
                 search_type = obj["$search"]["$type"]
-                ref_value = jmespath.search(obj["$search"]["$ref"], source, options=self.jmespath_options)
+                ref_value = jmespath_search(obj["$search"]["$ref"], source, options=self.jmespath_options)
                 for refobj in self.otm.objects_by_type(search_type):
-                    search_values = jmespath.search(obj["$search"]["$path"], refobj.source,
+                    search_values = jmespath_search(obj["$search"]["$path"], refobj.source,
                                                     options=self.jmespath_options)
                     if isinstance(search_values, list):
                         if ref_value in search_values:
@@ -196,10 +198,10 @@ class CloudformationSourceModel:
 
     def __jmespath_search(self, search_path, source):
         try:
-            source_objects = jmespath.search(search_path, source, options=self.jmespath_options)
+            source_objects = jmespath_search(search_path, source, options=self.jmespath_options)
             if 'Ref' in source_objects:
                 ref = source_objects['Ref']
-                return jmespath.search("Parameters." + ref + ".Default || '" + ref + "'", self.data,
+                return jmespath_search("Parameters." + ref + ".Default || '" + ref + "'", self.data,
                                         options=self.jmespath_options)
             else:
                 return source_objects
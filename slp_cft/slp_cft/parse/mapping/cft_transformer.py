@@ -111,8 +111,11 @@ class CloudformationTransformer:
         return self.__get_singleton(components.singleton, components.skip, results_without_singleton)
 
     def __add_components_to_otm(self, components):
+        trustzone_ids = {trustzone["id"] for trustzone in self.iac_mapping["trustzones"]}
+        component_ids = {component["id"] for component in components}
+
         for component in components:
-            parent_type = self.__get_parent_type(component, components)
+            parent_type = self.__get_parent_type(component, trustzone_ids, component_ids)
             if not parent_type:
                 continue
 
@@ -122,79 +125,83 @@ class CloudformationTransformer:
             logger.debug(f"Added component: [{component['name']}][{component['id']}]"
                          f"{component['tags']}" if 'tags' in component else "")
 
-    def __get_parent_type(self, component, components):
-        if component['parent'] in [trustzone["id"] for trustzone in self.iac_mapping["trustzones"]]:
+    def __get_parent_type(self, component, trustzone_ids, component_ids):
+        if component['parent'] in trustzone_ids:
             return 'trustZone'
 
-        parent_component = next(filter(lambda x: x["id"] == component['parent'], components), None)
-        if parent_component:
+        if component['parent'] in component_ids:
             return 'component'
 
     def __get_components(self, components, skip):
+        skip_ids = {skip_component["id"] for skip_component in skip}
         results = []
         for component in components:
-            skip_this = False
-            for skip_component in skip:
-                if component["id"] == skip_component["id"]:
-                    logger.debug("Skipping component '{}'".format(component["id"]))
-                    skip_this = True
-                    break
-            if not skip_this:
-                results.append(component)
+            if component["id"] in skip_ids:
+                logger.debug("Skipping component '{}'".format(component["id"]))
+                continue
+            results.append(component)
         return results
 
     def __get_catchall(self, catchall, skip):
+        skip_ids = {skip_component["id"] for skip_component in skip}
         results = []
+        result_ids = set()
         for component in catchall:
             skip_this = False
-            for skip_component in skip:
-                if component["id"] == skip_component["id"]:
-                    logger.debug("Skipping catchall component '{}'".format(component["id"]))
-                    skip_this = True
-                    break
-            for current_component in results:
-                if component["id"] == current_component["id"]:
-                    logger.debug("Catchall component already added '{}'".format(component["id"]))
-                    skip_this = True
-                    break
+            if component["id"] in skip_ids:
+                logger.debug("Skipping catchall component '{}'".format(component["id"]))
+                skip_this = True
+            if component["id"] in result_ids:
+                logger.debug("Catchall component already added '{}'".format(component["id"]))
+                skip_this = True
             if not skip_this:
                 results.append(component)
+                result_ids.add(component["id"])
         return results
 
     def __get_singleton(self, singleton, skip, results):
-        singleton_types_added = []
+        skip_ids = {skip_component["id"] for skip_component in skip}
+        results_by_type = {}
+        for result in results:
+            results_by_type.setdefault(result["type"], []).append(result)
+
+        # tags of the grouped components, to avoid looking for every new tag in their list of tags
+        tags_by_result = {}
+        singleton_types_added = set()
         for component in singleton:
-            skip_this = False
-            for skip_component in skip:
-                if component["id"] == skip_component["id"]:
-                    logger.debug("Skipping singleton component '{}'".format(component["id"]))
-                    skip_this = True
-                    break
-            if not skip_this:
-                if component["type"] not in singleton_types_added:
-                    results.append(component)
-                    singleton_types_added.append(component["type"])
-                else:
-                    # if the component is singleton and it already exists in otm (from a previous mapping)
-                    # no new component is generated but the existing component is updated
-                    # a)with the group name (even more if had a component name)
-                    # b)with a new tag with data from this source component
-                    for result in results:
-                        if result["type"] == component["type"]:
-                            if "singleton_multiple_name" in component:
-                                result["name"] = component["singleton_multiple_name"]
-                                self.id_map[component["name"]] = result["id"]
-
-                            # update "result" component with its multiple tags before adding tags from "component"
-                            if "singleton_multiple_tags" in result:
-                                if len(result["tags"]) <= len(result["singleton_multiple_tags"]) \
-                                        and result["tags"] is not result["singleton_multiple_tags"]:
-                                    result["tags"] = result["singleton_multiple_tags"]
-
-                            if "singleton_multiple_tags" in component:
-                                for tag in component["singleton_multiple_tags"]:
-                                    if tag not in result["tags"]:
-                                        result["tags"].append(tag)
+            if component["id"] in skip_ids:
+                logger.debug("Skipping singleton component '{}'".format(component["id"]))
+                continue
+
+            if component["type"] not in singleton_types_added:
+                results.append(component)
+                results_by_type.setdefault(component["type"], []).append(component)
+                singleton_types_added.add(component["type"])
+            else:
+                # if the component is singleton and it already exists in otm (from a previous mapping)
+                # no new component is generated but the existing component is updated
+                # a)with the group name (even more if had a component name)
+                # b)with a new tag with data from this source component
+                for result in results_by_type[component["type"]]:
+                    if "singleton_multiple_name" in component:
+                        result["name"] = component["singleton_multiple_name"]
+                        self.id_map[component["name"]] = result["id"]
+
+                    # update "result" component with its multiple tags before adding tags from "component"
+                    if "singleton_multiple_tags" in result:
+                        if len(result["tags"]) <= len(result["singleton_multiple_tags"]) \
+                                and result["tags"] is not result["singleton_multiple_tags"]:
+                            result["tags"] = result["singleton_multiple_tags"]
+                            tags_by_result.pop(id(result), None)
+
+                    if "singleton_multiple_tags" in component:
+                        if id(result) not in tags_by_result:
+                            tags_by_result[id(result)] = set(result["tags"])
+                        result_tags = tags_by_result[id(result)]
+                        for tag in component["singleton_multiple_tags"]:
+                            if tag not in result_tags:
+                                result["tags"].append(tag)
+                                result_tags.add(tag)
         return results
 
     def transform_dataflows(self):
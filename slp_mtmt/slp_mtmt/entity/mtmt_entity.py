@@ -3,27 +3,56 @@ is_trustzone_stencil_list = ['BorderBoundary', 'LineBoundary']
 is_dataflow_stencil_list = ['Connector']
 
 
+def as_list(value) -> list:
+    """
+    The xml elements repeated only once are converted into a single value instead of a list
+    """
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
+
+
+def get_value(source: dict) -> dict:
+    value = source.get('Value') if isinstance(source, dict) else None
+    return value if isinstance(value, dict) else {}
+
+
+def get_int_value(value: dict, key: str):
+    try:
+        return int(value.get(key))
+    except (TypeError, ValueError):
+        return None
+
+
+def get_property_elements(source: dict) -> list:
+    properties = get_value(source).get('Properties')
+    elements = as_list(properties.get('anyType')) if isinstance(properties, dict) else []
+    return [element for element in elements if isinstance(element, dict)]
+
+
+def get_name(property_elements: list):
+    name = None
+    for element in property_elements:
+        if element.get('DisplayName', '') == 'Name':
+            value = element.get('Value', {})
+            name = value.get('text') if isinstance(value, dict) else None
+    return name
+
+
 class MTMEntity:
+    """
+    Base of the entities of the drawing surfaces of a Microsoft Threat Model. Their data is read from the source dict
+    once, when they are created
+    """
+    __slots__ = ('source', 'id', 'type', 'stencil_name', 'name')
 
     def __init__(self, source: dict):
         self.source = source
+        fields = source if isinstance(source, dict) else {}
+        self.id = fields.get('Key')
+        attrib = fields.get('attrib', {})
+        self.type = attrib.get('type') if isinstance(attrib, dict) else None
 
-    @property
-    def id(self):
-        return self.source.get('Key')
-
-    @property
-    def type(self):
-        return self.source.get('attrib', {}).get('type')
-
-    @property
-    def stencil_name(self):
-        return self.source.get('Value', {}).get('Properties', {}).get('anyType')[0].get('DisplayName', {})
-
-    @property
-    def name(self):
-        name = None
-        for borderType in self.source.get('Value', {}).get('Properties', {}).get('anyType'):
-            if borderType.get('DisplayName', '') == 'Name':
-                name = borderType.get('Value', {}).get('text')
-        return name
+        property_elements = get_property_elements(source)
+        self.stencil_name = property_elements[0].get('DisplayName', {}) if property_elements else None
+        self.name = get_name(property_elements)
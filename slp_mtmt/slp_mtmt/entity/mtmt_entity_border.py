@@ -1,50 +1,35 @@
-from slp_mtmt.slp_mtmt.entity.mtmt_entity import MTMEntity, is_component_stencil_list, is_trustzone_stencil_list
+from slp_mtmt.slp_mtmt.entity.mtmt_entity import MTMEntity, is_component_stencil_list, is_trustzone_stencil_list, \
+    get_value, get_int_value, get_property_elements
+
+
+def get_border_properties(source: dict) -> dict:
+    properties = {}
+    for element in get_property_elements(source):
+        key = element.get('DisplayName')
+        element_value = element.get('Value', {})
+        values = list(element_value.values()) if isinstance(element_value, dict) else []
+        index = element.get('SelectedIndex', None)
+        if key and len(values) > 0:
+            value = values[0]
+            properties[key] = value[int(index)] if index else value
+    return properties
 
 
 class MTMBorder(MTMEntity):
+    __slots__ = ('generic_type_id', 'left', 'top', 'width', 'height', 'properties', 'is_component', 'is_trustzone')
 
     def __init__(self, source: dict):
         super().__init__(source)
+        value = get_value(source)
 
-    @property
-    def generic_type_id(self):
-        return self.source.get('Value', {}).get('GenericTypeId')
-
-    @property
-    def height(self):
-        return self.__extract_int_value('Height')
-
-    @property
-    def width(self):
-        return self.__extract_int_value('Width')
-
-    @property
-    def left(self):
-        return self.__extract_int_value('Left')
-
-    @property
-    def top(self):
-        return self.__extract_int_value('Top')
-
-    @property
-    def properties(self):
-        properties = {}
-        for element in self.source.get('Value', {}).get('Properties', {}).get('anyType'):
-            key = element.get('DisplayName')
-            values = element.get('Value', {}).values()
-            index = element.get('SelectedIndex', None)
-            if key and len(values) > 0:
-                value = list(values)[0]
-                properties[key] = value[int(index)] if index else value
-        return properties
-
-    @property
-    def is_component(self) -> bool:
-        return self.type in is_component_stencil_list
-
-    @property
-    def is_trustzone(self) -> bool:
-        return self.type in is_trustzone_stencil_list
+        self.generic_type_id = value.get('GenericTypeId')
+        self.left = get_int_value(value, 'Left')
+        self.top = get_int_value(value, 'Top')
+        self.width = get_int_value(value, 'Width')
+        self.height = get_int_value(value, 'Height')
+        self.properties = get_border_properties(source)
+        self.is_component = self.type in is_component_stencil_list
+        self.is_trustzone = self.type in is_trustzone_stencil_list
 
     def __str__(self) -> str:
         return '{id: ' + str(self.id) + ', ' \
@@ -54,12 +39,3 @@ class MTMBorder(MTMEntity):
                + 'is_component: ' + str(self.is_component) + ', ' \
                + 'is_trustzone: ' + str(self.is_trustzone) + ', ' \
                + 'properties: ' + str(self.properties) + '}'
-
-    def __extract_value(self, key):
-        return self.source.get('Value').get(key)
-
-    def __extract_int_value(self, key):
-        try:
-            return int(self.__extract_value(key))
-        except TypeError:
-            return
@@ -1,83 +1,47 @@
-from slp_mtmt.slp_mtmt.entity.mtmt_entity import MTMEntity, is_dataflow_stencil_list, is_trustzone_stencil_list
+from slp_mtmt.slp_mtmt.entity.mtmt_entity import MTMEntity, is_dataflow_stencil_list, is_trustzone_stencil_list, \
+    get_value, get_int_value, get_property_elements
+
+
+def get_line_properties(source: dict) -> dict:
+    properties = {}
+    for _property in get_property_elements(source):
+        key = _property.get('DisplayName')
+        values = _property.get('Value')
+        if key:
+            if isinstance(values, dict) and len(values) > 0:
+                index = _property.get('SelectedIndex')
+                value = list(values.values())[0]
+                properties[key] = value[int(index)] if index and type(value) is list else value
+            else:
+                properties[key] = {}
+    return properties
 
 
 class MTMLine(MTMEntity):
+    __slots__ = ('source_guid', 'target_guid', 'handle_x', 'handle_y', 'source_x', 'source_y', 'target_x', 'target_y',
+                 'properties', 'description', 'is_trustzone', 'is_dataflow')
 
     def __init__(self, source: dict):
         super().__init__(source)
-
-    @property
-    def description(self):
-        return self.__get_first_property()
-
-    @property
-    def is_trustzone(self) -> bool:
-        return self.type in is_trustzone_stencil_list
-
-    @property
-    def is_dataflow(self) -> bool:
-        return self.type in is_dataflow_stencil_list
-
-    @property
-    def source_guid(self):
-        return self.__extract_value('SourceGuid')
-
-    @property
-    def target_guid(self):
-        return self.__extract_value('TargetGuid')
-
-    @property
-    def handle_x(self):
-        return self.__extract_int_value('HandleX')
-
-    @property
-    def handle_y(self):
-        return self.__extract_int_value('HandleY')
-
-    @property
-    def source_x(self):
-        return self.__extract_int_value('SourceX')
-
-    @property
-    def source_y(self):
-        return self.__extract_int_value('SourceY')
-
-    @property
-    def target_x(self):
-        return self.__extract_int_value('TargetX')
-
-    @property
-    def target_y(self):
-        return self.__extract_int_value('TargetY')
+        value = get_value(source)
+
+        self.source_guid = value.get('SourceGuid')
+        self.target_guid = value.get('TargetGuid')
+        self.handle_x = get_int_value(value, 'HandleX')
+        self.handle_y = get_int_value(value, 'HandleY')
+        self.source_x = get_int_value(value, 'SourceX')
+        self.source_y = get_int_value(value, 'SourceY')
+        self.target_x = get_int_value(value, 'TargetX')
+        self.target_y = get_int_value(value, 'TargetY')
+        self.properties = get_line_properties(source)
+        self.description = next(iter(self.properties), None)
+        self.is_trustzone = self.type in is_trustzone_stencil_list
+        self.is_dataflow = self.type in is_dataflow_stencil_list
 
     @property
     def coordinates(self):
         return self.handle_x, self.handle_y, self.source_x, self.source_y, self.target_x, self.target_y
 
-    def __extract_value(self, key):
-        return self.source.get('Value').get(key)
-
-    def __extract_int_value(self, key):
-        return int(self.__extract_value(key))
-
-    @property
-    def properties(self):
-        properties = {}
-        for _property in self.source.get('Value', {}).get('Properties', {}).get('anyType'):
-            key = _property.get('DisplayName')
-            values = _property.get('Value')
-            if key:
-                if len(values) > 0:
-                    index = _property.get('SelectedIndex')
-                    value = list(values.values())[0]
-                    properties[key] = value[int(index)] if index and type(value) is list else value
-                else:
-                    properties[key] = {}
-        return properties
-
-    def __get_first_property(self):
-        return list(self.properties.keys())[0]
-
     def __str__(self) -> str:
         return '{id: ' + str(self.id) + ', ' \
                + 'name: ' + str(self.name) + ', ' \
@@ -1,72 +1,36 @@
+from slp_mtmt.slp_mtmt.entity.mtmt_entity import as_list
+
+
 class MTMThreat:
+    __slots__ = ('id', 'dataflow_id', 'source_component_id', 'destination_component_id', 'threat_priority',
+                 'threat_state', 'justification', 'title', 'threat_category', 'short_description', 'long_description',
+                 'possible_mitigations', 'steps', 'mitigation_effort', 'from_azure_template')
+
     def __init__(self, source: dict):
-        self.__thread_instance = source.get('Value')
+        thread_instance = source.get('Value')
 
-        self.__properties = {}
-        for element in self.__thread_instance.get('Properties').get('KeyValueOfstringstring'):
+        properties = {}
+        for element in as_list(thread_instance.get('Properties').get('KeyValueOfstringstring')):
             key = element.get('Key')
             value = element.get('Value')
-            self.__properties[key] = value
-
-    @property
-    def dataflow_id(self):
-        return self.__thread_instance.get('FlowGuid') or None
-
-    @property
-    def source_component_id(self):
-        return self.__thread_instance.get('SourceGuid') or None
-
-    @property
-    def destination_component_id(self):
-        return self.__thread_instance.get('TargetGuid') or None
-
-    @property
-    def id(self):
-        return self.__thread_instance.get('Id') or None
-
-    @property
-    def threat_priority(self):
-        return self.__thread_instance.get('Priority') or None
-
-    @property
-    def threat_state(self):
-        return self.__thread_instance.get('State') or None
-
-    @property
-    def justification(self):
-        return self.__thread_instance.get('StateInformation') or None
-
-    @property
-    def title(self):
-        return self.__properties.get('Title') or None
-
-    @property
-    def threat_category(self):
-        return self.__properties.get('UserThreatCategory') or None
-
-    @property
-    def short_description(self):
-        return self.__properties.get('UserThreatShortDescription') or None
-
-    @property
-    def long_description(self):
-        return self.__properties.get('UserThreatDescription') or None
-
-    @property
-    def possible_mitigations(self):
-        return self.__properties.get('PossibleMitigations') or None
-
-    @property
-    def steps(self):
-        return self.__properties.get('Steps') or None
-
-    @property
-    def mitigation_effort(self):
-        return self.__properties.get('Effort') or None
-
-    @property
-    def from_azure_template(self):
-        return 'PossibleMitigations' in self.__properties
+            properties[key] = value
+
+        self.id = thread_instance.get('Id') or None
+        self.dataflow_id = thread_instance.get('FlowGuid') or None
+        self.source_component_id = thread_instance.get('SourceGuid') or None
+        self.destination_component_id = thread_instance.get('TargetGuid') or None
+        self.threat_priority = thread_instance.get('Priority') or None
+        self.threat_state = thread_instance.get('State') or None
+        self.justification = thread_instance.get('StateInformation') or None
+
+        self.title = properties.get('Title') or None
+        self.threat_category = properties.get('UserThreatCategory') or None
+        self.short_description = properties.get('UserThreatShortDescription') or None
+        self.long_description = properties.get('UserThreatDescription') or None
+        self.possible_mitigations = properties.get('PossibleMitigations') or None
+        self.steps = properties.get('Steps') or None
+        self.mitigation_effort = properties.get('Effort') or None
+        self.from_azure_template = 'PossibleMitigations' in properties
 
     def __str__(self) -> str:
         return '{' \
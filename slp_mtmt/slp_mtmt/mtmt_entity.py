@@ -4,6 +4,8 @@ from slp_mtmt.slp_mtmt.entity.mtmt_entity_threatinstance import MTMThreat
 
 
 class MTMKnowledge:
+    __slots__ = ()
+
     def __init__(self, source: dict):
         pass
 
@@ -12,6 +14,7 @@ class MTMT:
     """
     This entity represents a Microsoft Threat Model
     """
+    __slots__ = ('borders', 'lines', 'threats', 'know_base')
 
     def __init__(self, borders: [MTMBorder], lines: [MTMLine], threats: [MTMThreat], know_base: MTMKnowledge):
         self.borders = borders
@@ -1,14 +1,18 @@
-import collections
 import logging
 
+from sl_util.sl_util.parse_cache import parse_cache
 from slp_base import LoadingSourceFileError
 from slp_base.slp_base.provider_loader import ProviderLoader
 from slp_mtmt.slp_mtmt.entity.mtmt_entity_threatinstance import MTMThreat
 from slp_mtmt.slp_mtmt.mtmt_entity import MTMT, MTMBorder, MTMLine, MTMKnowledge
-from slp_mtmt.slp_mtmt.tm7_to_json import Tm7ToJson
+from slp_mtmt.slp_mtmt.tm7_to_json import Tm7Reader
 
 logger = logging.getLogger(__name__)
 
+# Name of the parser in the parse cache keys
+TM7_PARSER = 'tm7-stream'
+
+
 class MTMTLoader(ProviderLoader):
     """
     Builder for an MTM class from the xml data
@@ -24,8 +28,9 @@ class MTMTLoader(ProviderLoader):
             message = e.__str__()
             raise LoadingSourceFileError('Source file cannot be loaded', detail, message)
 
-    def __init__(self, source):
+    def __init__(self, source, read_knowledge_base: bool = False):
         self.source = source
+        self.read_knowledge_base = read_knowledge_base
         self.borders = []
         self.lines = []
         self.threats = []
@@ -33,25 +38,13 @@ class MTMTLoader(ProviderLoader):
         self.mtmt = None
 
     def __read(self):
-        json_ = Tm7ToJson(self.source).to_json()
-        model_ = json_['ThreatModel']
-        list_ = model_['DrawingSurfaceList']
-        surface_model_ = list_['DrawingSurfaceModel']
-        surface_model_array \
-            = surface_model_ if isinstance(surface_model_, collections.abc.Sequence) else [surface_model_]
-
-        for surface_model in surface_model_array:
-            if 'Borders' in surface_model and surface_model['Borders'] is not None:
-                for border in surface_model['Borders']['KeyValueOfguidanyType']:
-                    self.borders.append(MTMBorder(border))
-            if 'Lines' in surface_model and surface_model['Lines'] is not None:
-                for line in surface_model['Lines']['KeyValueOfguidanyType']:
-                    self.lines.append(MTMLine(line))
-
-        if 'ThreatInstances' in model_ and model_['ThreatInstances'] is not None:
-            for threat in model_['ThreatInstances']['KeyValueOfstringThreatpc_P0_PhOB']:
-                self.threats.append(MTMThreat(threat))
-        self.know_base = MTMKnowledge(model_['KnowledgeBase'])
+        parser = f'{TM7_PARSER}-knowledge-base' if self.read_knowledge_base else TM7_PARSER
+        tm7 = parse_cache.get(parser, self.source, lambda: Tm7Reader(self.source, self.read_knowledge_base).read())
+
+        self.borders = [MTMBorder(border) for border in tm7['borders']]
+        self.lines = [MTMLine(line) for line in tm7['lines']]
+        self.threats = [MTMThreat(threat) for threat in tm7['threats']]
+        self.know_base = MTMKnowledge(tm7['knowledge_base'][0] if tm7['knowledge_base'] else {})
 
     def get_mtmt(self) -> MTMT:
         return self.mtmt
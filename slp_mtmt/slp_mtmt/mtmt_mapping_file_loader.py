@@ -1,5 +1,5 @@
 from slp_base import MappingLoader, LoadingMappingFileError
-from deepmerge import always_merger
+from sl_util.sl_util.merge_utils import DocumentMerger
 import yaml
 import logging
 import jmespath
@@ -43,10 +43,11 @@ class MTMTMappingFileLoader(MappingLoader):
         return dict(zip([tz['label'] for tz in component_mappings_list], component_mappings_list))
 
     def __merge_mapping(self):
+        merger = DocumentMerger()
         for mapping_data in self.provided_mappings:
             logger.info('Loading mapping data')
             data = mapping_data if isinstance(mapping_data, str) else mapping_data.decode()
-            always_merger.merge(self.merged_mappings, yaml.load(data, Loader=yaml.BaseLoader))
+            merger.merge(self.merged_mappings, yaml.load(data, Loader=yaml.BaseLoader))
             logger.debug('Mapping files loaded successfully')
 
     def get_mtmt_mapping(self):
@@ -13,7 +13,7 @@ class MTMTComponentParser(MTMTGeneralParser):
 
     def __init__(self, source: MTMT, mapping: MTMTMapping, trustzone_parser: MTMTTrustzoneParser,
                  diagram_representation: str):
-        super().__init__(source, mapping, diagram_representation)
+        super().__init__(source, mapping, diagram_representation, trustzone_parser.parent_calculator)
         self.trustzone_parser = trustzone_parser
 
     def parse(self):
@@ -4,6 +4,7 @@ from slp_mtmt.slp_mtmt.mtmt_entity import MTMT
 from slp_mtmt.slp_mtmt.mtmt_mapping_file_loader import MTMTMapping
 from slp_mtmt.slp_mtmt.util.border_parent_calculator import BorderParentCalculator
 from slp_mtmt.slp_mtmt.util.line_parent_calculator import LineParentCalculator
+from slp_mtmt.slp_mtmt.util.mtmt_parent_calculator import MTMTParentCalculator
 
 
 def is_parent(parent, child):
@@ -38,14 +39,12 @@ def which_is_child(one, two):
 
 class MTMTGeneralParser:
 
-    def __init__(self, source: MTMT, mapping: MTMTMapping, diagram_representation: str):
+    def __init__(self, source: MTMT, mapping: MTMTMapping, diagram_representation: str,
+                 parent_calculator: MTMTParentCalculator = None):
         self.source = source
         self.mapping = mapping
         self.diagram_representation = diagram_representation
+        self.parent_calculator = parent_calculator or MTMTParentCalculator(source)
 
     def _get_parent(self, border: MTMBorder):
-        parents = []
-        for candidate in self.source.borders + self.source.lines:
-            if is_parent(candidate, border):
-                parents.append(candidate)
-        return get_the_child(parents)
+        return self.parent_calculator.get_parent(border)
@@ -1,5 +1,6 @@
 import re
 from enum import Enum
+from typing import Dict, Iterator, Optional, Tuple
 
 from otm.otm.entity.component import Component
 from otm.otm.entity.mitigation import Mitigation, MitigationInstance
@@ -7,14 +8,28 @@ from otm.otm.entity.threat import Threat, ThreatInstance
 from slp_mtmt.slp_mtmt.entity.mtmt_entity_threatinstance import MTMThreat
 from slp_mtmt.slp_mtmt.mtmt_entity import MTMT
 
+MITIGATION_PREFIX = 'Consider'
+THREAT_DESCRIPTION_END = re.compile(r'\.\s*' + MITIGATION_PREFIX)
+
 
 def get_threat_description(threat: MTMThreat):
-    return remove_trailing_dot(re.split("\\.\\s*Consider", threat.long_description)[0])
+    description = threat.long_description
+    end = THREAT_DESCRIPTION_END.search(description)
+    return remove_trailing_dot(description[:end.start()] if end else description)
 
 
 def get_mitigation_description(threat: MTMThreat):
-    description = re.match(".*(Consider.+\\.)", threat.long_description)
-    return remove_trailing_dot(description.group(1)) if description else None
+    """
+    The mitigation is the text of the first line of the description from its last "Consider" to its last dot, as long
+    as there is some text between them
+    """
+    first_line = threat.long_description.split('\n', 1)[0]
+    end = first_line.rfind('.')
+    if end <= len(MITIGATION_PREFIX):
+        return None
+
+    start = first_line.rfind(MITIGATION_PREFIX, 0, end - 1)
+    return remove_trailing_dot(first_line[start:end + 1]) if start >= 0 else None
 
 
 def get_first_sentence(message: str):
@@ -25,9 +40,16 @@ def remove_trailing_dot(message: str):
     return message.rstrip(".") if message else None
 
 
-def add_threat_to_component(threat: MTMThreat, threat_instance: ThreatInstance, components: [Component]):
-    component: Component = next(
-        (component for component in components if component.id == threat.destination_component_id), None)
+def index_components(components: [Component]) -> Dict[str, Component]:
+    components_by_id = {}
+    for component in components:
+        components_by_id.setdefault(component.id, component)
+    return components_by_id
+
+
+def add_threat_to_component(threat: MTMThreat, threat_instance: ThreatInstance,
+                            components_by_id: Dict[str, Component]):
+    component: Component = components_by_id.get(threat.destination_component_id)
 
     if component is not None:
         component.add_threat(threat_instance)
@@ -41,9 +63,22 @@ class MTMThreatParser:
         threats: [Threat] = []
         mitigations: [Mitigation] = []
 
+        for otm_threat, mitigation in self.iter_threats(components):
+            threats.append(otm_threat)
+            if mitigation:
+                mitigations.append(mitigation)
+
+        return threats, mitigations
+
+    def iter_threats(self, components: [Component]) -> Iterator[Tuple[Threat, Optional[Mitigation]]]:
+        """
+        Generates the OTM threat and mitigation of every MTMT threat, and adds the threat instances to the components
+        """
+        components_by_id = index_components(components)
+
         for threat in self.__source.threats:
             otm_threat = Threat(threat.id, threat.title, threat.threat_category, get_threat_description(threat))
-            threats.append(otm_threat)
+            mitigation = None
 
             threat_instance: ThreatInstance = ThreatInstance(threat.id, threat.threat_state)
 
@@ -54,12 +89,10 @@ class MTMThreatParser:
                 )
 
                 if threat.from_azure_template:
-                    mitigations.append(
-                        Mitigation(
-                            threat.id,
-                            get_first_sentence(threat.possible_mitigations),
-                            remove_trailing_dot(threat.steps) or remove_trailing_dot(threat.possible_mitigations)
-                        )
+                    mitigation = Mitigation(
+                        threat.id,
+                        get_first_sentence(threat.possible_mitigations),
+                        remove_trailing_dot(threat.steps) or remove_trailing_dot(threat.possible_mitigations)
                     )
 
                     threat_instance.add_mitigation(mitigation_instance)
@@ -67,19 +100,17 @@ class MTMThreatParser:
                     mitigation_description = get_mitigation_description(threat)
 
                     if mitigation_description:
-                        mitigations.append(
-                            Mitigation(
-                                threat.id,
-                                get_first_sentence(mitigation_description),
-                                remove_trailing_dot(mitigation_description)
-                            )
+                        mitigation = Mitigation(
+                            threat.id,
+                            get_first_sentence(mitigation_description),
+                            remove_trailing_dot(mitigation_description)
                         )
 
                         threat_instance.add_mitigation(mitigation_instance)
 
-                add_threat_to_component(threat, threat_instance, components)
+                add_threat_to_component(threat, threat_instance, components_by_id)
 
-        return threats, mitigations
+            yield otm_threat, mitigation
 
 
 class MitigationState(Enum):
@@ -1,7 +1,16 @@
+import io
 from collections import defaultdict
+from typing import Union
 
 from defusedxml import ElementTree as ET
 
+TM7_ROOT = 'ThreatModel'
+TM7_DRAWING_SURFACE_LIST_PATH = (TM7_ROOT, 'DrawingSurfaceList')
+TM7_BORDER_PATH = (*TM7_DRAWING_SURFACE_LIST_PATH, 'DrawingSurfaceModel', 'Borders', 'KeyValueOfguidanyType')
+TM7_LINE_PATH = (*TM7_DRAWING_SURFACE_LIST_PATH, 'DrawingSurfaceModel', 'Lines', 'KeyValueOfguidanyType')
+TM7_THREAT_PATH = (TM7_ROOT, 'ThreatInstances', 'KeyValueOfstringThreatpc_P0_PhOB')
+TM7_KNOWLEDGE_BASE_PATH = (TM7_ROOT, 'KnowledgeBase')
+
 
 def get_attrs(attrs):
     result = {}
@@ -54,3 +63,61 @@ class Tm7ToJson:
     def to_json(self):
         xml_data = ET.XML(self.xml)
         return xml2dict(xml_data)
+
+
+class Tm7Reader:
+    """
+    Streams the xml of a tm7 file and reads only the borders and lines of its drawing surfaces, its threat instances
+    and, if requested, its knowledge base. Every one of them is converted to a dict as Tm7ToJson does, and the rest of
+    the elements are discarded as soon as they are parsed, so the whole tree is never kept in memory
+    """
+
+    def __init__(self, xml: Union[str, bytes], read_knowledge_base: bool = False):
+        self.xml = xml
+        self.paths = {TM7_BORDER_PATH: 'borders', TM7_LINE_PATH: 'lines', TM7_THREAT_PATH: 'threats'}
+        if read_knowledge_base:
+            self.paths[TM7_KNOWLEDGE_BASE_PATH] = 'knowledge_base'
+
+    def read(self) -> dict:
+        """
+        :return: the lists of borders, lines, threats and knowledge bases of the tm7 file
+        """
+        result = {'borders': [], 'lines': [], 'threats': [], 'knowledge_base': []}
+        path = []
+        parents = []
+        read_depth = None
+        drawing_surface_list_found = False
+
+        for event, element in ET.iterparse(self.__open(), events=('start', 'end')):
+            if event == 'start':
+                path.append(get_tag(element))
+                parents.append(element)
+                if read_depth is None and tuple(path) in self.paths:
+                    read_depth = len(path)
+                if len(path) == 1 and path[0] != TM7_ROOT:
+                    raise ValueError(f'Unexpected root element {path[0]}, {TM7_ROOT} expected')
+                if tuple(path) == TM7_DRAWING_SURFACE_LIST_PATH:
+                    drawing_surface_list_found = True
+                continue
+
+            parents.pop()
+            if read_depth is not None and len(path) > read_depth:
+                # Kept until the whole read element is parsed
+                path.pop()
+                continue
+
+            if len(path) == read_depth:
+                result[self.paths[tuple(path)]].append(xml2dict(element)[get_tag(element)])
+                read_depth = None
+
+            path.pop()
+            if parents:
+                parents[-1].remove(element)
+
+        if not drawing_surface_list_found:
+            raise ValueError(f'{TM7_ROOT} without DrawingSurfaceList')
+
+        return result
+
+    def __open(self):
+        return io.BytesIO(self.xml) if isinstance(self.xml, bytes) else io.StringIO(self.xml)
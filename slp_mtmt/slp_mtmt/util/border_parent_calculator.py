@@ -15,45 +15,25 @@ class BorderParentCalculator:
             return False
 
     @staticmethod
-    def __get_shape_value(shape):
-        return shape.source[VALUE]
+    def get_limits(shape) -> tuple:
+        """
+        :return: the left, top, right and bottom limits of the shape
+        """
+        value = shape.source[VALUE]
+        left = int(value[LEFT])
+        top = int(value[TOP])
+        return left, top, left + int(value[WIDTH]), top + int(value[HEIGHT])
 
     @staticmethod
-    def __is_inside(parent, child):
-        parent_value = BorderParentCalculator.__get_shape_value(parent)
-        child_value = BorderParentCalculator.__get_shape_value(child)
-
-        parent_left = int(parent_value[LEFT])
-        child_left = int(child_value[LEFT])
-        if parent_left > child_left:
-            return False
-
-        parent_top: int = int(parent_value[TOP])
-        child_top = int(child_value[TOP])
-        if parent_top > child_top:
-            return False
-
-        parent_width = int(parent_value[WIDTH])
-        child_width = int(child_value[WIDTH])
-        parent_right = parent_left + parent_width
-        child_right = child_left + child_width
-        if parent_right < child_right:
-            return False
-
-        parent_height = int(parent_value[HEIGHT])
-        child_height = int(child_value[HEIGHT])
-        parent_bottom = parent_top + parent_height
-        child_bottom = child_top + child_height
-        if parent_bottom < child_bottom:
-            return False
-
-        if parent_bottom == child_bottom and \
-                parent_right == child_right and \
-                parent_top == child_top and \
-                parent_left == child_left:
-            return False
-
-        return True
-
+    def is_inside_limits(parent_limits: tuple, child_limits: tuple) -> bool:
+        parent_left, parent_top, parent_right, parent_bottom = parent_limits
+        child_left, child_top, child_right, child_bottom = child_limits
 
+        return parent_left <= child_left and parent_top <= child_top \
+            and parent_right >= child_right and parent_bottom >= child_bottom \
+            and parent_limits != child_limits
 
+    @staticmethod
+    def __is_inside(parent, child):
+        return BorderParentCalculator.is_inside_limits(
+            BorderParentCalculator.get_limits(parent), BorderParentCalculator.get_limits(child))
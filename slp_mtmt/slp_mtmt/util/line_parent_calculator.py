@@ -17,18 +17,25 @@ class LineParentCalculator:
             return False
 
     @staticmethod
-    def __is_inside(parent: MTMLine, child):
-
+    def get_center(child) -> Point:
         child_value = child.source[VALUE]
         child_center_x = int(child_value[LEFT]) + int(child_value[WIDTH]) / 2
         child_center_y = int(child_value[TOP]) + int(child_value[HEIGHT]) / 2
-        child_center = Point(child_center_x, child_center_y)
+        return Point(child_center_x, child_center_y)
 
+    @staticmethod
+    def get_triangle(parent: MTMLine) -> Polygon:
+        """
+        :return: the triangle between the line and the limits of the canvas, which contains the line's children
+        """
         triangle_a = parent.handle_x, parent.handle_y
         triangle_b = get_limit(parent.handle_x, parent.handle_y, parent.source_x, parent.source_y, limit_canvas['min'],
                                limit_canvas['max'])
         triangle_c = get_limit(parent.handle_x, parent.handle_y, parent.target_x, parent.target_y, limit_canvas['min'],
                                limit_canvas['max'])
-        triangle = Polygon([triangle_a, triangle_b, triangle_c])
+        return Polygon([triangle_a, triangle_b, triangle_c])
 
-        return triangle.contains(child_center)
+    @staticmethod
+    def __is_inside(parent: MTMLine, child):
+        child_center = LineParentCalculator.get_center(child)
+        return LineParentCalculator.get_triangle(parent).contains(child_center)
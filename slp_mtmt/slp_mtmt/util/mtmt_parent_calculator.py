@@ -0,0 +1,115 @@
+from typing import Dict, List, Optional
+
+from shapely.geometry import box, Point
+from shapely.prepared import PreparedGeometry, prep
+from shapely.strtree import STRtree
+
+from slp_mtmt.slp_mtmt.entity.mtmt_entity_border import MTMBorder
+from slp_mtmt.slp_mtmt.entity.mtmt_entity_line import MTMLine
+from slp_mtmt.slp_mtmt.mtmt_entity import MTMT
+from slp_mtmt.slp_mtmt.util.border_parent_calculator import BorderParentCalculator
+from slp_mtmt.slp_mtmt.util.line_parent_calculator import LineParentCalculator
+
+SHAPE_ERRORS = (ValueError, KeyError, TypeError)
+
+
+def get_limits(shape) -> Optional[tuple]:
+    try:
+        return BorderParentCalculator.get_limits(shape)
+    except SHAPE_ERRORS:
+        return None
+
+
+def get_bounding_box(limits: tuple):
+    left, top, right, bottom = limits
+    return box(min(left, right), min(top, bottom), max(left, right), max(top, bottom))
+
+
+class MTMTParentCalculator:
+    """
+    Calculates the parents of all the borders of a threat model at once, with the same result as checking every border
+    and line with is_parent and choosing the innermost one with get_the_child. The limits of every border and the
+    triangle of every trust zone line are calculated only once, and only the ones whose bounding box intersects a
+    border are checked as its parents
+    """
+
+    def __init__(self, source: MTMT):
+        self.candidates = source.borders + source.lines
+        self.__limits: Dict[int, tuple] = {}
+        self.__centers: Dict[int, Point] = {}
+        self.__triangles: Dict[int, PreparedGeometry] = {}
+
+        positions = []
+        bounding_boxes = []
+        for position, candidate in enumerate(self.candidates):
+            bounding_box = self.__index_candidate(position, candidate)
+            if bounding_box is not None:
+                positions.append(position)
+                bounding_boxes.append(bounding_box)
+
+        self.__tree_positions = positions
+        self.__tree = STRtree(bounding_boxes)
+        self.__parents = {id(border): self.__calculate_parent(border) for border in source.borders}
+
+    def __index_candidate(self, position: int, candidate):
+        if isinstance(candidate, MTMBorder):
+            limits = get_limits(candidate)
+            if limits is None:
+                return None
+            self.__limits[position] = limits
+            self.__centers[position] = LineParentCalculator.get_center(candidate)
+            return get_bounding_box(limits)
+
+        if isinstance(candidate, MTMLine):
+            try:
+                if not candidate.is_trustzone:
+                    return None
+                triangle = LineParentCalculator.get_triangle(candidate)
+            except SHAPE_ERRORS:
+                return None
+            self.__triangles[position] = prep(triangle)
+            return triangle
+
+        return None
+
+    def get_parent(self, border):
+        """
+        :return: the innermost border or trust zone line containing the border, or None if it has no parent
+        """
+        if id(border) not in self.__parents:
+            return self.__calculate_parent(border)
+        return self.__parents[id(border)]
+
+    def __calculate_parent(self, border):
+        limits = get_limits(border)
+        if limits is None:
+            return None
+
+        center = LineParentCalculator.get_center(border)
+        parents = [position for position in self.__query(limits)
+                   if self.__is_parent(position, limits, center)]
+        return self.__get_the_child(parents)
+
+    def __query(self, limits: tuple) -> List[int]:
+        return sorted(self.__tree_positions[index] for index in self.__tree.query(get_bounding_box(limits)))
+
+    def __is_parent(self, position: int, child_limits: tuple, child_center: Point) -> bool:
+        if position in self.__limits:
+            return BorderParentCalculator.is_inside_limits(self.__limits[position], child_limits)
+        return self.__triangles[position].contains(child_center)
+
+    def __is_candidate_parent(self, parent_position: int, child_position: int) -> bool:
+        if child_position not in self.__limits:
+            return False
+        return self.__is_parent(parent_position, self.__limits[child_position], self.__centers[child_position])
+
+    def __get_the_child(self, parents: List[int]):
+        if not parents:
+            return None
+
+        candidate = parents[0]
+        for parent in parents[1:]:
+            # The same as which_is_child, which keeps the candidate when it is the child or they are not nested
+            if self.__is_candidate_parent(candidate, parent):
+                candidate = parent
+        return self.candidates[candidate]
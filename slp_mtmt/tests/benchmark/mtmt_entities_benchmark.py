@@ -0,0 +1,107 @@
+"""
+Measures the time and memory needed to load and parse large MTMT models, generated by copying the borders and lines
+of a sample model, and the time needed to read the entities data as many times as the parsers and calculators do.
+
+Usage:
+    python -m slp_mtmt.tests.benchmark.mtmt_entities_benchmark [copies ...]
+"""
+import logging
+import sys
+import timeit
+import tracemalloc
+from xml.etree.ElementTree import tostring
+
+from defusedxml.ElementTree import fromstring
+
+from sl_util.sl_util.parse_cache import parse_cache
+from slp_mtmt.slp_mtmt.mtmt_loader import MTMTLoader
+from slp_mtmt.slp_mtmt.mtmt_mapping_file_loader import MTMTMappingFileLoader
+from slp_mtmt.slp_mtmt.mtmt_parser import MTMTParser
+from slp_mtmt.slp_mtmt.tm7_to_json import get_tag
+from slp_mtmt.tests.resources import test_resource_paths
+
+DEFAULT_COPIES = [10, 50, 100]
+SAMPLE_MODEL = test_resource_paths.example_position_tm7
+MAPPING = test_resource_paths.mtmt_default_mapping
+REPETITIONS = 3
+READS = 10
+
+
+def copy_element(element, suffix: str, offset: int):
+    key = next(child for child in element if get_tag(child) == 'Key').text
+    element_copy = fromstring(tostring(element))
+    for child in element_copy.iter():
+        if child.text == key:
+            child.text = key[:-len(suffix)] + suffix
+        elif get_tag(child) in ['Left', 'Top', 'HandleX', 'HandleY', 'SourceX', 'SourceY', 'TargetX', 'TargetY']:
+            child.text = str(int(child.text) + offset)
+    return element_copy
+
+
+def generate_tm7(copies: int) -> bytes:
+    """
+    Copies all the borders and lines of the sample model, with new ids and moved to the right and down
+    """
+    with open(SAMPLE_MODEL, 'rb') as f:
+        model = fromstring(f.read())
+
+    for elements in model.iter():
+        if get_tag(elements) in ['Borders', 'Lines']:
+            originals = list(elements)
+            for copy in range(1, copies):
+                for element in originals:
+                    elements.append(copy_element(element, f'{copy:08x}', copy % 10))
+
+    return tostring(model)
+
+
+def load(source: bytes):
+    parse_cache.clear()
+    loader = MTMTLoader(source)
+    loader.load()
+    return loader.get_mtmt()
+
+
+def read_entities(mtmt):
+    for border in mtmt.borders:
+        _ = border.left, border.top, border.width, border.height, border.is_component, border.is_trustzone, \
+            border.name, border.stencil_name, border.properties
+    for line in mtmt.lines:
+        _ = line.coordinates, line.is_trustzone, line.is_dataflow, line.source_guid, line.target_guid, line.properties
+
+
+def load_mapping():
+    with open(MAPPING) as f:
+        mapping_loader = MTMTMappingFileLoader([f.read()])
+    mapping_loader.load()
+    return mapping_loader.get_mtmt_mapping()
+
+
+def run_benchmark(copies_counts: [int]):
+    mapping = load_mapping()
+    print(f'{"copies":>8} {"shapes":>8} {"size (KB)":>10} {"load":>10} {"read x" + str(READS):>10} {"parse":>10} '
+          f'{"peak (MB)":>10}')
+
+    for copies in copies_counts:
+        source = generate_tm7(copies)
+        mtmt = load(source)
+
+        load_time = min(timeit.repeat(lambda: load(source), number=1, repeat=REPETITIONS))
+        read_time = min(timeit.repeat(lambda: read_entities(mtmt), number=READS, repeat=REPETITIONS))
+        parse_time = min(timeit.repeat(lambda: MTMTParser('id', 'name', load(source), mapping).build_otm(),
+                                       number=1, repeat=REPETITIONS))
+
+        tracemalloc.start()
+        MTMTParser('id', 'name', load(source), mapping).build_otm()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        print(f'{copies:>8} {len(mtmt.borders) + len(mtmt.lines):>8} {len(source) // 1024:>10} '
+              f'{load_time * 1000:>8.1f}ms {read_time * 1000:>8.1f}ms {parse_time * 1000:>8.1f}ms '
+              f'{peak / 1024 / 1024:>10.1f}')
+
+
+if __name__ == '__main__':
+    # The sample model has stencils not present in the mapping, which are logged for every copy
+    logging.disable(logging.WARNING)
+    run_benchmark([int(count) for count in sys.argv[1:]] or DEFAULT_COPIES)
@@ -117,3 +117,33 @@ class TestMTMTEntityBorder:
         assert border.id == '294a595a-174d-452c-b38d-9c434f7f5bac'
         assert not border.is_trustzone
         assert border.is_component
+
+    def test_data_read_once(self):
+        # GIVEN a MTMT border source
+        border_source = {
+            'Key': '294a595a-174d-452c-b38d-9c434f7f5bac',
+            'Value': {
+                'Properties': {'anyType': [{'DisplayName': 'MCU', 'Name': None, 'Value': {}},
+                                           {'DisplayName': 'Name', 'Name': None, 'Value': {'text': 'My_MCU'}}]},
+                'Height': '100', 'Left': '145', 'Top': '57', 'Width': None
+            },
+            'attrib': {'Id': 'i2', 'type': 'StencilRectangle'}
+        }
+
+        # WHEN we instantiate the MTMTBorder
+        border: MTMBorder = MTMBorder(border_source)
+
+        # AND its source changes
+        border_source['Value']['Left'] = '0'
+        border_source['Value']['Properties']['anyType'].clear()
+
+        # THEN the border keeps the data read when it was created
+        assert border.left == 145
+        assert border.name == 'My_MCU'
+        assert border.properties == {'Name': 'My_MCU'}
+
+        # AND the missing coordinates are None
+        assert border.width is None
+
+        # AND the border has no instance dict
+        assert not hasattr(border, '__dict__')
@@ -131,3 +131,21 @@ class TestMTMTLine:
         assert line.name == 'API Response'
         assert line.source_guid == '5d15323e-3729-4694-87b1-181c90af5045'
         assert line.target_guid == '6183b7fa-eba5-4bf8-a0af-c3e30d144a10'
+
+    def test_mtmt_line_single_property(self):
+        # GIVEN a line with only one property and without coordinates
+        source = {'Key': 'line', 'Value': {'Properties': {'anyType': {'DisplayName': 'Request', 'Value': {}}},
+                                           'HandleX': None},
+                  'attrib': {'type': 'Connector'}}
+
+        # WHEN we instantiate the MTMLine
+        line = MTMLine(source)
+
+        # THEN its property is read
+        assert line.properties == {'Request': {}}
+        assert line.description == 'Request'
+        assert line.stencil_name == 'Request'
+
+        # AND its coordinates are None
+        assert line.coordinates == (None, None, None, None, None, None)
+
@@ -308,6 +308,36 @@ class TestMTMThreatParser:
 
         assert description == expected_description
 
+    @pytest.mark.parametrize("long_description, expected_description", [
+        ("Threat. Consider first. Consider second.\nConsider third.", "Consider second"),
+        ("Threat. Consider", None),
+        ("Threat. Consider.", None),
+        ("Consider" * 10000, None),
+        ("Consider " * 10000 + "mitigation.", "Consider mitigation"),
+    ])
+    def test_get_mitigation_description_last_consider_in_first_line(self, long_description, expected_description):
+        threat = MTMThreat({"Value": {"Properties": {"KeyValueOfstringstring": [
+            {"Key": "UserThreatDescription", "Value": long_description}]}}})
+
+        description = get_mitigation_description(threat)
+
+        assert description == expected_description
+
+    def test_parse_mtmt_threats_added_to_their_components(self):
+        components = [Component(component_id=str(i), name=str(i), component_type="type", parent="tz",
+                                parent_type="trustZone") for i in range(3)]
+        mtmt_threats = [MTMThreat({"Value": {**self.threat["Value"], "Id": i, "TargetGuid": target}})
+                        for i, target in enumerate(["2", "0", "unknown", "2"], start=1)]
+        parser = MTMThreatParser(MTMT([], [], mtmt_threats, MTMKnowledge({})))
+
+        threats, mitigations = parser.parse(components)
+
+        assert [threat.id for threat in threats] == [1, 2, 3, 4]
+        assert [mitigation.id for mitigation in mitigations] == [1, 2, 3, 4]
+        assert [threat.threat_id for threat in components[0].threats] == [2]
+        assert components[1].threats == []
+        assert [threat.threat_id for threat in components[2].threats] == [1, 4]
+
     @pytest.mark.parametrize("message, expected_message", [
         ("Mitigation Description Dot.", "Mitigation Description Dot"),
         ("Mitigation Description No Dot", "Mitigation Description No Dot"),
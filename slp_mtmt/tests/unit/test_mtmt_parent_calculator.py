@@ -0,0 +1,63 @@
+from pytest import mark
+
+from slp_mtmt.slp_mtmt.entity.mtmt_entity_border import MTMBorder
+from slp_mtmt.slp_mtmt.mtmt_entity import MTMT
+from slp_mtmt.slp_mtmt.parse.mtmt_general_parser import is_parent, get_the_child
+from slp_mtmt.slp_mtmt.util.mtmt_parent_calculator import MTMTParentCalculator
+from slp_mtmt.tests.unit.test_line_parent_calculator import create_line
+
+
+def create_border(left, width, top, height, border_type='BorderBoundary') -> MTMBorder:
+    return MTMBorder({'Value': {'Left': f'{left}', 'Width': f'{width}', 'Top': f'{top}', 'Height': f'{height}'},
+                      'attrib': {'type': border_type}})
+
+
+class TestMTMTParentCalculator:
+
+    @mark.parametrize('borders, lines', [
+        ([create_border(50, 200, 100, 100),
+          create_border(60, 178, 110, 80),
+          create_border(70, 140, 120, 60, 'StencilRectangle')], []),
+        ([create_border(70, 140, 120, 60, 'StencilRectangle'),
+          create_border(50, 200, 100, 100),
+          create_border(60, 178, 110, 80)], []),
+        ([create_border(50, 200, 100, 100),
+          create_border(50, 200, 100, 100),
+          create_border(600, 10, 600, 10, 'StencilRectangle')], []),
+        ([create_border(50, 80, 220, 81, 'StencilRectangle'),
+          create_border(320, 80, 220, 81, 'StencilRectangle'),
+          create_border(0, 150, 200, 150)],
+         [create_line([200, 210, 140, 300, 140, 100], 'Left'),
+          create_line([200, 210, 300, 310, 315, 100], 'Right')]),
+        ([create_border(50, None, 100, 100),
+          create_border(60, 20, 110, 20, 'StencilRectangle'),
+          create_border(40, 100, 90, 100)], [])
+    ])
+    def test_same_parents_as_checking_all_shapes(self, borders, lines):
+        # GIVEN a threat model with some borders and lines
+        mtmt = MTMT(borders=borders, lines=lines, threats=[], know_base=None)
+
+        # WHEN the parents are calculated
+        calculator = MTMTParentCalculator(mtmt)
+
+        # THEN they are the same as the innermost of the shapes containing them
+        for shape in borders + lines:
+            expected = get_the_child([candidate for candidate in borders + lines if is_parent(candidate, shape)])
+            assert calculator.get_parent(shape) is expected
+
+    def test_innermost_parent(self):
+        # GIVEN some nested borders
+        outer = create_border(0, 1000, 0, 1000)
+        inner = create_border(100, 500, 100, 500)
+        component = create_border(200, 50, 200, 50, 'StencilRectangle')
+        other = create_border(1500, 100, 1500, 100)
+
+        # WHEN the parents are calculated
+        calculator = MTMTParentCalculator(MTMT(borders=[component, outer, other, inner], lines=[], threats=[],
+                                               know_base=None))
+
+        # THEN every border has its innermost container as parent
+        assert calculator.get_parent(component) is inner
+        assert calculator.get_parent(inner) is outer
+        assert calculator.get_parent(outer) is None
+        assert calculator.get_parent(other) is None
@@ -1,6 +1,9 @@
 from unittest import TestCase
 
-from slp_mtmt.slp_mtmt.tm7_to_json import Tm7ToJson
+from defusedxml import EntitiesForbidden
+from pytest import raises
+
+from slp_mtmt.slp_mtmt.tm7_to_json import Tm7ToJson, Tm7Reader
 from slp_mtmt.tests.resources import test_resource_paths
 
 
@@ -286,3 +289,69 @@ class TestTm7ToJson(TestCase):
         assert current_type['Name'] == 'Generic Interaction'
         assert current_type['ParentId'] == 'ROOT'
         assert current_type['Representation'] == 'Ellipse'
+
+
+class TestTm7Reader:
+
+    def test_read_same_elements_as_tm7_to_json(self):
+        # GIVEN the source MTMT data
+        with open(test_resource_paths.model_mtmt_source_file, 'r') as f:
+            xml = f.read()
+
+        # WHEN it is read
+        tm7 = Tm7Reader(xml).read()
+
+        # THEN the borders, lines and threats are the same as the ones converted to json
+        model_ = Tm7ToJson(xml).to_json()['ThreatModel']
+        surface_model_ = model_['DrawingSurfaceList']['DrawingSurfaceModel']
+        assert tm7['borders'] == surface_model_['Borders']['KeyValueOfguidanyType']
+        assert tm7['lines'] == surface_model_['Lines']['KeyValueOfguidanyType']
+        assert tm7['threats'] == model_['ThreatInstances']['KeyValueOfstringThreatpc_P0_PhOB']
+
+        # AND the knowledge base is not read
+        assert tm7['knowledge_base'] == []
+
+    def test_read_knowledge_base(self):
+        # GIVEN the source MTMT data
+        with open(test_resource_paths.model_mtmt_source_file, 'rb') as f:
+            xml = f.read()
+
+        # WHEN it is read with its knowledge base
+        tm7 = Tm7Reader(xml, read_knowledge_base=True).read()
+
+        # THEN the knowledge base is the same as the one converted to json
+        assert tm7['knowledge_base'] == [Tm7ToJson(xml).to_json()['ThreatModel']['KnowledgeBase']]
+
+    def test_read_single_border_and_threat(self):
+        # GIVEN a MTMT file with only one border and one threat
+        with open(test_resource_paths.model_mtmt_with_lines, 'rb') as f:
+            xml = f.read()
+
+        # WHEN it is read
+        tm7 = Tm7Reader(xml).read()
+
+        # THEN the border and the threat are read as lists of one element
+        assert len(tm7['borders']) == 1
+        assert tm7['borders'][0]['Key'] == tm7['borders'][0]['Value']['Guid']
+        assert len(tm7['threats']) == 1
+        assert tm7['threats'][0]['Value']['Id']
+        assert len(tm7['lines']) == 3
+
+    def test_entities_forbidden(self):
+        # GIVEN a MTMT file with an entity
+        xml = '<!DOCTYPE ThreatModel [<!ENTITY name "entity">]>' \
+              '<ThreatModel><DrawingSurfaceList>&name;</DrawingSurfaceList></ThreatModel>'
+
+        # WHEN it is read
+        # THEN an error is raised
+        with raises(EntitiesForbidden):
+            Tm7Reader(xml).read()
+
+    def test_not_a_threat_model(self):
+        # GIVEN a xml file that is not a threat model
+        xml = '<Model><DrawingSurfaceList/></Model>'
+
+        # WHEN it is read
+        # THEN an error is raised
+        with raises(ValueError):
+            Tm7Reader(xml).read()
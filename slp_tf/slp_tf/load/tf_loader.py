@@ -1,16 +1,98 @@
+import atexit
 import logging
+import multiprocessing
+import os
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from importlib.metadata import version, PackageNotFoundError
 from io import StringIO
-from typing import Callable
+from typing import Callable, Dict, List, Optional, Tuple
 
 import hcl2
-from deepmerge import always_merger
 
+from sl_util.sl_util.merge_utils import DocumentMerger
+from sl_util.sl_util.parse_cache import parse_cache
 from slp_base import LoadingIacFileError
 from slp_base import ProviderLoader
 from slp_tf.slp_tf.parse.mapping.mappers.tf_base_mapper import generate_resource_identifier
 
 logger = logging.getLogger(__name__)
 
+HCL2_PARSER_WORKERS_ENV_VAR = 'STARTLEFT_HCL2_PARSER_WORKERS'
+HCL2_PARSER_POOL_THRESHOLD_ENV_VAR = 'STARTLEFT_HCL2_PARSER_POOL_THRESHOLD'
+# Minimum number of source files to parse them in the process pool
+DEFAULT_HCL2_PARSER_POOL_THRESHOLD = 4
+
+
+def get_hcl2_parser_name() -> str:
+    try:
+        return f'hcl2-{version("python-hcl2")}'
+    except PackageNotFoundError:
+        return 'hcl2'
+
+
+# Name of the parser in the parse cache keys, which changes with the python-hcl2 version
+HCL2_PARSER = get_hcl2_parser_name()
+
+# The pending parsings are cancelled when the pools are stopped, but cancel_futures is only available from Python 3.9
+HCL2_PARSER_POOL_SHUTDOWN_ARGS = {'cancel_futures': True} if sys.version_info >= (3, 9) else {}
+
+_hcl2_parser_pools: Dict[int, ProcessPoolExecutor] = {}
+_hcl2_parser_pools_lock = threading.Lock()
+
+
+def get_hcl2_parser_workers() -> int:
+    workers = os.getenv(HCL2_PARSER_WORKERS_ENV_VAR)
+    return int(workers) if workers else os.cpu_count() or 1
+
+
+def get_hcl2_parser_pool_threshold() -> int:
+    return int(os.getenv(HCL2_PARSER_POOL_THRESHOLD_ENV_VAR, DEFAULT_HCL2_PARSER_POOL_THRESHOLD))
+
+
+def get_hcl2_parser_mp_context():
+    """
+    The pools may be created from a request thread of the server, and forking a process with several threads may copy
+    the locks held by the other threads, so the workers are forked from a fork server or spawned where it is not
+    available
+    """
+    start_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+    return multiprocessing.get_context(start_method)
+
+
+def get_hcl2_parser_pool(workers: int) -> ProcessPoolExecutor:
+    """
+    The pools are shared by all the loaders, so the cost of starting the processes is only paid once
+    """
+    with _hcl2_parser_pools_lock:
+        if workers not in _hcl2_parser_pools:
+            _hcl2_parser_pools[workers] = ProcessPoolExecutor(max_workers=workers,
+                                                              mp_context=get_hcl2_parser_mp_context())
+        return _hcl2_parser_pools[workers]
+
+
+def discard_hcl2_parser_pool(workers: int):
+    with _hcl2_parser_pools_lock:
+        pool = _hcl2_parser_pools.pop(workers, None)
+    if pool:
+        pool.shutdown(wait=False)
+
+
+def shutdown_hcl2_parser_pools():
+    """
+    Stops the processes of all the pools. It is called when the server or the interpreter exits
+    """
+    with _hcl2_parser_pools_lock:
+        pools = list(_hcl2_parser_pools.values())
+        _hcl2_parser_pools.clear()
+    for pool in pools:
+        pool.shutdown(wait=True, **HCL2_PARSER_POOL_SHUTDOWN_ARGS)
+
+
+atexit.register(shutdown_hcl2_parser_pools)
+
 
 def hcl2_reader(data):
     return hcl2.load(StringIO(initial_value=hcl2_data_as_str(data), newline=None))
@@ -20,6 +102,17 @@ def hcl2_data_as_str(data) -> str:
     return data if isinstance(data, str) else data.decode()
 
 
+def read_hcl2_source(source) -> Tuple[Optional[dict], Optional[Tuple[str, str]]]:
+    """
+    Parses a source in a process of the pool. The parser errors may not be picklable, so they are returned as their
+    class name and message
+    """
+    try:
+        return hcl2_reader(source), None
+    except Exception as e:
+        return None, (e.__class__.__name__, e.__str__())
+
+
 def raise_empty_sources_error():
     msg = "IaC file is empty"
     raise LoadingIacFileError("IaC file is not valid", msg, msg)
@@ -34,6 +127,9 @@ class TerraformLoader(ProviderLoader):
         self.sources: [bytes] = sources
         self.hcl2_reader: Callable = hcl2_reader
         self.terraform: dict = {}
+        self.merger = DocumentMerger()
+        self.parser_workers: int = get_hcl2_parser_workers()
+        self.parser_pool_threshold: int = get_hcl2_parser_pool_threshold()
 
     def load(self):
         try:
@@ -51,8 +147,8 @@ class TerraformLoader(ProviderLoader):
         if not self.sources:
             raise_empty_sources_error()
 
-        for source in self.sources:
-            self.__merge_hcl2_data(self.__load_hcl2_data(source))
+        for tf_data in self.__load_sources_hcl2_data():
+            self.__merge_hcl2_data(tf_data)
 
         if not self.terraform:
             raise_empty_sources_error()
@@ -80,7 +176,47 @@ class TerraformLoader(ProviderLoader):
                     component_type_obj["Properties"] = resource_properties
 
     def __merge_hcl2_data(self, tf_data):
-        self.terraform = always_merger.merge(self.terraform, tf_data)
+        self.terraform = self.merger.merge(self.terraform, tf_data)
+
+    def __load_sources_hcl2_data(self) -> List[dict]:
+        """
+        The sources already parsed are taken from the parse cache, and the rest are parsed and cached. Their data is
+        always returned in the order of the sources, so it is merged deterministically
+        """
+        if self.hcl2_reader is not hcl2_reader:
+            return [self.__load_hcl2_data(source) for source in self.sources]
+
+        sources_data = [parse_cache.lookup(HCL2_PARSER, source) for source in self.sources]
+        not_cached = [index for index, source_data in enumerate(sources_data) if source_data is None]
+
+        for index, source_data in zip(not_cached, self.__parse_sources([self.sources[i] for i in not_cached])):
+            parse_cache.store(HCL2_PARSER, self.sources[index], source_data)
+            sources_data[index] = source_data
+
+        return sources_data
+
+    def __parse_sources(self, sources: list) -> List[dict]:
+        """
+        The python-hcl2 parser holds the GIL, so the sources are parsed in a process pool when there are enough of
+        them
+        """
+        if self.parser_workers < 2 or len(sources) < max(self.parser_pool_threshold, 2):
+            return [self.__load_hcl2_data(source) for source in sources]
+
+        workers = self.parser_workers
+        logger.debug(f"Parsing {len(sources)} source files in {min(workers, len(sources))} processes")
+        try:
+            results = list(get_hcl2_parser_pool(workers).map(read_hcl2_source, sources))
+        except (BrokenProcessPool, OSError) as e:
+            logger.warning(f"Source files could not be parsed in parallel, parsing them sequentially: {e}")
+            discard_hcl2_parser_pool(workers)
+            return [self.__load_hcl2_data(source) for source in sources]
+
+        for _, error in results:
+            if error:
+                raise LoadingIacFileError("IaC file is not valid", *error)
+
+        return [tf_data for tf_data, _ in results]
 
     def __load_hcl2_data(self, source):
         try:
@@ -1,12 +1,32 @@
 import logging
 
+from sl_util.sl_util.jmespath_utils import precompile_mapping_expressions
 from slp_base.slp_base.mapping_file_loader import MappingFileLoader
+from slp_tf.slp_tf.parse.mapping.search.functions.tf_custom_mapping_functions import build_module_expression
+from slp_tf.slp_tf.parse.mapping.search.functions.tf_query_mapping_functions import build_query_expression
 
 logger = logging.getLogger(__name__)
 
+QUERY_FUNCTIONS = ('$type', '$name', '$props')
+
+
+def build_mapping_expressions(mapping_source: dict):
+    """
+    Builds the JMESPath expressions composed at runtime by the query and $module mapping functions
+    """
+    if any(function in mapping_source for function in QUERY_FUNCTIONS):
+        yield build_query_expression(mapping_source)
+
+    if '$module' in mapping_source:
+        yield build_module_expression(mapping_source)
+
 
 class TerraformMappingFileLoader(MappingFileLoader):
 
     def __init__(self, mapping_files: [bytes]):
         super(TerraformMappingFileLoader, self).__init__(mapping_files)
 
+    def load(self) -> {}:
+        super().load()
+        precompile_mapping_expressions(self.map, build_mapping_expressions)
+        return self.map
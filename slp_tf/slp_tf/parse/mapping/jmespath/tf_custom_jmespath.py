@@ -4,6 +4,7 @@ from copy import deepcopy
 
 import jmespath
 
+from sl_util.sl_util.jmespath_utils import search
 from slp_tf.slp_tf.parse.mapping.mappers.tf_base_mapper import generate_resource_identifier
 
 logger = logging.getLogger(__name__)
@@ -151,4 +152,4 @@ jmespath_options = jmespath.Options(custom_functions=TerraformCustomFunctions())
 
 def jmespath_search(search_path, source):
     logger.debug(f"jmespath search with expression {search_path}")
-    return jmespath.search(search_path, source, options=jmespath_options)
+    return search(search_path, source, options=jmespath_options)
@@ -19,6 +19,13 @@ def generate_resource_identifier(resource_type, resource_name):
     return f"{resource_type}.{resource_name}"
 
 
+def is_jmespath_truthy(value) -> bool:
+    """
+    JMESPath false values are null, false and empty strings, arrays and objects. Unlike Python, 0 is true
+    """
+    return not (value is None or value is False or (isinstance(value, (str, list, dict)) and len(value) == 0))
+
+
 class TerraformBaseMapper(ABC):
     logger = logging.getLogger(__name__)
 
@@ -128,9 +135,11 @@ class TerraformBaseMapper(ABC):
     # Prevent to generate component and map on id_map the component["id"] to the aws_vpc uuid
     # for Dataflow generation
     def exists_vpc_with_cidr_block_in_id_map(self, source_model, component_resource_id):
-        for resource in source_model.query(
-                "resource|[?resource_type=='aws_vpc' && resource_properties.cidr_block]"):
-            cidr_block = resource['resource_properties']['cidr_block']
+        for resource in source_model.get_resources_by_type('aws_vpc'):
+            properties = resource.get('resource_properties')
+            cidr_block = properties.get('cidr_block') if isinstance(properties, dict) else None
+            if not is_jmespath_truthy(cidr_block):
+                continue
             if self.is_terraform_variable_reference(cidr_block):
                 cidr_block = self.get_terraform_variable_default_value(source_model, cidr_block)
             if cidr_block == component_resource_id:
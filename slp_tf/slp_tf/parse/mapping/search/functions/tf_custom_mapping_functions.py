@@ -48,6 +48,12 @@ def root(mapping_source, **kwargs):
         source_model_data: The completely TF dictionary
     :return: The jmespath search of the $root value
     """
+    tf_source_model = kwargs.get("tf_source_model", None)
+    if tf_source_model is not None:
+        result = tf_source_model.resources_index.search(mapping_source["$root"])
+        if result is not None:
+            return result
+
     source_model_data = kwargs.get("source_model_data", None)
     return jmespath_search(mapping_source["$root"], source_model_data)
 
@@ -232,5 +238,8 @@ def module(mapping_source, **kwargs):
     """
 
     source_model_data = kwargs.get("source_model_data", None)
-    return jmespath_search(
-        f"module|get_module_terraform(@, '{mapping_source['$module']}')", source_model_data)
+    return jmespath_search(build_module_expression(mapping_source), source_model_data)
+
+
+def build_module_expression(mapping_source) -> str:
+    return f"module|get_module_terraform(@, '{mapping_source['$module']}')"
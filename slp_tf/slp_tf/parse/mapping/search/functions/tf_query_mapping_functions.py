@@ -21,15 +21,31 @@ def query(mapping_source, **kwargs):
     :param mapping_source: The $source for a mapping component
     :param kwargs:
         source_model_data: The completely TF dictionary
+        tf_source_model: The TerraformSourceModel whose resources index resolves the plain $type and $name queries
     :return: The jmespath search of the composed query
     """
+    tf_source_model = kwargs.get("tf_source_model", None)
+    if tf_source_model is not None:
+        result = tf_source_model.resources_index.query(mapping_source)
+        if result is not None:
+            return result
+
     source_model_data = kwargs.get("source_model_data", None)
+    return jmespath_search(build_query_expression(mapping_source), source_model_data)
+
+
+def build_query_expression(mapping_source) -> str:
+    """
+    Composes the JMESPath expression of the query functions ($type, $name and $props) for a $source
+    :param mapping_source: The $source for a mapping component
+    :return: The composed JMESPath expression
+    """
     type_query = __generate_jmespath("resource_type", mapping_source.get("$type", None), __equals_condition)
     name_query = __generate_jmespath("resource_name", mapping_source.get("$name", None), __equals_condition)
     props_query = __generate_jmespath("resource_properties", mapping_source.get("$props", None), __property_condition)
 
     conditions = [type_query, name_query, props_query]
-    return jmespath_search(__generate_full_path("resource", conditions), source_model_data)
+    return __generate_full_path("resource", conditions)
 
 
 def __generate_full_path(root, conditions):
@@ -0,0 +1,105 @@
+import re
+from typing import List, Dict, Union
+
+from slp_tf.slp_tf.parse.mapping.jmespath.tf_custom_jmespath import add_type_and_name, _adapt_dict
+
+# Attributes added to every resource by TerraformLoader._func_squash_terraform
+SQUASHED_ATTRIBUTES = ('resource_id', 'resource_type', 'resource_name', 'resource_properties', 'Type', '_key',
+                       'Properties')
+
+GET_EXPRESSION_REGEX = re.compile(r"^\s*resource\s*\|\s*(get|get_starts_with)\(\s*@\s*,\s*'([^'\\]*)'\s*\)\s*$")
+
+
+def _is_plain_value(value) -> bool:
+    """
+    The values which can be compared as they are, without escaping them in a JMESPath raw string literal
+    """
+    return isinstance(value, str) and "'" not in value and '\\' not in value
+
+
+def _as_plain_values(value: Union[str, list]) -> Union[List[str], None]:
+    values = [value] if isinstance(value, str) else value
+    if isinstance(values, list) and values and all(_is_plain_value(v) for v in values):
+        return values
+
+
+class TerraformResourcesIndex:
+    """
+    Index of the squashed Terraform resources by type and by name. The resources are referenced by their position in
+    the resource list, so the results keep the same order than the JMESPath filters over the list
+    """
+
+    def __init__(self, data: dict):
+        resources = data.get('resource') if isinstance(data, dict) else None
+        self.resources: list = resources if isinstance(resources, list) else []
+        self.positions_by_type: Dict[str, List[int]] = {}
+        self.positions_by_name: Dict[str, List[int]] = {}
+        # The index can only replace the JMESPath searches over squashed resources lists
+        self.usable = resources is None or isinstance(resources, list)
+
+        for position, resource in enumerate(self.resources):
+            if not isinstance(resource, dict):
+                continue
+            if 'resource_type' not in resource:
+                self.usable = False
+            if isinstance(resource.get('resource_type'), str):
+                self.positions_by_type.setdefault(resource['resource_type'], []).append(position)
+            if isinstance(resource.get('resource_name'), str):
+                self.positions_by_name.setdefault(resource['resource_name'], []).append(position)
+
+    def get_resources_by_type(self, resource_type: str) -> list:
+        return [self.resources[position] for position in self.positions_by_type.get(resource_type, [])]
+
+    def query(self, mapping_source: dict) -> Union[list, None]:
+        """
+        Resolves the query mapping functions ($type and $name) selecting plain values
+        :return: the same result than the JMESPath query, or None if the query cannot be resolved with the index
+        """
+        if not self.usable or '$props' in mapping_source:
+            return None
+
+        positions = None
+        for function, index in (('$type', self.positions_by_type), ('$name', self.positions_by_name)):
+            if not mapping_source.get(function):
+                continue
+
+            values = _as_plain_values(mapping_source[function])
+            if values is None:
+                return None
+
+            selected = {position for value in values for position in index.get(value, [])}
+            positions = selected if positions is None else positions & selected
+
+        if positions is None:
+            return None
+
+        return [_adapt_dict(self.resources[position]) for position in sorted(positions)]
+
+    def search(self, expression: str) -> Union[list, None]:
+        """
+        Resolves the expressions selecting resources with the get and get_starts_with functions
+        :return: the same result than the JMESPath search, or None if the expression cannot be resolved with the index
+        """
+        match = GET_EXPRESSION_REGEX.match(expression) if self.usable else None
+        if not match:
+            return None
+
+        function, resource_type = match.groups()
+        if function == 'get':
+            types = [resource_type] if resource_type not in SQUASHED_ATTRIBUTES else None
+        else:
+            types = [t for t in self.positions_by_type if t.startswith(resource_type)] \
+                if not any(attribute.startswith(resource_type) for attribute in SQUASHED_ATTRIBUTES) else None
+
+        if types is None:
+            return None
+
+        positions = sorted(position for t in types for position in self.positions_by_type.get(t, []))
+        results = []
+        for position in positions:
+            resource = self.resources[position]
+            resource_type = resource['resource_type']
+            for resource_name in resource[resource_type]:
+                results.append(add_type_and_name(resource[resource_type], resource_type, resource_name))
+
+        return results
@@ -1,9 +1,9 @@
 import json
 
-from deepmerge import always_merger
-
+from sl_util.sl_util.merge_utils import merge_documents
 from slp_tf.slp_tf.parse.mapping.jmespath.tf_custom_jmespath import jmespath_search
 from slp_tf.slp_tf.parse.mapping.search.tf_mapping_function_selector import MappingFunctionSelector
+from slp_tf.slp_tf.parse.mapping.tf_resources_index import TerraformResourcesIndex
 
 
 class TerraformSourceModel:
@@ -13,14 +13,39 @@ class TerraformSourceModel:
         self.lookup = {}
         self.mapping_function_selector = MappingFunctionSelector()
 
+    @property
+    def data(self) -> dict:
+        return self.__data
+
+    @data.setter
+    def data(self, data: dict):
+        self.__data = data
+        self.__resources_index = None
+
+    @property
+    def resources_index(self) -> TerraformResourcesIndex:
+        """
+        Index of the resources by type and name, built once on first use from the squashed Terraform data
+        """
+        if self.__resources_index is None:
+            self.__resources_index = TerraformResourcesIndex(self.data)
+        return self.__resources_index
+
     def load(self, data):
-        always_merger.merge(self.data, data)
+        merge_documents(self.data, data)
+        self.__resources_index = None
 
     def json(self):
         return json.dumps(self.data, indent=2)
 
     def query(self, query):
-        return jmespath_search(query, self.data)
+        result = self.resources_index.search(query)
+        return result if result is not None else jmespath_search(query, self.data)
+
+    def get_resources_by_type(self, resource_type: str) -> list:
+        if self.resources_index.usable:
+            return self.resources_index.get_resources_by_type(resource_type)
+        return jmespath_search(f"resource[?resource_type=='{resource_type}']", self.data) or []
 
     def search(self, mapping_source, source=None):
         if isinstance(mapping_source, str):
@@ -1,7 +1,8 @@
 import logging
 import uuid
 
-from slp_tf.slp_tf.parse.mapping.mappers.tf_backward_compatibility import TfIdMapDictionary, TfDataflowNodeId
+from slp_tf.slp_tf.parse.mapping.mappers.tf_backward_compatibility import TfIdMapDictionary, TfDataflowNodeId, \
+    is_type_and_name_string, return_name_from_type_and_name_string
 from slp_tf.slp_tf.parse.mapping.mappers.tf_component_mapper import TerraformComponentMapper
 from slp_tf.slp_tf.parse.mapping.mappers.tf_dataflow_mapper import TerraformDataflowMapper
 from slp_tf.slp_tf.parse.mapping.mappers.tf_trustzone_mapper import TerraformTrustzoneMapper
@@ -26,6 +27,16 @@ class ComponentLists:
         self.singleton = []
 
 
+def _get_hub_node_key(node_name: TfDataflowNodeId) -> str:
+    """
+    The key of a hub node in the hub dataflows index. The TfDataflowNodeId of a "type.name" node is equal to the one
+    of its "name", so both share the same key
+    """
+    if isinstance(node_name.value, str) and is_type_and_name_string(node_name.value):
+        return return_name_from_type_and_name_string(node_name.value)
+    return str(node_name.value)
+
+
 def _default_dataflow_mapping_template():
     return {
         "id": {"$path": "resource_id"},
@@ -42,7 +53,8 @@ class TerraformTransformer:
         self.id_parents = {}
         self.id_dataflows = {}
         self.tree = {}
-        self.singleton_component_ids = []
+        self.singleton_component_ids = set()
+        self.hub_dataflow_infos = {}
 
     def run(self, iac_mapping):
         self.iac_mapping = iac_mapping
@@ -151,8 +163,11 @@ class TerraformTransformer:
         return self.__get_catchall(components.catchall, components.skip, results_without_catchall)
 
     def __add_components_to_otm(self, components):
+        trustzone_ids = {trustzone["id"] for trustzone in self.iac_mapping["trustzones"]}
+        component_ids = {component["id"] for component in components}
+
         for component in components:
-            parent_type = self.__get_parent_type(component, components)
+            parent_type = self.__get_parent_type(component, trustzone_ids, component_ids)
             if not parent_type:
                 continue
 
@@ -162,86 +177,107 @@ class TerraformTransformer:
             logger.debug(f"Added component: [{component['name']}][{component['id']}]"
                          f"{component['tags']}" if 'tags' in component else "")
 
-    def __get_parent_type(self, component, components):
-        if component['parent'] in [trustzone["id"] for trustzone in self.iac_mapping["trustzones"]]:
+    def __get_parent_type(self, component, trustzone_ids, component_ids):
+        if component['parent'] in trustzone_ids:
             return 'trustZone'
 
-        parent_component = next(filter(lambda x: x["id"] == component['parent'], components), None)
-        if parent_component:
+        if component['parent'] in component_ids:
             return 'component'
 
     def __get_components(self, components, skip):
+        skip_ids = {skip_component["id"] for skip_component in skip}
         results = []
         for component in components:
-            skip_this = False
-            for skip_component in skip:
-                if component["id"] == skip_component["id"]:
-                    logger.debug("Skipping component '{}'".format(component["id"]))
-                    skip_this = True
-                    break
-            if not skip_this:
-                results.append(component)
+            if component["id"] in skip_ids:
+                logger.debug("Skipping component '{}'".format(component["id"]))
+                continue
+            results.append(component)
         return results
 
     def __get_catchall(self, catchall, skip, results):
+        skip_ids = {skip_component["id"] for skip_component in skip}
+        result_ids = {result["id"] for result in results}
         for component in catchall:
             skip_this = False
-            for skip_component in skip:
-                if component["id"] == skip_component["id"]:
-                    logger.debug("Skipping catchall component '{}'".format(component["id"]))
-                    skip_this = True
-                    break
+            if component["id"] in skip_ids:
+                logger.debug("Skipping catchall component '{}'".format(component["id"]))
+                skip_this = True
             if component["id"] in self.singleton_component_ids:
                 logger.debug("Catchall component already added '{}'".format(component["id"]))
                 skip_this = True
-            for current_component in results:
-                if component["id"] == current_component["id"]:
-                    logger.debug("Catchall component already added '{}'".format(component["id"]))
-                    skip_this = True
-                    break
+            if component["id"] in result_ids:
+                logger.debug("Catchall component already added '{}'".format(component["id"]))
+                skip_this = True
             if not skip_this:
                 results.append(component)
+                result_ids.add(component["id"])
         return results
 
+    def __build_id_map_reverse_index(self):
+        """
+        Indexes the keys of the id_map by their component id. Only the single ids are indexed, because the keys
+        mapped to a list of ids are never remapped to a singleton component
+        """
+        reverse_index = {}
+        for key, value in self.id_map.store.items():
+            if isinstance(value, str):
+                reverse_index.setdefault(value, []).append(key)
+        return reverse_index
+
+    def __remap_id(self, reverse_index, component_id, new_component_id):
+        keys = reverse_index.pop(component_id, [])
+        for key in keys:
+            self.id_map[key] = new_component_id
+        if keys:
+            reverse_index.setdefault(new_component_id, []).extend(keys)
+
     def __get_singleton(self, singleton, skip, results):
-        singleton_types_added = []
+        skip_ids = {skip_component["id"] for skip_component in skip}
+        results_by_type = {}
+        for result in results:
+            results_by_type.setdefault(result["type"], []).append(result)
+        id_map_reverse_index = self.__build_id_map_reverse_index()
+
+        # tags of the grouped components, to avoid looking for every new tag in their list of tags
+        tags_by_result = {}
+        singleton_types_added = set()
         for component in singleton:
-            skip_this = False
-            for skip_component in skip:
-                if component["id"] == skip_component["id"]:
-                    logger.debug("Skipping singleton component '{}'".format(component["id"]))
-                    skip_this = True
-                    break
-            if not skip_this:
-                self.singleton_component_ids.append(component["id"])
-                if component["type"] not in singleton_types_added:
-                    results.append(component)
-                    singleton_types_added.append(component["type"])
-                else:
-                    # if the component is singleton and it already exists in otm (from a previous mapping)
-                    # no new component is generated but the existing component is updated
-                    # a)with the group name (even more if had a component name)
-                    # b)with a new tag with data from this source component
-                    for result in results:
-                        if result["type"] == component["type"]:
-                            # Modify uuid of the given component
-                            for key in self.id_map:
-                                if self.id_map[key] == component["id"]:
-                                    self.id_map[key] = result["id"]
-
-                            if "singleton_multiple_name" in component:
-                                result["name"] = component["singleton_multiple_name"]
-
-                            # update "result" component with its multiple tags before adding tags from "component"
-                            if "singleton_multiple_tags" in result:
-                                if len(result["tags"]) <= len(result["singleton_multiple_tags"]) \
-                                        and result["tags"] is not result["singleton_multiple_tags"]:
-                                    result["tags"] = result["singleton_multiple_tags"]
-
-                            if "singleton_multiple_tags" in component:
-                                for tag in component["singleton_multiple_tags"]:
-                                    if tag not in result["tags"]:
-                                        result["tags"].append(tag)
+            if component["id"] in skip_ids:
+                logger.debug("Skipping singleton component '{}'".format(component["id"]))
+                continue
+
+            self.singleton_component_ids.add(component["id"])
+            if component["type"] not in singleton_types_added:
+                results.append(component)
+                results_by_type.setdefault(component["type"], []).append(component)
+                singleton_types_added.add(component["type"])
+            else:
+                # if the component is singleton and it already exists in otm (from a previous mapping)
+                # no new component is generated but the existing component is updated
+                # a)with the group name (even more if had a component name)
+                # b)with a new tag with data from this source component
+                for result in results_by_type[component["type"]]:
+                    # Modify uuid of the given component
+                    self.__remap_id(id_map_reverse_index, component["id"], result["id"])
+
+                    if "singleton_multiple_name" in component:
+                        result["name"] = component["singleton_multiple_name"]
+
+                    # update "result" component with its multiple tags before adding tags from "component"
+                    if "singleton_multiple_tags" in result:
+                        if len(result["tags"]) <= len(result["singleton_multiple_tags"]) \
+                                and result["tags"] is not result["singleton_multiple_tags"]:
+                            result["tags"] = result["singleton_multiple_tags"]
+                            tags_by_result.pop(id(result), None)
+
+                    if "singleton_multiple_tags" in component:
+                        if id(result) not in tags_by_result:
+                            tags_by_result[id(result)] = set(result["tags"])
+                        result_tags = tags_by_result[id(result)]
+                        for tag in component["singleton_multiple_tags"]:
+                            if tag not in result_tags:
+                                result["tags"].append(tag)
+                                result_tags.add(tag)
         return results
 
     def transform_dataflows(self):
@@ -254,23 +290,28 @@ class TerraformTransformer:
             for dataflow in mapper.run(self.source_model, self.id_dataflows):
                 self.threat_model.add_dataflow(**dataflow)
 
-        self.__generate_dataflows_from_hubs()
+        # every generated dataflow is added before generating the next one, because they are not generated twice
+        for dataflow in self.__generate_dataflows_from_hubs():
+            self.threat_model.add_dataflow(**dataflow)
         self.__clean_hub_dataflows()
 
     def __generate_dataflows_from_hubs(self):
-        for dataflow in self.threat_model.dataflows:
+        hub_dataflows_index = self.__index_hub_dataflows()
+
+        # the generated dataflows have no hub nodes, so they are not candidates to be linked through a hub
+        for dataflow in list(self.threat_model.dataflows):
             if "-hub" in dataflow.source_node or "-hub" in dataflow.destination_node:
-                for cursor_dataflow in self.threat_model.dataflows:
+                for cursor_dataflow in self.__get_hub_dataflow_candidates(dataflow, hub_dataflows_index):
 
                     if self.__is_same_dataflow(dataflow, cursor_dataflow):
                         continue
 
                     if self.__is_case_1_dataflow(dataflow, cursor_dataflow):
                         if self.__is_outbound_dataflow(dataflow, cursor_dataflow):
-                            self.__generate_dataflow_from_hub(dataflow, cursor_dataflow)
+                            yield from self.__generate_dataflow_from_hub(dataflow, cursor_dataflow)
 
                         elif self.__is_inbound_dataflow(dataflow, cursor_dataflow):
-                            self.__generate_dataflow_from_hub(cursor_dataflow, dataflow)
+                            yield from self.__generate_dataflow_from_hub(cursor_dataflow, dataflow)
 
                     if self.__is_case_2_dataflow(dataflow, cursor_dataflow):
                         if self.__is_outbound_dataflow(dataflow, cursor_dataflow):
@@ -278,7 +319,32 @@ class TerraformTransformer:
                         elif self.__is_inbound_dataflow(dataflow, cursor_dataflow):
                             self.__case_2_add_to_tree(dataflow, cursor_dataflow, INBOUND)
 
-        self.__case_2_generate_hub_dataflows()
+        yield from self.__case_2_generate_hub_dataflows()
+
+    def __index_hub_dataflows(self):
+        """
+        Indexes the positions of the type 2 and type 3 hub dataflows by their source and destination hub nodes. They
+        are the only ones that can be linked to a type 1 dataflow, and only when they share its destination hub node
+        """
+        hub_dataflows_index = {}
+        for position, dataflow in enumerate(self.threat_model.dataflows):
+            hub_info = self.__get_hub_dataflow_info(dataflow)
+            if hub_info[HUB_TYPE] not in (TYPE2, TYPE3):
+                continue
+
+            for node_key in {_get_hub_node_key(hub_info[SOURCE_NODE_NAME]),
+                             _get_hub_node_key(hub_info[DESTINATION_NODE_NAME])}:
+                hub_dataflows_index.setdefault(node_key, []).append(position)
+
+        return hub_dataflows_index
+
+    def __get_hub_dataflow_candidates(self, dataflow, hub_dataflows_index):
+        hub_info = self.__get_hub_dataflow_info(dataflow)
+        if hub_info[HUB_TYPE] is not TYPE1:
+            return []
+
+        positions = hub_dataflows_index.get(_get_hub_node_key(hub_info[DESTINATION_NODE_NAME]), [])
+        return [self.threat_model.dataflows[position] for position in positions]
 
     def __is_same_dataflow(self, dataflow_1, dataflow_2):
         dataflow_1_hub_info = self.__get_hub_dataflow_info(dataflow_1)
@@ -347,7 +413,7 @@ class TerraformTransformer:
                 return
 
         dataflow["tags"] = tags
-        self.threat_model.add_dataflow(**dataflow)
+        yield dataflow
 
     def __separate_hub_type_and_hub_dataflow(self, node_id):
         hub_type = None
@@ -476,11 +542,11 @@ class TerraformTransformer:
                         for destination_dataflow in destination_dataflows:
                             if not self.__is_same_dataflow(source_dataflows[0], destination_dataflow):
                                 if bound is INBOUND:
-                                    self.__generate_dataflow_from_hub(destination_dataflow, source_dataflows[0]
-                                                                      , additional_tags)
+                                    yield from self.__generate_dataflow_from_hub(
+                                        destination_dataflow, source_dataflows[0], additional_tags)
                                 elif bound is OUTBOUND:
-                                    self.__generate_dataflow_from_hub(source_dataflows[0], destination_dataflow
-                                                                      , additional_tags)
+                                    yield from self.__generate_dataflow_from_hub(
+                                        source_dataflows[0], destination_dataflow, additional_tags)
 
     def __get_additional_tags(self, child_hub_name, grandchild):
         additional_tags = None
@@ -523,6 +589,10 @@ class TerraformTransformer:
         return end_components
 
     def __get_hub_dataflow_info(self, dataflow):
+        # the hub info of every dataflow is compared many times, but its nodes never change
+        if id(dataflow) in self.hub_dataflow_infos:
+            return self.hub_dataflow_infos[id(dataflow)][1]
+
         dataflow_hub_type_source, dataflow_source_node_name = \
             self.__separate_hub_type_and_hub_dataflow(dataflow.source_node)
         dataflow_hub_type_destination, dataflow_destination_node_name = \
@@ -535,6 +605,8 @@ class TerraformTransformer:
 
         hub_dataflow_info = {HUB_TYPE: dataflow_hub_type, SOURCE_NODE_NAME: dataflow_source_node_name,
                              DESTINATION_NODE_NAME: dataflow_destination_node_name}
+        # the dataflow is kept with its info so its id is not reused while it is cached
+        self.hub_dataflow_infos[id(dataflow)] = (dataflow, hub_dataflow_info)
         return hub_dataflow_info
 
     def __clean_hub_dataflows(self):
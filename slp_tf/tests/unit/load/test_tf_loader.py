@@ -1,12 +1,30 @@
 from unittest import TestCase
 from unittest.mock import patch
 
+from sl_util.sl_util.file_utils import get_byte_data
+from sl_util.sl_util.parse_cache import parse_cache
 from slp_base import LoadingIacFileError
-from slp_tf.slp_tf.load.tf_loader import TerraformLoader
+from slp_tf.slp_tf.load.tf_loader import TerraformLoader, get_hcl2_parser_pool, shutdown_hcl2_parser_pools
+from slp_tf.tests.resources.test_resource_paths import terraform_aws_simple_components, terraform_elb, \
+    terraform_networks, terraform_resources, terraform_single_tf
+
+TF_SOURCES = [terraform_networks, terraform_resources, terraform_aws_simple_components, terraform_elb,
+              terraform_single_tf]
+
+
+def load_terraform(sources, parser_workers: int, parser_pool_threshold: int) -> dict:
+    tf_loader = TerraformLoader(sources)
+    tf_loader.parser_workers = parser_workers
+    tf_loader.parser_pool_threshold = parser_pool_threshold
+    tf_loader.load()
+    return tf_loader.get_terraform()
 
 
 class TestTerraformLoader(TestCase):
 
+    def setUp(self):
+        parse_cache.clear()
+
     @patch('hcl2.load')
     def test_valid_hcl2(self, hcl2_mock):
         # GIVEN a mocked valid hcl2 source
@@ -57,3 +75,88 @@ class TestTerraformLoader(TestCase):
         # AND an empty IaC file message is on the exception
         assert str(loading_error.exception.title) == 'IaC file is not valid'
         assert str(loading_error.exception.message) == 'IaC file is empty'
+
+    def test_parallel_hcl2_parsing(self):
+        # GIVEN several valid Terraform sources
+        sources = [get_byte_data(source) for source in TF_SOURCES]
+
+        # WHEN they are loaded sequentially and in a process pool
+        sequential_terraform = load_terraform(sources, parser_workers=1, parser_pool_threshold=1)
+        parse_cache.clear()
+        parallel_terraform = load_terraform(sources, parser_workers=2, parser_pool_threshold=1)
+
+        # THEN the Terraform data is merged in the same order
+        assert parallel_terraform == sequential_terraform
+
+    def test_parallel_hcl2_parsing_error(self):
+        # GIVEN several Terraform sources with an invalid one
+        sources = [get_byte_data(source) for source in TF_SOURCES] + [b'resource "aws_vpc" {']
+
+        # WHEN they are loaded in a process pool
+        # THEN a LoadingIacFileError is raised
+        with self.assertRaises(LoadingIacFileError) as loading_error:
+            load_terraform(sources, parser_workers=2, parser_pool_threshold=1)
+
+        # AND the error info is the one of the parser
+        assert str(loading_error.exception.title) == 'IaC file is not valid'
+        assert loading_error.exception.message
+
+    @patch('slp_tf.slp_tf.load.tf_loader.get_hcl2_parser_pool')
+    def test_small_inputs_skip_parser_pool(self, get_hcl2_parser_pool_mock):
+        # GIVEN less sources than the parser pool threshold
+        sources = [get_byte_data(source) for source in TF_SOURCES[:2]]
+
+        # WHEN they are loaded
+        load_terraform(sources, parser_workers=2, parser_pool_threshold=3)
+
+        # THEN the process pool is not used
+        get_hcl2_parser_pool_mock.assert_not_called()
+
+    def test_cached_hcl2_data_not_modified_by_loader(self):
+        # GIVEN a valid Terraform source already loaded
+        sources = [get_byte_data(terraform_aws_simple_components)]
+        first_terraform = load_terraform(sources, parser_workers=1, parser_pool_threshold=1)
+
+        # WHEN it is loaded again
+        second_terraform = load_terraform(sources, parser_workers=1, parser_pool_threshold=1)
+
+        # THEN the parsed data is taken from the parse cache
+        assert parse_cache.stats()['hits'] == 1
+
+        # AND the resources are squashed only once
+        assert second_terraform == first_terraform
+
+    def test_parser_pool_not_forked_from_threads(self):
+        # GIVEN several Terraform sources parsed in a process pool
+        sources = [get_byte_data(source) for source in TF_SOURCES]
+        load_terraform(sources, parser_workers=2, parser_pool_threshold=1)
+
+        # WHEN the pool is got
+        pool = get_hcl2_parser_pool(2)
+
+        # THEN its processes are not forked from the current process
+        assert pool._mp_context.get_start_method() in ['forkserver', 'spawn']
+
+        # AND it is stopped with the rest of the pools
+        shutdown_hcl2_parser_pools()
+        assert get_hcl2_parser_pool(2) is not pool
+        shutdown_hcl2_parser_pools()
+
+    @patch('slp_tf.slp_tf.load.tf_loader.HCL2_PARSER_POOL_SHUTDOWN_ARGS', {})
+    def test_parser_pools_shutdown_without_cancel_futures(self):
+        # GIVEN a Python version without the cancel_futures argument, like Python 3.8
+        # AND several Terraform sources parsed in a process pool
+        sources = [get_byte_data(source) for source in TF_SOURCES]
+        load_terraform(sources, parser_workers=2, parser_pool_threshold=1)
+        pool = get_hcl2_parser_pool(2)
+
+        # WHEN the pools are stopped
+        with patch.object(pool, 'shutdown', wraps=pool.shutdown) as shutdown_mock:
+            shutdown_hcl2_parser_pools()
+
+        # THEN the pool is stopped without the cancel_futures argument
+        shutdown_mock.assert_called_once_with(wait=True)
+
+        # AND a new pool is created the next time
+        assert get_hcl2_parser_pool(2) is not pool
+        shutdown_hcl2_parser_pools()
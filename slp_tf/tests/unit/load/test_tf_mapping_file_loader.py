@@ -3,8 +3,11 @@ from unittest.mock import patch
 
 from deepmerge import always_merger
 
+from sl_util.sl_util.jmespath_utils import expression_registry, compile_expression
 from slp_base import LoadingMappingFileError, MappingFileNotValidError
 from slp_tf.slp_tf.load.tf_mapping_file_loader import TerraformMappingFileLoader
+from slp_tf.slp_tf.parse.mapping.search.functions.tf_custom_mapping_functions import build_module_expression
+from slp_tf.slp_tf.parse.mapping.search.functions.tf_query_mapping_functions import build_query_expression
 
 
 class TestTerraformMappingFileLoader(TestCase):
@@ -105,3 +108,33 @@ class TestTerraformMappingFileLoader(TestCase):
         # AND a dictionary with the file mappings is returned
         assert mappings == mappings_result
 
+
+    def test_mapping_expressions_precompiled(self):
+        # GIVEN a mapping file with JMESPath expressions and query functions
+        mapping_file_data = [bytes(
+            'trustzones: []\n'
+            'components:\n'
+            '  - type: vpc\n'
+            '    $source: {$root: "resource|get(@, \'aws_vpc\')"}\n'
+            '  - type: lb\n'
+            '    $source: {$type: [aws_lb, aws_elb]}\n'
+            '  - type: module\n'
+            '    $source: {$module: vpc}\n'
+            '    name: {$path: "resource_name"}\n'
+            'dataflows: []\n', 'utf-8')]
+        expression_registry.clear()
+
+        # WHEN the load method is called
+        TerraformMappingFileLoader(mapping_file_data).load()
+
+        # THEN all the expressions are precompiled without counting as lookups
+        assert expression_registry.stats()['size'] == 4
+        assert expression_registry.stats()['misses'] == 0
+
+        # AND the mapping functions find the expressions already compiled
+        compile_expression("resource|get(@, 'aws_vpc')")
+        compile_expression(build_query_expression({'$type': ['aws_lb', 'aws_elb']}))
+        compile_expression(build_module_expression({'$module': 'vpc'}))
+        compile_expression('resource_name')
+        assert expression_registry.stats()['hits'] == 4
+        assert expression_registry.stats()['misses'] == 0
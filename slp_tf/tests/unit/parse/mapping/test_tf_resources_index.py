@@ -0,0 +1,107 @@
+from pytest import mark, param
+
+from sl_util.sl_util.file_utils import get_byte_data
+from slp_tf.slp_tf.parse.mapping.jmespath.tf_custom_jmespath import jmespath_search
+from slp_tf.slp_tf.parse.mapping.search.functions import tf_query_mapping_functions
+from slp_tf.slp_tf.parse.mapping.search.functions.tf_query_mapping_functions import build_query_expression, query
+from slp_tf.slp_tf.parse.mapping.tf_sourcemodel import TerraformSourceModel
+from slp_tf.slp_tf.tf_searcher import load_tf_data
+from slp_tf.tests.resources import test_resource_paths
+
+TF_FILES = [
+    param(test_resource_paths.terraform_aws_multiple_components, id='multiple-components'),
+    param(test_resource_paths.terraform_aws_security_groups_components, id='security-groups'),
+    param(test_resource_paths.terraform_specific_functions, id='specific-functions'),
+    param(test_resource_paths.terraform_no_resources, id='no-resources')
+]
+
+
+def get_resource_types(data: dict) -> [str]:
+    return sorted({resource['resource_type'] for resource in data.get('resource', [])})
+
+
+class TestTerraformResourcesIndex:
+
+    @mark.parametrize('tf_file', TF_FILES)
+    def test_query_same_results_as_jmespath(self, tf_file: str):
+        # GIVEN a squashed Terraform source
+        data = load_tf_data([get_byte_data(tf_file)])
+        source_model = TerraformSourceModel(data)
+        resource_types = get_resource_types(data) + ['unknown_type']
+        resource_names = sorted({resource['resource_name'] for resource in data.get('resource', [])})
+
+        mapping_sources = [{'$type': resource_type} for resource_type in resource_types]
+        mapping_sources.append({'$type': resource_types})
+        mapping_sources.extend({'$type': resource_types, '$name': name} for name in resource_names)
+
+        for mapping_source in mapping_sources:
+            # WHEN the query is resolved with the index
+            result = source_model.resources_index.query(mapping_source)
+
+            # THEN the result is the same as the JMESPath query
+            assert result is not None
+            assert result == jmespath_search(build_query_expression(mapping_source), data)
+
+    @mark.parametrize('tf_file', TF_FILES)
+    @mark.parametrize('function', ['get', 'get_starts_with'])
+    def test_get_same_results_as_jmespath(self, tf_file: str, function: str):
+        # GIVEN a squashed Terraform source
+        data = load_tf_data([get_byte_data(tf_file)])
+        source_model = TerraformSourceModel(data)
+
+        for resource_type in get_resource_types(data) + ['aws_', 'unknown_type']:
+            expression = f"resource|{function}(@, '{resource_type}')"
+
+            # WHEN the expression is resolved with the index
+            result = source_model.resources_index.search(expression)
+
+            # THEN the result is the same as the JMESPath search
+            assert result is not None
+            assert result == jmespath_search(expression, data)
+
+    @mark.parametrize('mapping_source', [
+        param({'$type': {'$regex': '^aws_.*$'}}, id='regex'),
+        param({'$type': 'aws_vpc', '$props': 'cidr_block'}, id='props'),
+        param({'$type': 'aws\\_vpc'}, id='escaped value')
+    ])
+    def test_query_fallback_to_jmespath(self, mapping_source: dict, mocker):
+        # GIVEN a squashed Terraform source
+        data = load_tf_data([get_byte_data(test_resource_paths.terraform_aws_multiple_components)])
+        source_model = TerraformSourceModel(data)
+
+        # AND a query the index cannot resolve
+        assert source_model.resources_index.query(mapping_source) is None
+
+        # WHEN the query function is invoked
+        jmespath_search_spy = mocker.spy(tf_query_mapping_functions, 'jmespath_search')
+        query(mapping_source, tf_source_model=source_model, source_model_data=data)
+
+        # THEN the JMESPath query is run
+        assert jmespath_search_spy.call_count == 1
+
+    def test_index_built_once(self):
+        # GIVEN a squashed Terraform source
+        data = load_tf_data([get_byte_data(test_resource_paths.terraform_aws_multiple_components)])
+        source_model = TerraformSourceModel(data)
+
+        # WHEN the resources are queried several times
+        resources_index = source_model.resources_index
+        source_model.get_resources_by_type('aws_vpc')
+        source_model.query("resource|get(@, 'aws_vpc')")
+
+        # THEN the same index is used
+        assert source_model.resources_index is resources_index
+
+        # AND it is rebuilt when the data changes
+        source_model.data = data
+        assert source_model.resources_index is not resources_index
+
+    def test_not_squashed_resources_not_indexed(self):
+        # GIVEN a Terraform source whose resources are not squashed
+        data = {'resource': [{'aws_vpc': {'vpc': {'cidr_block': '10.0.0.0/16'}}}]}
+        source_model = TerraformSourceModel(data)
+
+        # WHEN the resources are searched
+        # THEN the JMESPath search is used
+        assert source_model.resources_index.search("resource|get(@, 'aws_vpc')") is None
+        assert len(source_model.query("resource|get(@, 'aws_vpc')")) == 1
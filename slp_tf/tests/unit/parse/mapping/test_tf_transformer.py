@@ -0,0 +1,113 @@
+from pytest import mark, param
+
+from otm.otm.entity.otm import OTM
+from otm.otm.entity.representation import RepresentationType
+from otm.otm.provider import Provider
+from slp_tf.slp_tf.parse.mapping.mappers.tf_backward_compatibility import TfDataflowNodeId
+from slp_tf.slp_tf.parse.mapping.tf_transformer import TerraformTransformer, ComponentLists, _get_hub_node_key
+
+IAC_MAPPING = {'trustzones': [{'id': 'tz', 'name': 'Trustzone', '$default': True}], 'components': [], 'dataflows': []}
+
+
+class DummyProvider(str, Provider):
+    DUMMY = ("DUMMY", "Dummy", RepresentationType.CODE)
+
+
+def build_component(component_id: str, component_type: str = 'type', parent: str = 'tz', **kwargs) -> dict:
+    return {'id': component_id, 'name': component_id, 'type': component_type, 'parent': parent, 'tags': [],
+            **kwargs}
+
+
+def transform_components(mocker, found_components: ComponentLists, id_map: dict = None) -> TerraformTransformer:
+    mocker.patch.object(TerraformTransformer, '_TerraformTransformer__find_components',
+                        return_value=found_components)
+    transformer = TerraformTransformer(threat_model=OTM('name', 'id', DummyProvider.DUMMY))
+    transformer.iac_mapping = IAC_MAPPING
+    transformer.id_map.update(id_map or {})
+    transformer.transform_components()
+    return transformer
+
+
+class TestTerraformTransformerComponents:
+
+    def test_skipped_and_repeated_components(self, mocker):
+        # GIVEN a list of components, some of them skipped
+        found_components = ComponentLists()
+        found_components.components = [build_component('c3'), build_component('c1'), build_component('c2')]
+        found_components.skip = [build_component('c1')]
+
+        # AND catchall components skipped, already added or repeated
+        found_components.catchall = [build_component('c4'), build_component('c2'), build_component('c1'),
+                                     build_component('c5', parent='c3'), build_component('c4')]
+
+        # WHEN the components are transformed
+        transformer = transform_components(mocker, found_components)
+
+        # THEN the components are added only once and keeping their order
+        components = transformer.threat_model.components
+        assert [component.id for component in components] == ['c3', 'c2', 'c4', 'c5']
+
+        # AND their parent types are calculated
+        assert [component.parent_type for component in components] == \
+               ['trustZone', 'trustZone', 'trustZone', 'component']
+
+    def test_components_without_parent_are_discarded(self, mocker):
+        # GIVEN a component whose parent does not exist
+        found_components = ComponentLists()
+        found_components.components = [build_component('c1'), build_component('c2', parent='unknown')]
+
+        # WHEN the components are transformed
+        transformer = transform_components(mocker, found_components)
+
+        # THEN only the component with a parent is added
+        assert [component.id for component in transformer.threat_model.components] == ['c1']
+
+    def test_singleton_components_are_grouped(self, mocker):
+        # GIVEN a regular component and several singleton components of the same type
+        found_components = ComponentLists()
+        found_components.components = [build_component('c1', component_type='other')]
+        found_components.singleton = [
+            build_component('s1', 'singleton', singleton_multiple_name='Singletons', singleton_multiple_tags=['t1']),
+            build_component('s2', 'singleton', singleton_multiple_name='Singletons', singleton_multiple_tags=['t2']),
+            build_component('s3', 'singleton', singleton_multiple_name='Singletons', singleton_multiple_tags=['t3'])
+        ]
+
+        # AND a catchall component already added as singleton
+        found_components.catchall = [build_component('s2', 'catchall')]
+
+        # AND the resources of the singleton components in the id map
+        id_map = {'aws_s3.one': 's1', 'aws_s3.two': 's2', 'aws_s3.three': 's3', 'aws_s3.four': 's3',
+                  'aws_multiple': ['s2', 's3']}
+
+        # WHEN the components are transformed
+        transformer = transform_components(mocker, found_components, id_map)
+
+        # THEN only the first singleton component is added
+        components = transformer.threat_model.components
+        assert [component.id for component in components] == ['c1', 's1']
+
+        # AND it groups the rest of singleton components
+        assert components[1].name == 'Singletons'
+        assert components[1].tags == ['t1', 't2', 't3']
+
+        # AND the resources of the grouped components are linked to the added component
+        assert transformer.id_map.store == {'aws_s3.one': 's1', 'aws_s3.two': 's1', 'aws_s3.three': 's1',
+                                            'aws_s3.four': 's1', 'aws_multiple': ['s2', 's3']}
+
+
+class TestHubDataflowsIndex:
+
+    @mark.parametrize('node_1,node_2', [
+        param('aws_security_group.sg', 'aws_security_group.sg', id='same type and name'),
+        param('aws_security_group.sg', 'sg', id='type and name and name'),
+        param('sg', 'aws_security_group.sg', id='name and type and name'),
+        param('aws_security_group.sg', 'aws_vpc.sg', id='different types'),
+        param('sg', 'other_sg', id='different names'),
+    ])
+    def test_equal_hub_nodes_share_key(self, node_1: str, node_2: str):
+        # GIVEN two hub nodes
+        node_1, node_2 = TfDataflowNodeId(node_1), TfDataflowNodeId(node_2)
+
+        # WHEN their keys in the hub dataflows index are calculated
+        # THEN the equal nodes have the same key
+        assert node_1 != node_2 or _get_hub_node_key(node_1) == _get_hub_node_key(node_2)
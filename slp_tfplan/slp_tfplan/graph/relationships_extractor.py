@@ -1,6 +1,6 @@
-from typing import Union, List
+from collections import deque
+from typing import Dict, Set, Union
 
-import networkx as nx
 from networkx import DiGraph
 
 from slp_tfplan.slp_tfplan.objects.tfplan_objects import TFPlanComponent
@@ -16,18 +16,26 @@ class RelationshipsExtractor:
         self.nodes_labels: dict = dict(self.graph.nodes(data='label'))
         self.labels_nodes: dict = {v: k for k, v in self.nodes_labels.items()}
 
+        # Nodes that cannot be traversed by a straight path, because they represent mapped resources
+        self.mapped_nodes: Set[str] = {
+            node for node, label in self.nodes_labels.items()
+            if remove_name_prefix(label) in self.mapped_resources_ids}
+
+        # Shortest straight path size from every mapped node to the labeled nodes reachable from it
+        self.straight_reachability: Dict[str, Dict[str, int]] = {}
+        self.__build_straight_reachability_index()
+
     def get_closest_resources(self, source_component: TFPlanComponent, target_candidates: [TFPlanComponent]) -> [str]:
         linked_resources = []
 
         min_size = 0
         for target_candidate in target_candidates:
-            path = self.__get_shortest_valid_path(
+            path_size = self.__get_shortest_valid_path_size(
                 source_component.tf_resource_id, target_candidate.tf_resource_id)
 
-            if not path:
+            if not path_size:
                 continue
 
-            path_size = len(path)
             if not linked_resources or path_size < min_size:
                 min_size = path_size
                 linked_resources = [target_candidate.id]
@@ -37,31 +45,49 @@ class RelationshipsExtractor:
         return linked_resources
 
     def exist_valid_path(self, source_label: str, target_label: str) -> bool:
-        return bool(self.__get_shortest_valid_path(source_label, target_label))
+        return bool(self.__get_shortest_valid_path_size(source_label, target_label))
 
-    def __get_shortest_valid_path(self, source_label: str, target_label: str) -> Union[List[str], None]:
+    def __get_shortest_valid_path_size(self, source_label: str, target_label: str) -> Union[int, None]:
         if not self.__are_equals_valid_graph_labels(source_label, target_label):
             return
 
-        source_node = self.labels_nodes[source_label]
-        target_node = self.labels_nodes[target_label]
+        return self.__get_straight_reachability(self.labels_nodes[source_label]).get(self.labels_nodes[target_label])
+
+    def __build_straight_reachability_index(self):
+        for node in self.mapped_nodes:
+            self.__get_straight_reachability(node)
 
-        shortest_path = None
-        if nx.has_path(self.graph, source_node, target_node):
-            for path in nx.all_simple_paths(self.graph, source=source_node, target=target_node):
-                if self.__is_straight_path(path):
-                    if not shortest_path or len(shortest_path) > len(path):
-                        shortest_path = path
+    def __get_straight_reachability(self, source_node: str) -> Dict[str, int]:
+        if source_node not in self.straight_reachability:
+            self.straight_reachability[source_node] = self.__calculate_straight_reachability(source_node)
 
-        return shortest_path
+        return self.straight_reachability[source_node]
+
+    def __calculate_straight_reachability(self, source_node: str) -> Dict[str, int]:
+        """
+        Breadth-first search from the source node which never goes through a mapped node, although mapped nodes
+        may be reached as the end of a path
+        :return: the length of the shortest straight path to every reachable labeled node
+        """
+        distances = {source_node: 0}
+
+        queue = deque([source_node])
+        while queue:
+            node = queue.popleft()
+            if node != source_node and node in self.mapped_nodes:
+                continue
+
+            for successor in self.graph.successors(node):
+                if successor in distances:
+                    continue
+
+                distances[successor] = distances[node] + 1
+                queue.append(successor)
+
+        return {node: distance for node, distance in distances.items()
+                if distance and self.nodes_labels[node] is not None}
 
     def __are_equals_valid_graph_labels(self, source_label: str, target_label: str) -> bool:
         return source_label != target_label \
                 and source_label in self.labels_nodes \
                 and target_label in self.labels_nodes
-
-    def __is_straight_path(self, path: list) -> bool:
-        return len(self.mapped_resources_ids & self.__nodes_to_labels(path[1:-1])) == 0
-
-    def __nodes_to_labels(self, path: []) -> set:
-        return set(filter(lambda x: x is not None, map(lambda p: remove_name_prefix(self.nodes_labels[p]), path)))
@@ -0,0 +1,186 @@
+"""
+Reader for the subset of the DOT language emitted by the `terraform graph` command. It builds the DiGraph directly
+from the source in a single pass, without the graphviz native library. The supported grammar is:
+
+    graph     : [strict] digraph [ID] '{' stmt_list '}'
+    stmt      : ID '=' ID
+              | (graph | node | edge) attr_list
+              | subgraph [ID] '{' stmt_list '}'
+              | ID [attr_list]
+              | ID ('->' ID)+ [attr_list]
+    attr_list : '[' [ID '=' ID [(',' | ';')]]* ']'
+
+where statements may be separated by ';' and IDs may be quoted strings, alphanumeric strings or numerals.
+"""
+
+import re
+from typing import Iterator, Tuple, Dict, Union
+
+from networkx import DiGraph
+
+# Whitespaces and comments are consumed along with the following token
+_TOKENS_REGEX = re.compile(r'''
+    (?:\s+|//[^\n]*|\#[^\n]*|/\*.*?\*/)*
+    (?:
+        (?P<quoted>"(?:[^"\\]|\\.)*")
+        |(?P<id>[A-Za-z_\x80-\U0010ffff][\w\x80-\U0010ffff]*|-?(?:\.\d+|\d+(?:\.\d*)?))
+        |(?P<symbol>->|[{}\[\]=;,])
+        |(?P<invalid>\S)
+    )
+''', re.VERBOSE | re.DOTALL)
+
+_ESCAPED_LINE_BREAK_REGEX = re.compile(r'\\\r?\n')
+
+ID = 'id'
+QUOTED_ID = 'quoted_id'
+SYMBOL = 'symbol'
+END = 'end'
+
+
+class DotParsingError(Exception):
+    pass
+
+
+def _unquote(value: str) -> str:
+    value = value[1:-1]
+    if '\\' not in value:
+        return value
+
+    return _ESCAPED_LINE_BREAK_REGEX.sub('', value).replace('\\"', '"')
+
+
+def _tokenize(source: str) -> Iterator[Tuple[str, str]]:
+    for match in _TOKENS_REGEX.finditer(source):
+        kind = match.lastgroup
+        value = match.group(kind)
+        if kind == 'quoted':
+            yield QUOTED_ID, _unquote(value)
+        elif kind == 'id':
+            yield ID, value
+        elif kind == 'symbol':
+            yield SYMBOL, value
+        else:
+            raise DotParsingError(f'Unexpected character {value!r} at position {match.start(kind)}')
+
+    yield END, ''
+
+
+class TfgraphDotReader:
+
+    def __init__(self, source: str):
+        self.tokens = _tokenize(source)
+        self.current: Tuple[str, str] = next(self.tokens)
+        self.graph = DiGraph()
+
+    def read(self) -> DiGraph:
+        self.__accept_keyword('strict')
+
+        if not self.__accept_keyword('digraph'):
+            raise DotParsingError('Only directed graphs are supported')
+
+        if self.current[0] in (ID, QUOTED_ID):
+            self.graph.name = self.__next_id()
+
+        self.__parse_block(is_root=True)
+
+        if self.current[0] != END:
+            raise DotParsingError(f'Unexpected content after the graph: {self.current[1]!r}')
+
+        return self.graph
+
+    def __parse_block(self, is_root: bool = False):
+        self.__expect_symbol('{')
+
+        while not self.__accept_symbol('}'):
+            if self.current[0] == END:
+                raise DotParsingError('Unexpected end of graph')
+
+            self.__parse_statement(is_root)
+            self.__accept_symbol(';')
+
+    def __parse_statement(self, is_root: bool):
+        if self.__accept_keyword('subgraph'):
+            if self.current[0] in (ID, QUOTED_ID):
+                self.__next_id()
+            self.__parse_block()
+            return
+
+        if self.__accept_keyword('graph'):
+            attributes = self.__parse_attributes()
+            if is_root:
+                self.graph.graph.update(attributes)
+            return
+
+        if self.__accept_keyword('node') or self.__accept_keyword('edge'):
+            self.__parse_attributes()
+            return
+
+        node = self.__next_id()
+
+        if self.__accept_symbol('='):
+            value = self.__next_id()
+            if is_root:
+                self.graph.graph[node] = value
+            return
+
+        nodes = [node]
+        while self.__accept_symbol('->'):
+            nodes.append(self.__next_id())
+
+        attributes = self.__parse_attributes()
+
+        if len(nodes) == 1:
+            self.graph.add_node(node, **attributes)
+        else:
+            self.graph.add_edges_from(zip(nodes, nodes[1:]), **attributes)
+
+    def __parse_attributes(self) -> Dict[str, str]:
+        attributes = {}
+
+        while self.__accept_symbol('['):
+            while not self.__accept_symbol(']'):
+                key = self.__next_id()
+                self.__expect_symbol('=')
+                attributes[key] = self.__next_id()
+
+                if not self.__accept_symbol(','):
+                    self.__accept_symbol(';')
+
+        return attributes
+
+    def __next_id(self) -> str:
+        kind, value = self.current
+        if kind not in (ID, QUOTED_ID):
+            raise DotParsingError(f'Expected an identifier but found {value!r}')
+
+        self.__advance()
+        return value
+
+    def __expect_symbol(self, symbol: str):
+        if not self.__accept_symbol(symbol):
+            raise DotParsingError(f'Expected {symbol!r} but found {self.current[1]!r}')
+
+    def __accept_symbol(self, symbol: str) -> bool:
+        if self.current == (SYMBOL, symbol):
+            self.__advance()
+            return True
+
+        return False
+
+    def __accept_keyword(self, keyword: str) -> bool:
+        kind, value = self.current
+        if kind == ID and value.lower() == keyword:
+            self.__advance()
+            return True
+
+        return False
+
+    def __advance(self):
+        self.current = next(self.tokens)
+
+
+def read_tfgraph_dot(source: Union[bytes, str], encoding: str = 'utf-8') -> DiGraph:
+    if isinstance(source, bytes):
+        source = source.decode(encoding)
+
+    return TfgraphDotReader(source).read()
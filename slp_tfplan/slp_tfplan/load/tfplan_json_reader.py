@@ -0,0 +1,113 @@
+"""
+Readers for the JSON tfplan generated by `terraform show -json`. The tfplan is parsed only once and just the sections
+used by the processor are kept, that is, `planned_values` and `configuration.root_module`. The rest of the document
+(prior state, resource changes, variables...) is discarded as soon as possible.
+"""
+
+import json
+import os
+from typing import Dict, Union, Iterator, Tuple, Any
+
+TFPLAN_READER_ENV_VAR = 'STARTLEFT_TFPLAN_READER'
+JSON_TFPLAN_READER = 'json'
+INCREMENTAL_TFPLAN_READER = 'incremental'
+
+PLANNED_VALUES = 'planned_values'
+CONFIGURATION = 'configuration'
+ROOT_MODULE = 'root_module'
+CONFIGURATION_ROOT_MODULE = f'{CONFIGURATION}.{ROOT_MODULE}'
+
+
+def extract_tfplan_sections(document: Dict) -> Union[Dict, None]:
+    if not isinstance(document, dict):
+        return None
+
+    tfplan = {}
+
+    if PLANNED_VALUES in document:
+        tfplan[PLANNED_VALUES] = document[PLANNED_VALUES]
+
+    configuration = document.get(CONFIGURATION)
+    if isinstance(configuration, dict):
+        tfplan[CONFIGURATION] = {ROOT_MODULE: configuration[ROOT_MODULE]} if ROOT_MODULE in configuration else {}
+
+    return tfplan
+
+
+def read_tfplan_with_json(source: bytes) -> Union[Dict, None]:
+    return extract_tfplan_sections(json.loads(source))
+
+
+def _get_section(prefix: str) -> Union[str, None]:
+    for section in (PLANNED_VALUES, CONFIGURATION_ROOT_MODULE):
+        if prefix == section or prefix.startswith(f'{section}.'):
+            return section
+
+
+def _build_tfplan_sections(events: Iterator[Tuple[str, str, Any]]) -> Union[Dict, None]:
+    import ijson
+
+    prefix, event, _ = next(events)
+    if prefix != '' or event != 'start_map':
+        return None
+
+    builders = {}
+    has_configuration = False
+
+    for prefix, event, value in events:
+        if prefix == CONFIGURATION and event == 'start_map':
+            has_configuration = True
+
+        section = _get_section(prefix)
+        if not section:
+            continue
+
+        if section not in builders:
+            builders[section] = ijson.ObjectBuilder()
+        builders[section].event(event, value)
+
+    tfplan = {}
+
+    if PLANNED_VALUES in builders:
+        tfplan[PLANNED_VALUES] = builders[PLANNED_VALUES].value
+
+    if has_configuration:
+        tfplan[CONFIGURATION] = {ROOT_MODULE: builders[CONFIGURATION_ROOT_MODULE].value} \
+            if CONFIGURATION_ROOT_MODULE in builders else {}
+
+    return tfplan
+
+
+def read_tfplan_incrementally(source: bytes) -> Union[Dict, None]:
+    """
+    Builds the tfplan sections from the parsing events, so the discarded parts of the document are never
+    materialized. It requires the optional ijson library.
+    """
+    import ijson
+
+    return _build_tfplan_sections(ijson.parse(source, use_float=True))
+
+
+TFPLAN_READERS = {
+    JSON_TFPLAN_READER: read_tfplan_with_json,
+    INCREMENTAL_TFPLAN_READER: read_tfplan_incrementally
+}
+
+
+def get_tfplan_reader(reader_name: str = None):
+    reader_name = reader_name or os.getenv(TFPLAN_READER_ENV_VAR, JSON_TFPLAN_READER)
+    if reader_name not in TFPLAN_READERS:
+        raise ValueError(f'Unknown tfplan reader {reader_name}. Available readers are {list(TFPLAN_READERS)}')
+
+    return TFPLAN_READERS[reader_name]
+
+
+def read_tfplan(source: bytes, reader_name: str = None) -> Union[Dict, None]:
+    """
+    :return: the tfplan sections used by the processor, or None if the source is not a JSON object
+    """
+    reader = get_tfplan_reader(reader_name)
+    try:
+        return reader(source)
+    except Exception:
+        return None
@@ -1,25 +1,58 @@
+import os
 from typing import List, Dict, Union
 
-import pygraphviz
-from networkx import nx_agraph, DiGraph
+from networkx import DiGraph
 
-from sl_util.sl_util.json_utils import yaml_reader
 from sl_util.sl_util.file_utils import read_byte_data
 
 from slp_base import ProviderLoader, LoadingIacFileError
+from slp_tfplan.slp_tfplan.load.tfgraph_dot_reader import read_tfgraph_dot
+from slp_tfplan.slp_tfplan.load.tfplan_json_reader import read_tfplan
 from slp_tfplan.slp_tfplan.load.tfplan_to_resource_dict import TfplanToResourceDict
 
+TFGRAPH_LOADER_ENV_VAR = 'STARTLEFT_TFGRAPH_LOADER'
+DOT_READER_TFGRAPH_LOADER = 'dot-reader'
+PYGRAPHVIZ_TFGRAPH_LOADER = 'pygraphviz'
+
 
 def load_tfplan(source: bytes) -> Dict:
-    try:
-        return yaml_reader(source)
-    except Exception:
-        pass
+    return read_tfplan(source)
+
+
+def load_tfgraph_with_pygraphviz(source: bytes) -> DiGraph:
+    # pygraphviz requires the graphviz native library, so it is an optional dependency, installed with the
+    # tfgraph-pygraphviz extra, and it is only imported when explicitly configured
+    import pygraphviz
+    from networkx import nx_agraph
+
+    return nx_agraph.from_agraph(pygraphviz.AGraph(read_byte_data(source)))
+
+
+TFGRAPH_LOADERS = {
+    DOT_READER_TFGRAPH_LOADER: read_tfgraph_dot,
+    PYGRAPHVIZ_TFGRAPH_LOADER: load_tfgraph_with_pygraphviz
+}
 
 
-def load_tfgraph(source: bytes) -> DiGraph:
+def get_tfgraph_loader(loader_name: str = None):
+    loader_name = loader_name or os.getenv(TFGRAPH_LOADER_ENV_VAR, DOT_READER_TFGRAPH_LOADER)
+    if loader_name not in TFGRAPH_LOADERS:
+        raise ValueError(f'Unknown tfgraph loader {loader_name}. Available loaders are {list(TFGRAPH_LOADERS)}')
+
+    return TFGRAPH_LOADERS[loader_name]
+
+
+def load_tfgraph(source: bytes, loader_name: str = None) -> DiGraph:
+    try:
+        loader = get_tfgraph_loader(loader_name)
+    except ValueError as e:
+        raise generate_invalid_tfgraph_loader_error(str(e))
+
     try:
-        return nx_agraph.from_agraph(pygraphviz.AGraph(read_byte_data(source)))
+        return loader(source)
+    except ImportError as e:
+        raise generate_invalid_tfgraph_loader_error(
+            f'The tfgraph loader dependencies are not installed, install the startleft[tfgraph-pygraphviz] extra: {e}')
     except Exception:
         pass
 
@@ -31,6 +64,13 @@ def generate_invalid_iac_files_error() -> LoadingIacFileError:
     )
 
 
+def generate_invalid_tfgraph_loader_error(message: str) -> LoadingIacFileError:
+    return LoadingIacFileError(
+        title='Invalid tfgraph loader configuration',
+        message=message
+    )
+
+
 def generate_wrong_number_of_sources_error() -> LoadingIacFileError:
     return LoadingIacFileError(
         title='Wrong number of files',
@@ -40,8 +80,10 @@ def generate_wrong_number_of_sources_error() -> LoadingIacFileError:
 
 class TFPlanLoader(ProviderLoader):
 
-    def __init__(self, sources: List[bytes]):
+    def __init__(self, sources: List[bytes], parsed_tfplans: List[Union[Dict, None]] = None):
         self.sources = sources
+        # tfplans already parsed for every source, or None if the source is not a tfplan
+        self.parsed_tfplans = parsed_tfplans
 
         self.tfplan: Union[Dict, None] = None
         self.tfgraph: Union[Dict, None] = None
@@ -63,9 +105,9 @@ class TFPlanLoader(ProviderLoader):
         if len(self.sources) != 2:
             raise generate_wrong_number_of_sources_error()
 
-        for source in self.sources:
+        for index, source in enumerate(self.sources):
             if self.tfplan is None:
-                self.tfplan = load_tfplan(source)
+                self.tfplan = self.parsed_tfplans[index] if self.parsed_tfplans else load_tfplan(source)
                 if self.tfplan is not None:
                     continue
 
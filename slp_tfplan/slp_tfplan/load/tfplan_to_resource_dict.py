@@ -1,5 +1,5 @@
 import re
-from typing import Dict, List
+from typing import Dict, List, Iterator
 
 
 def map_resource_properties(resource: Dict) -> {}:
@@ -15,7 +15,7 @@ def map_resource_properties(resource: Dict) -> {}:
 
 
 def is_not_cloned_resource(resource: Dict) -> bool:
-    return 'index' not in resource or resource['index'] == '0' or resource['index'] == 'zero'
+    return 'index' not in resource or resource['index'] in (0, '0', 'zero')
 
 
 def get_resource_id(resource: Dict) -> str:
@@ -46,31 +46,49 @@ def remove_name_prefix(address: str) -> str:
     return re.sub(r'(.*)_name_prefix$', r'\1', address) if address else None
 
 
+def index_resources_by_address(resources: List[Dict]) -> Dict[str, Dict]:
+    resources_by_address = {}
+    for resource in resources:
+        resources_by_address.setdefault(resource['address'], resource)
+
+    return resources_by_address
+
+
 class TfplanToResourceDict:
-    def __init__(self, resources_configuration: Dict):
-        self.resources_configuration = resources_configuration
+    def __init__(self, resources_configuration: List[Dict]):
+        self.resources_configuration = index_resources_by_address(resources_configuration)
 
     def map_modules(self, modules: List[Dict], parent: str = None) -> List[Dict]:
-        mapped_modules = []
-        resources = []
+        return list(self.iterate_modules(modules, parent))
+
+    def iterate_modules(self, modules: List[Dict], parent: str = None) -> Iterator[Dict]:
+        """
+        Depth-first traversal of the modules yielding their mapped resources, where the resources of each module are
+        followed by the ones in its child modules. Sibling modules with the same address are only mapped once.
+        """
+        pending_modules = [(iter(modules), parent, set())]
+
+        while pending_modules:
+            siblings, siblings_parent, mapped_modules = pending_modules[-1]
 
-        for module in modules:
-            module_address = get_module_address(module, parent)
+            module = next(siblings, None)
+            if module is None:
+                pending_modules.pop()
+                continue
+
+            module_address = get_module_address(module, siblings_parent)
             if module_address in mapped_modules:
                 continue
+            mapped_modules.add(module_address)
 
             if 'resources' in module:
-                resources.extend(self.__map_resources(module['resources'], module_address))
+                yield from self.__map_resources(module['resources'], module_address)
 
             if 'child_modules' in module:
-                resources.extend(self.map_modules(module['child_modules'], module_address))
-
-            mapped_modules.append(module_address)
+                pending_modules.append((iter(module['child_modules']), module_address, set()))
 
-        return resources
-
-    def __map_resources(self, resources: List[Dict], parent: str = None) -> List[Dict]:
-        return list(map(lambda r: self.__map_resource(r, parent), filter(is_not_cloned_resource, resources)))
+    def __map_resources(self, resources: List[Dict], parent: str = None) -> Iterator[Dict]:
+        return map(lambda r: self.__map_resource(r, parent), filter(is_not_cloned_resource, resources))
 
     def __map_resource(self, resource: Dict, parent: str = None) -> Dict:
         return {
@@ -78,8 +96,5 @@ class TfplanToResourceDict:
             'resource_name': get_resource_name(resource, parent),
             'resource_type': resource['type'],
             'resource_properties':
-                self.__get_resource_configuration(resource['address']) or map_resource_properties(resource)
+                self.resources_configuration.get(resource['address']) or map_resource_properties(resource)
         }
-
-    def __get_resource_configuration(self, resource_address: str) -> Dict:
-        return next(filter(lambda r: r['address'] == resource_address, self.resources_configuration), None)
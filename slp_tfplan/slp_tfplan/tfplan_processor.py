@@ -21,14 +21,17 @@ class TFPlanProcessor(OTMProcessor):
         self.mappings = mappings
         self.sources = sources
 
+        self.terraform_validator = None
         self.terraform_loader = None
         self.mapping_loader = None
 
     def get_provider_validator(self) -> ProviderValidator:
-        return TFPlanValidator(self.sources)
+        self.terraform_validator = TFPlanValidator(self.sources)
+        return self.terraform_validator
 
     def get_provider_loader(self) -> ProviderLoader:
-        self.terraform_loader = TFPlanLoader(self.sources)
+        parsed_tfplans = self.terraform_validator.get_parsed_tfplans() if self.terraform_validator else None
+        self.terraform_loader = TFPlanLoader(self.sources, parsed_tfplans)
         return self.terraform_loader
 
     def get_mapping_validator(self) -> MappingValidator:
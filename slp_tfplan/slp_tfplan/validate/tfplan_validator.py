@@ -1,14 +1,13 @@
-import json
 import logging
 import re
-from json import JSONDecodeError
-from typing import List, Dict
+from typing import List, Dict, Union
 
 from sl_util.sl_util.file_utils import get_file_type_by_content, read_byte_data
 from slp_base import IacFileNotValidError, IacType
 from slp_base.slp_base import ProviderValidator
 from slp_base.slp_base.provider_validator import generate_size_error, generate_content_type_error
 from slp_base.slp_base.schema import Schema
+from slp_tfplan.slp_tfplan.load.tfplan_json_reader import read_tfplan
 
 logger = logging.getLogger(__name__)
 
@@ -23,16 +22,19 @@ TFPLAN_SCHEMA_FILENAME = 'tfplan_schema.json'
 VALID_TFGRAPH_REGEX = r"\bdigraph[\s\S]*\bsubgraph[\s\S]*"
 
 
-def is_valid_tfplan(tfplan: bytes) -> bool:
-    schema = Schema.from_package('slp_tfplan', TFPLAN_SCHEMA_FILENAME)
-    try:
-        schema.validate(json.loads(tfplan))
-    except JSONDecodeError:
+def is_valid_tfplan_document(tfplan: Union[Dict, None]) -> bool:
+    if tfplan is None:
         return False
 
+    schema = Schema.from_package('slp_tfplan', TFPLAN_SCHEMA_FILENAME)
+    schema.validate(tfplan)
     return schema.valid
 
 
+def is_valid_tfplan(tfplan: bytes) -> bool:
+    return is_valid_tfplan_document(read_tfplan(tfplan))
+
+
 def is_valid_tfgraph(tfgraph: bytes) -> bool:
     return bool(re.match(VALID_TFGRAPH_REGEX, read_byte_data(tfgraph)))
 
@@ -44,6 +46,8 @@ class TFPlanValidator(ProviderValidator):
         self.sources = sources
 
         self.param_sources: Dict[str, bytes] = {}
+        # Parsed tfplan for every valid tfplan source, so it can be reused by the loader
+        self.parsed_tfplans: List[Union[Dict, None]] = []
 
     def validate(self):
         logger.info('Validating Terraform Plan file')
@@ -73,9 +77,13 @@ class TFPlanValidator(ProviderValidator):
         if source_types.intersection(IacType.TFPLAN.valid_mime) != source_types:
             raise generate_content_type_error(IacType.TFPLAN, 'iac_file', IacFileNotValidError)
 
+    def get_parsed_tfplans(self) -> List[Union[Dict, None]]:
+        return self.parsed_tfplans
+
     def __match_params_and_sources(self):
-        is_first_source_tfplan = is_valid_tfplan(self.sources[0])
-        is_second_source_tfplan = is_valid_tfplan(self.sources[1])
+        self.parsed_tfplans = [self.__parse_valid_tfplan(source) for source in self.sources]
+        is_first_source_tfplan = self.parsed_tfplans[0] is not None
+        is_second_source_tfplan = self.parsed_tfplans[1] is not None
 
         if is_first_source_tfplan and is_second_source_tfplan:
             raise IacFileNotValidError(
@@ -91,6 +99,11 @@ class TFPlanValidator(ProviderValidator):
             'tfgraph': self.sources[0] if is_second_source_tfplan else self.sources[1]
         }
 
+    @staticmethod
+    def __parse_valid_tfplan(source: bytes) -> Union[Dict, None]:
+        tfplan = read_tfplan(source)
+        return tfplan if is_valid_tfplan_document(tfplan) else None
+
     def __validate_file_sizes(self):
         if len(self.param_sources['tfplan']) > MAX_TFPLAN_FILE_SIZE or \
                 len(self.param_sources['tfgraph']) > MAX_TFGRAPH_FILE_SIZE:
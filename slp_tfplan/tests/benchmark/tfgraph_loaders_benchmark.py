@@ -0,0 +1,63 @@
+"""
+Compares the time needed by the available tfgraph loaders to load large generated graphs.
+
+Usage:
+    python -m slp_tfplan.tests.benchmark.tfgraph_loaders_benchmark [resources_count ...]
+"""
+import random
+import sys
+import timeit
+
+from slp_tfplan.slp_tfplan.load.tfplan_loader import load_tfgraph, TFGRAPH_LOADERS
+
+DEFAULT_RESOURCES_COUNTS = [100, 1000, 5000]
+RESOURCE_TYPES = ['aws_instance', 'aws_subnet', 'aws_vpc', 'aws_security_group', 'aws_lb', 'aws_ecs_service']
+DEPENDENCIES_PER_RESOURCE = 3
+REPETITIONS = 3
+
+PROVIDER_NODE = '[root] provider[\\"registry.terraform.io/hashicorp/aws\\"]'
+
+
+def generate_tfgraph(resources_count: int) -> bytes:
+    """
+    Generates a graph with the same shape as the ones emitted by `terraform graph`, where every resource depends on
+    some previous resources, on a variable and on the provider
+    """
+    random.seed(resources_count)
+    resources = [f'{random.choice(RESOURCE_TYPES)}.resource_{i}' for i in range(resources_count)]
+    variables = [f'var.variable_{i}' for i in range(resources_count // 10 + 1)]
+
+    lines = ['digraph {', '\tcompound = "true"', '\tnewrank = "true"', '\tsubgraph "root" {']
+
+    for label in resources + variables:
+        lines.append(f'\t\t"[root] {label} (expand)" [label = "{label}", shape = "box"]')
+    lines.append(f'\t\t"{PROVIDER_NODE}" [label = "provider[\\"registry.terraform.io/hashicorp/aws\\"]", '
+                 f'shape = "diamond"]')
+
+    for index, label in enumerate(resources):
+        node = f'"[root] {label} (expand)"'
+        for dependency in random.sample(resources[:index], min(index, DEPENDENCIES_PER_RESOURCE)):
+            lines.append(f'\t\t{node} -> "[root] {dependency} (expand)"')
+        lines.append(f'\t\t{node} -> "[root] {random.choice(variables)} (expand)"')
+        lines.append(f'\t\t{node} -> "{PROVIDER_NODE}"')
+
+    lines.extend(['\t}', '}'])
+    return '\n'.join(lines).encode()
+
+
+def run_benchmark(resources_counts: [int]):
+    print(f'{"resources":>10} {"size (KB)":>10} ' + ' '.join(f'{name:>15}' for name in TFGRAPH_LOADERS))
+
+    for resources_count in resources_counts:
+        source = generate_tfgraph(resources_count)
+
+        times = []
+        for loader_name in TFGRAPH_LOADERS:
+            elapsed = min(timeit.repeat(lambda: load_tfgraph(source, loader_name), number=1, repeat=REPETITIONS))
+            times.append(f'{elapsed * 1000:>13.1f}ms')
+
+        print(f'{resources_count:>10} {len(source) // 1024:>10} ' + ' '.join(times))
+
+
+if __name__ == '__main__':
+    run_benchmark([int(count) for count in sys.argv[1:]] or DEFAULT_RESOURCES_COUNTS)
@@ -0,0 +1,137 @@
+from typing import List, Union
+
+import networkx as nx
+from networkx import DiGraph
+from pytest import mark, param
+
+from sl_util.sl_util.file_utils import get_byte_data
+from slp_tfplan.slp_tfplan.graph.relationships_extractor import RelationshipsExtractor
+from slp_tfplan.slp_tfplan.load.tfplan_loader import load_tfgraph
+from slp_tfplan.slp_tfplan.load.tfplan_to_resource_dict import remove_name_prefix
+from slp_tfplan.tests.resources.test_resource_paths import tfgraph_elb, tfgraph_sgs, tfgraph_official
+from slp_tfplan.tests.util.builders import build_mocked_tfplan_component, build_tfgraph
+
+MAPPED_RESOURCES_PREFIX = 'aws_'
+
+
+def get_mapped_labels(graph: DiGraph) -> List[str]:
+    return sorted({remove_name_prefix(label) for _, label in graph.nodes(data='label')
+                   if label and label.startswith(MAPPED_RESOURCES_PREFIX)})
+
+
+def build_component_from_label(label: str):
+    tf_type, name = label.split('.', 1)
+    return build_mocked_tfplan_component({'component_name': name, 'tf_type': tf_type})
+
+
+def get_reference_shortest_straight_path(graph: DiGraph, mapped_resources_ids: set,
+                                         source_label: str, target_label: str) -> Union[List[str], None]:
+    """
+    Brute force implementation of the straight path calculation, enumerating every simple path between the nodes
+    """
+    nodes_labels = dict(graph.nodes(data='label'))
+    labels_nodes = {v: k for k, v in nodes_labels.items()}
+
+    if source_label == target_label or source_label not in labels_nodes or target_label not in labels_nodes:
+        return None
+
+    shortest_path = None
+    for path in nx.all_simple_paths(graph, source=labels_nodes[source_label], target=labels_nodes[target_label]):
+        path_labels = {remove_name_prefix(nodes_labels[node]) for node in path[1:-1]} - {None}
+        if not mapped_resources_ids & path_labels:
+            if not shortest_path or len(shortest_path) > len(path):
+                shortest_path = path
+
+    return shortest_path
+
+
+def get_reference_closest_resources(graph: DiGraph, mapped_resources_ids: set,
+                                    source_label: str, target_labels: List[str]) -> List[str]:
+    closest_resources = []
+    min_size = 0
+    for target_label in target_labels:
+        path = get_reference_shortest_straight_path(graph, mapped_resources_ids, source_label, target_label)
+        if not path:
+            continue
+
+        if not closest_resources or len(path) < min_size:
+            min_size = len(path)
+            closest_resources = [target_label]
+        elif len(path) == min_size:
+            closest_resources.append(target_label)
+
+    return closest_resources
+
+
+class TestRelationshipsExtractor:
+
+    @mark.parametrize('tfgraph', [
+        param(tfgraph_elb, id='elb-example'),
+        param(tfgraph_sgs, id='sgs-example'),
+        param(tfgraph_official, id='official-example')
+    ])
+    def test_same_results_as_all_simple_paths(self, tfgraph: str):
+        # GIVEN a tfgraph from the tfplan examples
+        graph = load_tfgraph(get_byte_data(tfgraph))
+
+        # AND all the AWS resources in the graph mapped as components
+        mapped_labels = get_mapped_labels(graph)
+        components = [build_component_from_label(label) for label in mapped_labels]
+
+        # WHEN the RelationshipsExtractor is created
+        relationships_extractor = RelationshipsExtractor(graph=graph, mapped_resources_ids=mapped_labels)
+
+        for source_label in mapped_labels:
+            # THEN the existence of paths is the same that enumerating every simple path
+            for target_label in mapped_labels:
+                expected = bool(get_reference_shortest_straight_path(
+                    graph, set(mapped_labels), source_label, target_label))
+                assert relationships_extractor.exist_valid_path(source_label, target_label) == expected
+
+            # AND the closest resources are the same that enumerating every simple path
+            source_component = build_component_from_label(source_label)
+            assert relationships_extractor.get_closest_resources(source_component, components) == \
+                   get_reference_closest_resources(graph, set(mapped_labels), source_label, mapped_labels)
+
+    def test_path_through_mapped_resource_is_not_straight(self):
+        # GIVEN a graph where the only path between two resources goes through a third mapped resource
+        graph = build_tfgraph([('aws_instance.a', 'aws_subnet.b'), ('aws_subnet.b', 'aws_vpc.c'), ('aws_vpc.c', None)])
+        mapped_resources_ids = ['aws_instance.a', 'aws_subnet.b', 'aws_vpc.c']
+
+        # WHEN RelationshipsExtractor::exist_valid_path is invoked
+        relationships_extractor = RelationshipsExtractor(graph=graph, mapped_resources_ids=mapped_resources_ids)
+
+        # THEN the direct relationships are valid paths
+        assert relationships_extractor.exist_valid_path('aws_instance.a', 'aws_subnet.b')
+        assert relationships_extractor.exist_valid_path('aws_subnet.b', 'aws_vpc.c')
+
+        # AND the path through the mapped resource is not valid
+        assert not relationships_extractor.exist_valid_path('aws_instance.a', 'aws_vpc.c')
+
+        # AND the path through a non mapped resource is valid
+        relationships_extractor = RelationshipsExtractor(
+            graph=graph, mapped_resources_ids=['aws_instance.a', 'aws_vpc.c'])
+        assert relationships_extractor.exist_valid_path('aws_instance.a', 'aws_vpc.c')
+
+    def test_straight_reachability_index_built_once(self, mocker):
+        # GIVEN a graph with a chain of mapped resources
+        graph = build_tfgraph([('aws_instance.a', 'aws_subnet.b'), ('aws_subnet.b', 'aws_vpc.c'), ('aws_vpc.c', None)])
+        mapped_resources_ids = ['aws_instance.a', 'aws_subnet.b', 'aws_vpc.c']
+
+        # WHEN the RelationshipsExtractor is created
+        relationships_extractor = RelationshipsExtractor(graph=graph, mapped_resources_ids=mapped_resources_ids)
+
+        # THEN the straight reachability is precalculated for every mapped resource
+        assert relationships_extractor.straight_reachability == {
+            '[root] aws_instance.a (expand)': {'[root] aws_subnet.b (expand)': 1},
+            '[root] aws_subnet.b (expand)': {'[root] aws_vpc.c (expand)': 1},
+            '[root] aws_vpc.c (expand)': {}
+        }
+
+        # AND the graph is not traversed again when the paths are queried
+        successors_spy = mocker.spy(graph, 'successors')
+        for source_label in mapped_resources_ids:
+            for target_label in mapped_resources_ids:
+                relationships_extractor.exist_valid_path(source_label, target_label)
+
+        assert successors_spy.call_count == 0
@@ -0,0 +1,162 @@
+import importlib.util
+from unittest.mock import Mock
+
+from networkx import DiGraph
+from pytest import mark, param, raises
+
+from sl_util.sl_util.file_utils import get_byte_data
+from slp_base import LoadingIacFileError
+from slp_tfplan.slp_tfplan.load.tfgraph_dot_reader import read_tfgraph_dot, DotParsingError
+from slp_tfplan.slp_tfplan.load.tfplan_loader import load_tfgraph, DOT_READER_TFGRAPH_LOADER, \
+    PYGRAPHVIZ_TFGRAPH_LOADER, TFGRAPH_LOADER_ENV_VAR, TFPlanLoader
+from slp_tfplan.tests.resources.test_resource_paths import tfgraph_elb, tfgraph_sgs, tfgraph_official, \
+    tfplan_elb, invalid_yaml
+
+
+# pygraphviz is an optional dependency, installed with the tfgraph-pygraphviz extra
+requires_pygraphviz = mark.skipif(importlib.util.find_spec('pygraphviz') is None, reason='pygraphviz is not installed')
+
+
+class TestTfgraphDotReader:
+
+    @mark.parametrize('tfgraph', [
+        param(tfgraph_elb, id='elb-example'),
+        param(tfgraph_sgs, id='sgs-example'),
+        param(tfgraph_official, id='official-example')
+    ])
+    @requires_pygraphviz
+    def test_same_graph_as_pygraphviz(self, tfgraph: str):
+        # GIVEN a tfgraph generated by terraform
+        source = get_byte_data(tfgraph)
+
+        # WHEN the tfgraph is loaded with the DOT reader and with pygraphviz
+        graph = load_tfgraph(source, DOT_READER_TFGRAPH_LOADER)
+        pygraphviz_graph = load_tfgraph(source, PYGRAPHVIZ_TFGRAPH_LOADER)
+
+        # THEN the nodes and their attributes are the same
+        assert dict(graph.nodes(data=True)) == dict(pygraphviz_graph.nodes(data=True))
+
+        # AND the edges are the same
+        assert set(graph.edges()) == set(pygraphviz_graph.edges())
+
+    def test_read_dot_statements(self):
+        # GIVEN a DOT source with every supported statement
+        source = b'''
+            strict digraph "name" {
+                compound = "true"; newrank = true
+                node [shape = "box"]
+                subgraph "root" {
+                    "[root] a" [label = "provider[\\"registry\\"]", shape = "diamond"]
+                    b [label = "b"; shape = box]
+                    "[root] a" -> b -> c [color = "red"]
+                    // comment
+                    d -> "[root] a"
+                }
+            }'''
+
+        # WHEN read_tfgraph_dot is invoked
+        graph = read_tfgraph_dot(source)
+
+        # THEN a DiGraph is returned with its graph attributes
+        assert isinstance(graph, DiGraph)
+        assert graph.name == 'name'
+        assert graph.graph['compound'] == 'true'
+        assert graph.graph['newrank'] == 'true'
+
+        # AND the nodes with their attributes
+        assert dict(graph.nodes(data=True)) == {
+            '[root] a': {'label': 'provider["registry"]', 'shape': 'diamond'},
+            'b': {'label': 'b', 'shape': 'box'},
+            'c': {},
+            'd': {}
+        }
+
+        # AND the edges with their attributes
+        assert list(graph.edges(data=True)) == [
+            ('[root] a', 'b', {'color': 'red'}),
+            ('b', 'c', {'color': 'red'}),
+            ('d', '[root] a', {})
+        ]
+
+    @mark.parametrize('source', [
+        param(b'', id='empty'),
+        param(b'{"a": "b"}', id='json'),
+        param(b'graph { a -- b }', id='undirected graph'),
+        param(b'digraph { a -> }', id='edge without target'),
+        param(b'digraph { a [label = ] }', id='attribute without value'),
+        param(b'digraph { a -> b ', id='unclosed graph'),
+        param(b'digraph { a -> b } c', id='content after graph'),
+        param(b'digraph { <a> -> b }', id='html id')
+    ])
+    def test_invalid_dot(self, source: bytes):
+        # GIVEN an invalid or unsupported DOT source
+
+        # WHEN read_tfgraph_dot is invoked
+        # THEN a DotParsingError is raised
+        with raises(DotParsingError):
+            read_tfgraph_dot(source)
+
+    @mark.parametrize('source', [
+        param(get_byte_data(tfplan_elb), id='tfplan'),
+        param(get_byte_data(invalid_yaml), id='invalid yaml'),
+    ])
+    def test_load_tfgraph_invalid_source(self, source: bytes):
+        # GIVEN a source which is not a tfgraph
+
+        # WHEN load_tfgraph is invoked
+        # THEN no graph is returned
+        assert load_tfgraph(source) is None
+
+    @mark.parametrize('loader_name', [
+        param(DOT_READER_TFGRAPH_LOADER, id='dot reader'),
+        param(PYGRAPHVIZ_TFGRAPH_LOADER, id='pygraphviz'),
+    ])
+    def test_tfgraph_loader_configuration(self, mocker, loader_name: str):
+        # GIVEN the tfgraph loader configured by environment variable
+        mocker.patch.dict('os.environ', {TFGRAPH_LOADER_ENV_VAR: loader_name})
+
+        # AND the available loaders mocked
+        loaders = {DOT_READER_TFGRAPH_LOADER: Mock(), PYGRAPHVIZ_TFGRAPH_LOADER: Mock()}
+        mocker.patch.dict('slp_tfplan.slp_tfplan.load.tfplan_loader.TFGRAPH_LOADERS', loaders)
+
+        # WHEN load_tfgraph is invoked
+        source = get_byte_data(tfgraph_elb)
+        load_tfgraph(source)
+
+        # THEN only the configured loader is used
+        for name, loader in loaders.items():
+            if name == loader_name:
+                loader.assert_called_once_with(source)
+            else:
+                loader.assert_not_called()
+
+    def test_unknown_tfgraph_loader(self):
+        # GIVEN an unknown tfgraph loader name
+        # WHEN load_tfgraph is invoked
+        # THEN a LoadingIacFileError is raised
+        with raises(LoadingIacFileError) as error:
+            load_tfgraph(get_byte_data(tfgraph_elb), 'unknown')
+
+        # AND the error explains the available loaders
+        assert error.value.title == 'Invalid tfgraph loader configuration'
+        assert 'unknown' in error.value.message
+
+    def test_pygraphviz_not_installed(self, mocker):
+        # GIVEN pygraphviz is not installed
+        mocker.patch.dict('sys.modules', {'pygraphviz': None})
+
+        # WHEN load_tfgraph is invoked with the pygraphviz loader
+        # THEN a LoadingIacFileError explaining how to install it is raised
+        with raises(LoadingIacFileError) as error:
+            load_tfgraph(get_byte_data(tfgraph_elb), PYGRAPHVIZ_TFGRAPH_LOADER)
+
+        assert 'tfgraph-pygraphviz' in error.value.message
+
+    def test_unknown_configured_tfgraph_loader(self, mocker):
+        # GIVEN an unknown tfgraph loader configured by environment variable
+        mocker.patch.dict('os.environ', {TFGRAPH_LOADER_ENV_VAR: 'unknown'})
+
+        # WHEN TFPlanLoader::load is invoked
+        # THEN a LoadingIacFileError is raised
+        with raises(LoadingIacFileError):
+            TFPlanLoader([get_byte_data(tfplan_elb), get_byte_data(tfgraph_elb)]).load()
@@ -0,0 +1,87 @@
+import json
+
+from pytest import mark, param, importorskip, raises, fixture
+
+from sl_util.sl_util.file_utils import get_byte_data
+from slp_tfplan.slp_tfplan.load.tfplan_json_reader import read_tfplan, JSON_TFPLAN_READER, \
+    INCREMENTAL_TFPLAN_READER
+from slp_tfplan.slp_tfplan.load.tfplan_loader import TFPlanLoader
+from slp_tfplan.tests.resources.test_resource_paths import tfplan_elb, tfplan_sgs, tfplan_official, tfgraph_elb, \
+    invalid_yaml
+from slp_tfplan.tests.util.builders import build_tfplan, generate_resources
+
+
+@mark.parametrize('reader_name', [
+    param(JSON_TFPLAN_READER, id='json'),
+    param(INCREMENTAL_TFPLAN_READER, id='incremental')
+])
+class TestTfplanJsonReader:
+
+    @fixture(autouse=True)
+    def skip_without_ijson(self, reader_name: str):
+        if reader_name == INCREMENTAL_TFPLAN_READER:
+            importorskip('ijson')
+
+    @mark.parametrize('tfplan', [
+        param(tfplan_elb, id='elb-example'),
+        param(tfplan_sgs, id='sgs-example'),
+        param(tfplan_official, id='official-example')
+    ])
+    def test_read_tfplan_sections(self, reader_name: str, tfplan: str):
+        # GIVEN a tfplan generated by terraform
+        source = get_byte_data(tfplan)
+        document = json.loads(source)
+
+        # WHEN read_tfplan is invoked
+        tfplan = read_tfplan(source, reader_name)
+
+        # THEN only the planned values and the configuration root module are kept
+        assert tfplan == {
+            'planned_values': document['planned_values'],
+            'configuration': {'root_module': document['configuration']['root_module']}
+        }
+
+    @mark.parametrize('source,expected', [
+        param(b'{"planned_values": {"root_module": {}}}', {'planned_values': {'root_module': {}}},
+              id='no configuration'),
+        param(b'{"planned_values": {}, "configuration": {"provider_config": {}}}',
+              {'planned_values': {}, 'configuration': {}}, id='no configuration root module'),
+        param(b'{"format_version": "1.1", "variables": {}}', {}, id='no sections'),
+        param(b'["planned_values", "configuration"]', None, id='json array'),
+        param(b'{"planned_values": {', None, id='truncated json'),
+        param(get_byte_data(tfgraph_elb), None, id='tfgraph'),
+        param(get_byte_data(invalid_yaml), None, id='invalid yaml'),
+    ])
+    def test_read_partial_or_invalid_tfplan(self, reader_name: str, source: bytes, expected):
+        # GIVEN a partial or invalid tfplan
+
+        # WHEN read_tfplan is invoked
+        # THEN only the existing sections are returned or None for invalid JSON objects
+        assert read_tfplan(source, reader_name) == expected
+
+
+class TestTfplanReaderConfiguration:
+
+    def test_unknown_tfplan_reader(self):
+        # GIVEN an unknown tfplan reader name
+        # WHEN read_tfplan is invoked
+        # THEN a ValueError is raised
+        with raises(ValueError):
+            read_tfplan(get_byte_data(tfplan_elb), 'unknown')
+
+    def test_loader_reuses_parsed_tfplans(self, mocker):
+        # GIVEN a tfplan already parsed for the first source
+        parsed_tfplans = [build_tfplan(resources=generate_resources(1)), None]
+
+        # AND a mocked tfplan reader
+        read_tfplan_mock = mocker.patch('slp_tfplan.slp_tfplan.load.tfplan_loader.read_tfplan')
+
+        # WHEN TFPlanLoader::load is invoked
+        tfplan_loader = TFPlanLoader([b'MOCKED', get_byte_data(tfgraph_elb)], parsed_tfplans)
+        tfplan_loader.load()
+
+        # THEN the tfplan is not parsed again
+        assert read_tfplan_mock.call_count == 0
+
+        # AND the resources are loaded from the parsed tfplan
+        assert tfplan_loader.get_terraform()['resource'][0]['resource_id'] == 'r1-addr'
@@ -20,7 +20,7 @@ TF_FILE_YAML_EXCEPTION = JSONDecodeError('HLC2 cannot be processed as JSON', doc
 
 @fixture
 def mock_load_tfplan(mocker, mocked_tfplan):
-    mocker.patch('yaml.load', side_effect=mocked_tfplan)
+    mocker.patch('slp_tfplan.slp_tfplan.load.tfplan_loader.read_tfplan', side_effect=mocked_tfplan)
 
 
 @fixture(autouse=True)
@@ -36,10 +36,10 @@ def mock_load_graph(mocker, mocked_graph):
 class TestTFPlanLoader:
 
     @patch('slp_tfplan.slp_tfplan.load.tfplan_loader.load_tfgraph')
-    @patch('yaml.load')
-    def test_load_tfplan_and_graph(self, yaml_mock, from_agraph_mock):
+    @patch('slp_tfplan.slp_tfplan.load.tfplan_loader.read_tfplan')
+    def test_load_tfplan_and_graph(self, read_tfplan_mock, from_agraph_mock):
         # GIVEN a valid plain Terraform Plan file with no modules
-        yaml_mock.side_effect = [build_tfplan(resources=generate_resources(2))]
+        read_tfplan_mock.side_effect = [build_tfplan(resources=generate_resources(2))]
 
         # AND a mocked graph load result
         graph_label = 'Mocked Graph'
@@ -55,10 +55,10 @@ class TestTFPlanLoader:
         # AND the TFGRAPH is also loaded
         assert tfplan_loader.get_tfgraph().graph['label'] == graph_label
 
-    @patch('yaml.load')
-    def test_load_no_modules(self, yaml_mock):
+    @patch('slp_tfplan.slp_tfplan.load.tfplan_loader.read_tfplan')
+    def test_load_no_modules(self, read_tfplan_mock):
         # GIVEN a valid plain Terraform Plan file with no modules
-        yaml_mock.side_effect = [build_tfplan(resources=generate_resources(2))]
+        read_tfplan_mock.side_effect = [build_tfplan(resources=generate_resources(2))]
 
         # WHEN TFPlanLoader::load is invoked
         tfplan_loader = TFPlanLoader(sources=[b'MOCKED', b'MOCKED'])
@@ -81,10 +81,10 @@ class TestTFPlanLoader:
             assert_common_properties(properties)
             assert properties['resource_address'] == f'r{i}-addr'
 
-    @patch('yaml.load')
-    def test_load_only_modules(self, yaml_mock):
+    @patch('slp_tfplan.slp_tfplan.load.tfplan_loader.read_tfplan')
+    def test_load_only_modules(self, read_tfplan_mock):
         # GIVEN a valid plain Terraform Plan file with only modules
-        yaml_mock.side_effect = [build_tfplan(
+        read_tfplan_mock.side_effect = [build_tfplan(
             child_modules=generate_child_modules(module_count=2, resource_count=2))]
 
         # WHEN TFPlanLoader::load is invoked
@@ -114,10 +114,10 @@ class TestTFPlanLoader:
 
                 resource_index += 1
 
-    @patch('yaml.load')
-    def test_load_nested_modules(self, yaml_mock):
+    @patch('slp_tfplan.slp_tfplan.load.tfplan_loader.read_tfplan')
+    def test_load_nested_modules(self, read_tfplan_mock):
         # GIVEN a valid plain Terraform Plan file with nested modules
-        yaml_mock.side_effect = [build_tfplan(
+        read_tfplan_mock.side_effect = [build_tfplan(
             child_modules=generate_child_modules(
                 module_count=1,
                 child_modules=generate_child_modules(module_count=1, resource_count=1)))]
@@ -142,10 +142,10 @@ class TestTFPlanLoader:
         assert properties['resource_address'] == 'r1-addr'
         assert_common_properties(properties)
 
-    @patch('yaml.load')
-    def test_load_complex_structure(self, yaml_mock):
+    @patch('slp_tfplan.slp_tfplan.load.tfplan_loader.read_tfplan')
+    def test_load_complex_structure(self, read_tfplan_mock):
         # GIVEN a valid plain Terraform Plan file with modules and root-level resources
-        yaml_mock.side_effect = [build_tfplan(
+        read_tfplan_mock.side_effect = [build_tfplan(
             resources=generate_resources(1),
             child_modules=generate_child_modules(module_count=1, resource_count=1))]
 
@@ -179,8 +179,8 @@ class TestTFPlanLoader:
         assert properties['resource_address'] == 'r1-addr'
         assert_common_properties(properties)
 
-    @patch('yaml.load')
-    def test_load_resources_same_name(self, yaml_mock):
+    @patch('slp_tfplan.slp_tfplan.load.tfplan_loader.read_tfplan')
+    def test_load_resources_same_name(self, read_tfplan_mock):
         # GIVEN a valid plain Terraform Plan file with only one module
         tfplan = build_tfplan(
             child_modules=generate_child_modules(module_count=1, resource_count=1))
@@ -191,7 +191,7 @@ class TestTFPlanLoader:
         duplicated_resource['index'] = 1
         tfplan_resources.append(duplicated_resource)
 
-        yaml_mock.side_effect = [tfplan]
+        read_tfplan_mock.side_effect = [tfplan]
 
         # WHEN TFPlanLoader::load is invoked
         tfplan_loader = TFPlanLoader(sources=[b'MOCKED', b'MOCKED'])
@@ -206,8 +206,8 @@ class TestTFPlanLoader:
         assert resources[0]['resource_id'] == 'r1-addr'
         assert resources[0]['resource_name'] == 'cm1-addr.r1-name'
 
-    @patch('yaml.load')
-    def test_load_modules_same_name(self, yaml_mock):
+    @patch('slp_tfplan.slp_tfplan.load.tfplan_loader.read_tfplan')
+    def test_load_modules_same_name(self, read_tfplan_mock):
         # GIVEN a valid plain Terraform Plan file with only one module
         tfplan = build_tfplan(
             child_modules=generate_child_modules(module_count=1, resource_count=1))
@@ -228,7 +228,7 @@ class TestTFPlanLoader:
 
         tfplan_modules.append(duplicated_module)
 
-        yaml_mock.side_effect = [tfplan]
+        read_tfplan_mock.side_effect = [tfplan]
 
         # WHEN TFPlanLoader::load is invoked
         tfplan_loader = TFPlanLoader(sources=[b'MOCKED', b'MOCKED'])
@@ -243,10 +243,10 @@ class TestTFPlanLoader:
         assert resources[0]['resource_id'] == 'cm1-addr.r1-addr'
         assert resources[0]['resource_name'] == 'cm1-addr.r1-name'
 
-    @patch('yaml.load')
-    def test_load_no_resources(self, yaml_mock):
+    @patch('slp_tfplan.slp_tfplan.load.tfplan_loader.read_tfplan')
+    def test_load_no_resources(self, read_tfplan_mock):
         # GIVEN a valid Terraform Plan file with no resources
-        yaml_mock.side_effect = [{'planned_values': {'root_module': {}}}]
+        read_tfplan_mock.side_effect = [{'planned_values': {'root_module': {}}}]
 
         # WHEN TFPlanLoader::load is invoked
         tfplan_loader = TFPlanLoader(sources=[b'MOCKED', b'MOCKED'])
@@ -255,10 +255,10 @@ class TestTFPlanLoader:
         # THEN TfplanLoader.terraform is an empty dictionary
         assert tfplan_loader.terraform == {}
 
-    @patch('yaml.load')
-    def test_load_empty_tfplan(self, yaml_mock):
+    @patch('slp_tfplan.slp_tfplan.load.tfplan_loader.read_tfplan')
+    def test_load_empty_tfplan(self, read_tfplan_mock):
         # GIVEN an empty TFPLAN
-        yaml_mock.side_effect = [{}]
+        read_tfplan_mock.side_effect = [{}]
 
         # WHEN TFPlanLoader::load is invoked
         tfplan_loader = TFPlanLoader(sources=[b'MOCKED', b'MOCKED'])
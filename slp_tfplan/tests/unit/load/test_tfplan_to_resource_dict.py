@@ -0,0 +1,77 @@
+import sys
+
+from slp_tfplan.slp_tfplan.load.tfplan_to_resource_dict import TfplanToResourceDict
+from slp_tfplan.tests.util.builders import generate_resources, generate_child_modules
+
+
+def build_nested_modules(depth: int) -> [{}]:
+    modules = generate_child_modules(module_count=1, resource_count=1)
+
+    for _ in range(depth - 1):
+        modules = generate_child_modules(module_count=1, child_modules=modules, resource_count=1)
+
+    return modules
+
+
+class TestTfplanToResourceDict:
+
+    def test_resource_configuration_by_address(self):
+        # GIVEN some planned resources
+        resources = generate_resources(3)
+
+        # AND the configuration of some of them, with a duplicated address
+        configuration = [
+            {'address': 'r3-addr', 'expressions': 'r3-first-configuration'},
+            {'address': 'r1-addr', 'expressions': 'r1-configuration'},
+            {'address': 'r3-addr', 'expressions': 'r3-second-configuration'}
+        ]
+
+        # WHEN TfplanToResourceDict::map_modules is invoked
+        mapped_resources = TfplanToResourceDict(configuration).map_modules([{'resources': resources}])
+
+        # THEN the configuration is used as properties for the configured resources
+        assert mapped_resources[0]['resource_properties'] == configuration[1]
+        assert mapped_resources[2]['resource_properties'] == configuration[0]
+
+        # AND the planned values are used as properties for the rest of resources
+        assert mapped_resources[1]['resource_properties']['resource_address'] == 'r2-addr'
+
+    def test_deeply_nested_modules(self):
+        # GIVEN a module tree deeper than the recursion limit
+        depth = sys.getrecursionlimit() + 1
+        modules = build_nested_modules(depth)
+
+        # WHEN TfplanToResourceDict::map_modules is invoked
+        mapped_resources = TfplanToResourceDict([]).map_modules(modules)
+
+        # THEN the resources from every module are mapped from the outermost to the innermost module
+        assert len(mapped_resources) == depth
+        assert mapped_resources[0]['resource_name'] == 'cm1-addr.r1-name'
+        assert mapped_resources[-1]['resource_name'] == '.'.join(['cm1-addr'] * depth + ['r1-name'])
+
+    def test_modules_order(self):
+        # GIVEN two modules with a child module each
+        modules = generate_child_modules(
+            module_count=2, child_modules=generate_child_modules(module_count=1, resource_count=1), resource_count=1)
+
+        # WHEN TfplanToResourceDict::iterate_modules is invoked
+        resources_names = [r['resource_name'] for r in TfplanToResourceDict([]).iterate_modules(modules)]
+
+        # THEN the resources of each module are followed by the resources in its child modules
+        assert resources_names == [
+            'cm1-addr.r1-name',
+            'cm1-addr.cm1-addr.r1-name',
+            'cm2-addr.r1-name',
+            'cm2-addr.cm1-addr.r1-name'
+        ]
+
+    def test_cloned_resources_with_numeric_index(self):
+        # GIVEN some resources cloned by count with numeric indexes
+        resource = generate_resources(1)[0]
+        resources = [{**resource, 'index': 0}, {**resource, 'index': 1}]
+
+        # WHEN TfplanToResourceDict::map_modules is invoked
+        mapped_resources = TfplanToResourceDict([]).map_modules([{'resources': resources}])
+
+        # THEN only the first clone is mapped
+        assert len(mapped_resources) == 1
@@ -1,3 +1,8 @@
+from typing import Dict, List
+
+from shapely.prepared import PreparedGeometry, prep
+from shapely.strtree import STRtree
+
 from slp_visio.slp_visio.load.objects.diagram_objects import DiagramComponent, DiagramComponentOrigin
 
 
@@ -40,15 +45,51 @@ def is_contained(parent_candidate: DiagramComponent, child_candidate: DiagramCom
            parent_candidate.representation.contains(child_candidate.representation)
 
 
+class ParentCandidatesIndex:
+    """
+    Spatial index of the parent candidates of a page, built once for all the components. The candidates containing a
+    component are looked for only among the ones whose bounding box intersects the component's one, and their
+    representations are prepared the first time they are checked
+    """
+
+    def __init__(self, parent_candidates: [DiagramComponent]):
+        self.parent_candidates = [candidate for candidate in parent_candidates if candidate.representation is not None]
+        self.__tree = STRtree([candidate.representation for candidate in self.parent_candidates])
+        self.__prepared_representations: Dict[int, PreparedGeometry] = {}
+
+    def __get_prepared_representation(self, position: int) -> PreparedGeometry:
+        if position not in self.__prepared_representations:
+            self.__prepared_representations[position] = prep(self.parent_candidates[position].representation)
+        return self.__prepared_representations[position]
+
+    def get_containers(self, child_candidate: DiagramComponent) -> List[DiagramComponent]:
+        """
+        :return: the candidates containing the component, in the same order as the indexed candidates
+        """
+        if child_candidate.representation is None:
+            return []
+
+        return [self.parent_candidates[position]
+                for position in sorted(self.__tree.query(child_candidate.representation))
+                if self.parent_candidates[position].id != child_candidate.id
+                and self.__get_prepared_representation(position).contains(child_candidate.representation)]
+
+
 class ParentCalculator:
     def __init__(self, component: DiagramComponent):
         self.child_candidate = component
 
-    def calculate_parent(self, parent_candidates: [DiagramComponent]) -> DiagramComponent:
-        potential_parents = []
-        for parent_candidate in parent_candidates:
-            if is_contained(parent_candidate, self.child_candidate):
-                potential_parents.append(parent_candidate)
+    def calculate_parent(self, parent_candidates: [DiagramComponent],
+                         parent_candidates_index: ParentCandidatesIndex = None) -> DiagramComponent:
+        """
+        :param parent_candidates: the components that may contain the component
+        :param parent_candidates_index: an optional index of the same parent candidates, to avoid checking them all
+        """
+        if parent_candidates_index:
+            potential_parents = parent_candidates_index.get_containers(self.child_candidate)
+        else:
+            potential_parents = [parent_candidate for parent_candidate in parent_candidates
+                                 if is_contained(parent_candidate, self.child_candidate)]
 
         if len(potential_parents) == 1:
             return potential_parents[0]
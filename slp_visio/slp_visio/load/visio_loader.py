@@ -1,4 +1,5 @@
 import logging
+from io import BytesIO
 
 from slp_base import ProviderLoader, LoadingDiagramFileError
 from slp_visio.slp_visio.load.objects.visio_diagram_factories import VisioComponentFactory, VisioConnectorFactory
@@ -11,7 +12,7 @@ class VisioLoader(ProviderLoader):
 
     def load(self):
         try:
-            self.visio = self.parser.parse(self.source.name)
+            self.visio = self.parser.parse(self.source if isinstance(self.source, BytesIO) else self.source.name)
         except Exception as e:
             logger.error(f'{e}')
             detail = e.__class__.__name__
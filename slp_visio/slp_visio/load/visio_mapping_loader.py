@@ -5,6 +5,7 @@ from deepmerge import always_merger
 from otm.otm.entity.trustzone import Trustzone
 from sl_util.sl_util.str_utils import deterministic_uuid
 from slp_base import MappingLoader
+from slp_base.slp_base.mapping_cache import mapping_cache, get_mappings_key
 from slp_base.slp_base.mapping_file_loader import MappingFileLoader
 from slp_visio.slp_visio.util.visio import normalize_unique_id
 
@@ -27,6 +28,7 @@ def load_mappings(mapping_file):
 class VisioMappingFileLoader(MappingLoader):
 
     def __init__(self, mapping_files):
+        self.mapping_files = mapping_files
         self.component_mappings = None
         self.trustzone_mappings = None
         self.default_otm_trustzone = None
@@ -34,9 +36,11 @@ class VisioMappingFileLoader(MappingLoader):
         self.mappings = load_mappings(mapping)
 
     def load(self):
-        self.default_otm_trustzone = self.__load_default_otm_trustzone()
-        self.trustzone_mappings = self.__load_trustzone_mappings()
-        self.component_mappings = self.__load_component_mappings()
+        self.default_otm_trustzone, self.trustzone_mappings, self.component_mappings = mapping_cache.get(
+            get_mappings_key('visio', self.mapping_files), self.__compile_mappings)
+
+    def __compile_mappings(self):
+        return self.__load_default_otm_trustzone(), self.__load_trustzone_mappings(), self.__load_component_mappings()
 
     def get_all_labels(self) -> [str]:
         component_and_tz_mappings = self.mappings['components'] + self.mappings['trustzones']
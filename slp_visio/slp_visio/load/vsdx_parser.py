@@ -1,14 +1,44 @@
+import io
+import zipfile
+from typing import BinaryIO, Union
+
 from vsdx import Shape, VisioFile
 
 from slp_base import DiagramType
 from slp_visio.slp_visio.load.objects.diagram_objects import Diagram, DiagramComponentOrigin, DiagramLimits
-from slp_visio.slp_visio.load.parent_calculator import ParentCalculator
+from slp_visio.slp_visio.load.parent_calculator import ParentCalculator, ParentCandidatesIndex
 from slp_visio.slp_visio.load.representation.simple_component_representer import SimpleComponentRepresenter
 from slp_visio.slp_visio.load.representation.zone_component_representer import ZoneComponentRepresenter
 from slp_visio.slp_visio.util.visio import get_limits, get_shape_text
 
 DIAGRAM_LIMITS_PADDING = 2
 DEFAULT_DIAGRAM_LIMITS = DiagramLimits(((1000, 1000), (1000, 1000)))
+IN_MEMORY_VISIO_FILENAME = 'diagram.vsdx'
+
+
+class InMemoryVisioFile(VisioFile):
+    """
+    VisioFile read from a binary file object, like a BytesIO, instead of a file on disk. VisioFile keeps the contents
+    of the vsdx in memory by its path inside a folder named after the file, so a fake file name is used, and that
+    folder is never removed when closing it.
+
+    It overrides the private _load_zip_file_contents_to_memory and close_vsdx methods of the exact vsdx version pinned
+    in setup.py (0.6.1), so they must be checked against the new version every time the pin is bumped
+    """
+
+    def __init__(self, visio_file: BinaryIO):
+        self.visio_file = visio_file
+        super().__init__(IN_MEMORY_VISIO_FILENAME)
+
+    def _load_zip_file_contents_to_memory(self):
+        with zipfile.ZipFile(self.visio_file, 'r') as zip_ref:
+            for file_path in zip_ref.namelist():
+                path = f'{self.directory}/{file_path}'
+                if not path.endswith('/'):
+                    self.zip_file_contents[path] = io.BytesIO(zip_ref.read(file_path))
+
+    def close_vsdx(self):
+        self.file_open = False
 
 
 def load_visio_page_from_file(visio_filename: str):
@@ -16,6 +46,11 @@ def load_visio_page_from_file(visio_filename: str):
         return vis.pages[0]
 
 
+def load_visio_page_from_buffer(visio_file: BinaryIO):
+    with InMemoryVisioFile(visio_file) as vis:
+        return vis.pages[0]
+
+
 class VsdxParser:
 
     def __init__(self, component_factory, connector_factory):
@@ -29,8 +64,12 @@ class VsdxParser:
         self._visio_components = []
         self._visio_connectors = []
 
-    def parse(self, visio_diagram_filename) -> Diagram:
-        self.page = load_visio_page_from_file(visio_diagram_filename)
+    def parse(self, visio_diagram: Union[str, BinaryIO]) -> Diagram:
+        """
+        :param visio_diagram: the path of the vsdx file or a binary file object with its contents
+        """
+        self.page = load_visio_page_from_file(visio_diagram) if isinstance(visio_diagram, str) \
+            else load_visio_page_from_buffer(visio_diagram)
 
         diagram_limits = self.__calculate_diagram_limits()
         self._component_representer = SimpleComponentRepresenter()
@@ -102,5 +141,7 @@ class VsdxParser:
             self._visio_connectors.append(visio_connector)
 
     def _calculate_parents(self):
+        parent_candidates_index = ParentCandidatesIndex(self._visio_components)
         for component in self._visio_components:
-            component.parent = ParentCalculator(component).calculate_parent(self._visio_components)
+            component.parent = ParentCalculator(component).calculate_parent(
+                self._visio_components, parent_candidates_index)
@@ -1,6 +1,6 @@
 from vsdx import Shape
 
-from slp_visio.slp_visio.load.parent_calculator import ParentCalculator
+from slp_visio.slp_visio.load.parent_calculator import ParentCalculator, ParentCandidatesIndex
 from slp_visio.slp_visio.load.vsdx_parser import VsdxParser
 
 LUCID_LINE = 'com.lucidchart.Line'
@@ -8,6 +8,10 @@ LUCID_LINE = 'com.lucidchart.Line'
 
 class LucidVsdxParser(VsdxParser):
 
+    def __init__(self, component_factory, connector_factory):
+        super().__init__(component_factory, connector_factory)
+        self.__connectable_components = None
+
     @staticmethod
     def _is_connector(shape: Shape) -> bool:
         for connect in shape.connects:
@@ -19,14 +23,20 @@ class LucidVsdxParser(VsdxParser):
 
         return False
 
-    def _add_connector(self, connector_shape: Shape):
+    def _load_page_elements(self):
         shape_components = [c for c in self.page.child_shapes if self._is_component(c) and not self._is_boundary(c)]
+        self.__connectable_components = self.connector_factory.index_components(shape_components)
 
-        visio_connector = self.connector_factory.create_connector(connector_shape, shape_components)
+        super()._load_page_elements()
+
+    def _add_connector(self, connector_shape: Shape):
+        visio_connector = self.connector_factory.create_connector(connector_shape, self.__connectable_components)
         if visio_connector:
             self._visio_connectors.append(visio_connector)
 
     def _calculate_parents(self):
         trustzones_and_components = [c for c in self._visio_components if c.type != 'Line']
+        parent_candidates_index = ParentCandidatesIndex(trustzones_and_components)
         for component in trustzones_and_components:
-            component.parent = ParentCalculator(component).calculate_parent(trustzones_and_components)
+            component.parent = ParentCalculator(component).calculate_parent(
+                trustzones_and_components, parent_candidates_index)
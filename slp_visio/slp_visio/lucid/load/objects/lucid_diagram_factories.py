@@ -1,6 +1,7 @@
-from typing import Optional
+from typing import Optional, List
 
-from shapely.geometry import Point
+from shapely.geometry import Point, box
+from shapely.strtree import STRtree
 from vsdx import Shape
 
 from slp_visio.slp_visio.load.objects.diagram_objects import DiagramComponent, DiagramConnector
@@ -37,13 +38,35 @@ class LucidComponentFactory:
             representation=representer.build_representation(shape))
 
 
+class LucidConnectableComponents:
+    """
+    The components of a page that may be connected by a line, with their representations built once and indexed, so
+    the component of every line end is looked for only among the ones whose bounding box is close enough to it
+    """
+
+    def __init__(self, components: [Shape], representer: SimpleComponentRepresenter):
+        self.components = components
+        self.exteriors = [representer.build_representation(component).exterior for component in components]
+        self.__tree = STRtree(self.exteriors)
+
+    def get_candidates(self, point: Point, tolerance: float) -> List[int]:
+        """
+        :return: the positions of the components whose bounding box is within the tolerance of the point, in page order
+        """
+        return sorted(self.__tree.query(box(point.x - tolerance, point.y - tolerance,
+                                            point.x + tolerance, point.y + tolerance)))
+
+
 class LucidConnectorFactory:
 
     def __init__(self):
         self.tolerance = 0.09
         self.representer: SimpleComponentRepresenter() = SimpleComponentRepresenter()
 
-    def create_connector(self, shape: Shape, components: [Shape]) -> Optional[DiagramConnector]:
+    def index_components(self, components: [Shape]) -> LucidConnectableComponents:
+        return LucidConnectableComponents(components, self.representer)
+
+    def create_connector(self, shape: Shape, components: LucidConnectableComponents) -> Optional[DiagramConnector]:
 
         begin_line = Point(shape.begin_x, shape.begin_y)
         end_line = Point(shape.end_x, shape.end_y)
@@ -58,10 +81,9 @@ class LucidConnectorFactory:
 
         return DiagramConnector(shape.ID, origin, target, name=shape.text)
 
-    def __match_component(self, point, components):
+    def __match_component(self, point, components: LucidConnectableComponents):
 
-        for component in components:
-            polygon = self.representer.build_representation(component)
-            distance = polygon.exterior.distance(point)
+        for position in components.get_candidates(point, self.tolerance):
+            distance = components.exteriors[position].distance(point)
             if distance <= self.tolerance:
-                return component.ID
+                return components.components[position].ID
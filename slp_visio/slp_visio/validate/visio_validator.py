@@ -1,8 +1,9 @@
 import logging
 import os
+from io import BytesIO
 from zipfile import ZipFile
 
-from sl_util.sl_util.file_utils import get_file_type_by_name
+from sl_util.sl_util.file_utils import get_file_type_by_name, get_file_type_by_content
 
 from slp_base import ProviderValidator, DiagramFileNotValidError, DiagramType
 from slp_base.slp_base.provider_validator import generate_content_type_error, generate_size_error
@@ -16,28 +17,32 @@ MIN_SIZE = 10
 class VisioValidator(ProviderValidator):
 
     def __init__(self, file, provider=DiagramType.VISIO):
+        """
+        :param file: a BytesIO with the diagram or a file whose name is the path of the diagram
+        """
         self.file = file
         self.provider = provider
+        self.is_in_memory = isinstance(file, BytesIO)
 
     def validate(self):
         logger.info('Validating visio file')
         self.__validate_size()
-        self.__validate_content_type()
-        self.__validate_zip_content()
+        mime = get_file_type_by_content(self.file.getvalue()) if self.is_in_memory \
+            else get_file_type_by_name(self.file.name)
+        self.__validate_content_type(mime)
+        self.__validate_zip_content(mime)
 
     def __validate_size(self):
-        size = os.path.getsize(self.file.name)
+        size = self.file.getbuffer().nbytes if self.is_in_memory else os.path.getsize(self.file.name)
         if size > MAX_SIZE or size < MIN_SIZE:
             raise generate_size_error(self.provider, 'diag_file', DiagramFileNotValidError)
 
-    def __validate_content_type(self):
-        mime = get_file_type_by_name(self.file.name)
+    def __validate_content_type(self, mime: str):
         if mime not in self.provider.valid_mime:
             raise generate_content_type_error(self.provider, 'diag_file', DiagramFileNotValidError)
 
-    def __validate_zip_content(self):
-        mime = get_file_type_by_name(self.file.name)
+    def __validate_zip_content(self, mime: str):
         if 'application/zip' == mime:
-            with ZipFile(self.file.name) as myzip:
+            with ZipFile(self.file if self.is_in_memory else self.file.name) as myzip:
                 if not any("[Content_Types].xml" == file.filename for file in myzip.filelist):
                     raise generate_content_type_error(self.provider, 'diag_file', DiagramFileNotValidError)
@@ -1,6 +1,9 @@
+import os
+from io import BytesIO
+
 from starlette.datastructures import UploadFile
 
-from sl_util.sl_util.file_utils import copy_to_disk, delete
+from sl_util.sl_util.file_utils import copy_to_memory_or_disk, delete
 from slp_base import OTMProcessor, ProviderValidator, ProviderLoader, MappingValidator, MappingLoader, ProviderParser, \
     DiagramType
 from slp_visio.slp_visio.load.visio_loader import VisioLoader
@@ -10,7 +13,15 @@ from slp_visio.slp_visio.lucid.parse.lucid_parser import LucidParser
 from slp_visio.slp_visio.lucid.validate.lucid_validator import LucidValidator
 from slp_visio.slp_visio.parse.visio_parser import VisioParser
 from slp_visio.slp_visio.validate.visio_mapping_file_validator import VisioMappingFileValidator
-from slp_visio.slp_visio.validate.visio_validator import VisioValidator
+from slp_visio.slp_visio.validate.visio_validator import VisioValidator, MAX_SIZE
+
+# Uploaded diagrams bigger than this number of bytes are processed from a temporary file instead of from memory
+DIAGRAM_MAX_MEMORY_BYTES_ENV_VAR = 'STARTLEFT_DIAGRAM_MAX_MEMORY_BYTES'
+DEFAULT_DIAGRAM_MAX_MEMORY_BYTES = MAX_SIZE
+
+
+def get_diagram_max_memory_bytes() -> int:
+    return int(os.getenv(DIAGRAM_MAX_MEMORY_BYTES_ENV_VAR, DEFAULT_DIAGRAM_MAX_MEMORY_BYTES))
 
 
 class VisioProcessor(OTMProcessor):
@@ -24,7 +35,8 @@ class VisioProcessor(OTMProcessor):
         self.project_name = project_name
         self.mappings = mappings
         self.is_temporary_source = type(source) is UploadFile
-        self.source = copy_to_disk(source.file, '.vsdx') if self.is_temporary_source else source
+        self.source = copy_to_memory_or_disk(source.file, '.vsdx', get_diagram_max_memory_bytes()) \
+            if self.is_temporary_source else source
         self.loader = None
         self.mapping_loader = None
 
@@ -56,5 +68,5 @@ class VisioProcessor(OTMProcessor):
             return VisioParser(self.project_id, self.project_name, visio, self.mapping_loader)
 
     def _clean_resources(self):
-        if self.is_temporary_source:
+        if self.is_temporary_source and not isinstance(self.source, BytesIO):
             delete(self.source.name)
@@ -1,10 +1,12 @@
+from io import BytesIO
+
 import pytest
 from pytest import mark
 
 from sl_util.sl_util.file_utils import get_byte_data
 from slp_base import DiagramFileNotValidError
 from slp_base.tests.util.otm import validate_and_compare_otm, validate_and_compare
-from slp_visio.slp_visio.visio_processor import VisioProcessor
+from slp_visio.slp_visio.visio_processor import VisioProcessor, DIAGRAM_MAX_MEMORY_BYTES_ENV_VAR
 from slp_visio.tests.resources import test_resource_paths
 from slp_visio.tests.resources.test_resource_paths import expected_aws_shapes, expected_simple_boundary_tzs, \
     expected_overlapped_boundary_tzs, \
@@ -240,13 +242,40 @@ class TestVisioProcessor:
         # And the original file is not deleted
         assert file_exists(processor.source.name)
 
-    def test_temporary_file_is_deleted(self):
+    def test_uploaded_file_processed_in_memory(self):
         # Given a visio file uploaded through the API
         source = get_upload_file(test_resource_paths.visio_aws_shapes)
 
         # When the processor is instanced
         processor = VisioProcessor("project-id", "project-name", source, [get_byte_data(default_visio_mapping)])
 
+        # Then no temporary file is created
+        assert isinstance(processor.source, BytesIO)
+
+        # And the file can be processed
+        otm = processor.process()
+        result, expected = validate_and_compare_otm(otm.json(), expected_aws_shapes, None)
+        assert result == expected
+
+    def test_invalid_uploaded_file_in_memory(self):
+        # Given an invalid visio file uploaded through the API
+        source = get_upload_file(test_resource_paths.visio_invalid_file_size)
+
+        # When the processor is instanced
+        processor = VisioProcessor("project-id", "project-name", source, [get_byte_data(default_visio_mapping)])
+
+        # Then a validation exception is raised
+        with pytest.raises(DiagramFileNotValidError):
+            processor.process()
+
+    def test_temporary_file_is_deleted(self, monkeypatch):
+        # Given a visio file uploaded through the API bigger than the diagrams processed in memory
+        monkeypatch.setenv(DIAGRAM_MAX_MEMORY_BYTES_ENV_VAR, '1024')
+        source = get_upload_file(test_resource_paths.visio_aws_shapes)
+
+        # When the processor is instanced
+        processor = VisioProcessor("project-id", "project-name", source, [get_byte_data(default_visio_mapping)])
+
         # Then a temporary file is created
         assert file_exists(processor.source.name)
 
@@ -258,9 +287,10 @@ class TestVisioProcessor:
         # And the temporary file is deleted after processing
         assert not file_exists(processor.source.name)
 
-    def test_temporary_file_is_deleted_when_exception(self):
-        # Given an invalid visio file uploaded through the API
-        source = get_upload_file(test_resource_paths.visio_invalid_file_size)
+    def test_temporary_file_is_deleted_when_exception(self, monkeypatch):
+        # Given a file that is not a diagram uploaded through the API bigger than the diagrams processed in memory
+        monkeypatch.setenv(DIAGRAM_MAX_MEMORY_BYTES_ENV_VAR, '1024')
+        source = get_upload_file(default_visio_mapping)
 
         # When the processor is instanced
         processor = VisioProcessor("project-id", "project-name", source, [get_byte_data(default_visio_mapping)])
@@ -1,9 +1,10 @@
 from unittest.mock import patch
 
-from shapely.geometry import Polygon, Point
+from pytest import mark, param
+from shapely.geometry import Polygon, Point, box
 
 from slp_visio.slp_visio.load.objects.diagram_objects import DiagramComponent
-from slp_visio.slp_visio.load.parent_calculator import ParentCalculator
+from slp_visio.slp_visio.load.parent_calculator import ParentCalculator, ParentCandidatesIndex
 
 
 def create_representation_mock(dimension: float = None) -> Polygon:
@@ -82,3 +83,48 @@ class TestParentCalculator:
 
         # THEN the parent candidate with smaller area is returned
         assert parent == parent_candidate_smaller_area
+
+
+def create_box_component(component_id: str, min_x: float, min_y: float, max_x: float, max_y: float) \
+        -> DiagramComponent:
+    return DiagramComponent(id=component_id, name=component_id, representation=box(min_x, min_y, max_x, max_y))
+
+
+class TestParentCandidatesIndex:
+
+    @mark.parametrize('components', [
+        param([create_box_component('tz', 0, 0, 100, 100),
+               create_box_component('group', 10, 10, 50, 50),
+               create_box_component('inner', 20, 20, 30, 30),
+               create_box_component('outside', 200, 200, 210, 210)], id='nested'),
+        param([create_box_component('first', 0, 0, 20, 20),
+               create_box_component('second', 0, 0, 20, 20),
+               create_box_component('child', 5, 5, 10, 10)], id='same area'),
+        param([create_box_component('left', 0, 0, 20, 20),
+               create_box_component('right', 10, 0, 30, 20),
+               create_box_component('overlapped', 12, 5, 18, 10)], id='overlapped parents')
+    ])
+    def test_same_parents_as_without_index(self, components: [DiagramComponent]):
+        # GIVEN the components of a page
+        # AND an index of them
+        index = ParentCandidatesIndex(components)
+
+        # WHEN the parents are calculated with the index
+        parents = [ParentCalculator(component).calculate_parent(components, index) for component in components]
+
+        # THEN they are the same as the ones calculated checking all the components
+        assert parents == [ParentCalculator(component).calculate_parent(components) for component in components]
+
+    def test_containers_in_candidates_order(self):
+        # GIVEN some components with the same area containing other
+        components = [create_box_component(str(i), 0, 0, 20, 20) for i in range(10)]
+        child = create_box_component('child', 5, 5, 10, 10)
+
+        # WHEN the containers of the child are looked up in the index
+        containers = ParentCandidatesIndex(components + [child]).get_containers(child)
+
+        # THEN they are returned in the same order as the candidates
+        assert containers == components
+
+        # AND the first one is the parent
+        assert ParentCalculator(child).calculate_parent(components, ParentCandidatesIndex(components)) == components[0]
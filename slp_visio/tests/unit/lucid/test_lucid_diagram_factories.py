@@ -0,0 +1,67 @@
+from unittest.mock import MagicMock
+
+from shapely.geometry import box
+
+from slp_visio.slp_visio.lucid.load.objects.lucid_diagram_factories import LucidConnectorFactory
+
+
+def create_shape(shape_id: str, min_x: float, min_y: float, max_x: float, max_y: float) -> MagicMock:
+    return MagicMock(ID=shape_id, representation=box(min_x, min_y, max_x, max_y))
+
+
+def create_line(shape_id: str, begin: tuple, end: tuple) -> MagicMock:
+    return MagicMock(ID=shape_id, begin_x=begin[0], begin_y=begin[1], end_x=end[0], end_y=end[1], text='line')
+
+
+def create_connector_factory() -> LucidConnectorFactory:
+    factory = LucidConnectorFactory()
+    factory.representer = MagicMock(build_representation=lambda shape: shape.representation)
+    return factory
+
+
+class TestLucidConnectorFactory:
+
+    def test_create_connector_between_components(self):
+        # GIVEN two components of a page
+        components = [create_shape('1', 0, 0, 1, 1), create_shape('2', 3, 0, 4, 1)]
+
+        # AND a line whose ends are close enough to the borders of both components
+        line = create_line('3', (1.05, 0.5), (3, 0.5))
+
+        # WHEN a connector is created
+        factory = create_connector_factory()
+        connector = factory.create_connector(line, factory.index_components(components))
+
+        # THEN the connector joins both components
+        assert connector.id == '3'
+        assert connector.from_id == '1'
+        assert connector.to_id == '2'
+
+    def test_create_connector_end_too_far(self):
+        # GIVEN two components of a page
+        components = [create_shape('1', 0, 0, 1, 1), create_shape('2', 3, 0, 4, 1)]
+
+        # AND a line whose end is inside the second component but far from its borders
+        line = create_line('3', (1, 0.5), (3.5, 0.5))
+
+        # WHEN a connector is created
+        factory = create_connector_factory()
+        connector = factory.create_connector(line, factory.index_components(components))
+
+        # THEN no connector is created
+        assert connector is None
+
+    def test_create_connector_first_component_in_page_order(self):
+        # GIVEN some components with the same borders
+        components = [create_shape(str(i), 0, 0, 1, 1) for i in range(10)] + [create_shape('10', 3, 0, 4, 1)]
+
+        # AND a line whose begin is on their borders
+        line = create_line('11', (1, 0.5), (3, 0.5))
+
+        # WHEN a connector is created
+        factory = create_connector_factory()
+        connector = factory.create_connector(line, factory.index_components(components))
+
+        # THEN the line begins in the first one of the page
+        assert connector.from_id == '0'
+        assert connector.to_id == '10'
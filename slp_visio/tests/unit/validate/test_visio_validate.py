@@ -1,9 +1,11 @@
+from io import BytesIO
 from unittest.mock import patch, MagicMock
 
 import pytest
 
 from slp_base import DiagramFileNotValidError
 from slp_visio.slp_visio.validate.visio_validator import VisioValidator
+from slp_visio.tests.resources import test_resource_paths
 
 
 class TestVisioValidator:
@@ -49,3 +51,25 @@ class TestVisioValidator:
         get_mime_type.return_value = mime_type_value
 
         self.validator.validate()
+
+    def test_valid_file_in_memory(self):
+        # GIVEN a visio file in memory
+        with open(test_resource_paths.visio_aws_shapes, 'rb') as f:
+            validator = VisioValidator(BytesIO(f.read()))
+
+        # WHEN it is validated
+        # THEN no error is raised
+        validator.validate()
+
+    @pytest.mark.parametrize('content', [
+        pytest.param(b'', id="empty"),
+        pytest.param(b'%PDF-1.4\n' + b'0' * 1024, id="pdf")
+    ])
+    def test_invalid_file_in_memory(self, content):
+        # GIVEN an invalid file in memory
+        validator = VisioValidator(BytesIO(content))
+
+        # WHEN it is validated
+        # THEN an error is raised
+        with pytest.raises(DiagramFileNotValidError):
+            validator.validate()
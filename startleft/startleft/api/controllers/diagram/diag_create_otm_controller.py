@@ -1,13 +1,13 @@
 import logging
 
-from fastapi import APIRouter, File, UploadFile, Form, Response
+from fastapi import APIRouter, File, UploadFile, Form
 
 from _sl_build.modules import PROCESSORS
-from sl_util.sl_util.json_utils import get_otm_as_json
 from slp_base import DiagramType, DiagramFileNotValidError
 from slp_base.slp_base.provider_resolver import ProviderResolver
 from startleft.startleft.api.check_mime_type import check_mime_type
-from startleft.startleft.api.controllers.otm_controller import RESPONSE_STATUS_CODE, PREFIX, controller_responses
+from startleft.startleft.api.controllers.otm_controller import RESPONSE_STATUS_CODE, PREFIX, controller_responses, \
+    get_otm_response
 
 URL = '/diagram'
 
@@ -46,4 +46,4 @@ def diagram(diag_file: UploadFile = File(...),
     processor = provider_resolver.get_processor(diag_type, id, name, diag_file, mapping_data_list, diag_type=diag_type)
     otm = processor.process()
 
-    return Response(status_code=201, media_type="application/json", content=get_otm_as_json(otm))
+    return get_otm_response(otm)
@@ -1,13 +1,13 @@
 import logging
 
-from fastapi import APIRouter, File, UploadFile, Form, Response
+from fastapi import APIRouter, File, UploadFile, Form
 
 from _sl_build.modules import PROCESSORS
-from sl_util.sl_util import json_utils
 from slp_base.slp_base.provider_resolver import ProviderResolver
 from slp_base.slp_base.provider_type import EtmType
 from startleft.startleft.api.check_mime_type import check_mime_type
-from startleft.startleft.api.controllers.otm_controller import RESPONSE_STATUS_CODE, PREFIX, controller_responses
+from startleft.startleft.api.controllers.otm_controller import RESPONSE_STATUS_CODE, PREFIX, controller_responses, \
+    get_otm_response
 
 URL = '/external-threat-model'
 
@@ -49,4 +49,4 @@ def etm(source_file: UploadFile = File(...),
     processor = provider_resolver.get_processor(source_type, id, name, etm_data, mapping_data_list)
     otm = processor.process()
 
-    return Response(status_code=201, media_type="application/json", content=json_utils.get_otm_as_json(otm))
+    return get_otm_response(otm)
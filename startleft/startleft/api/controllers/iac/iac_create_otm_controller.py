@@ -1,15 +1,15 @@
 import logging
 from typing import List
 
-from fastapi import APIRouter, File, UploadFile, Form, Response
+from fastapi import APIRouter, File, UploadFile, Form
 
 from _sl_build.modules import PROCESSORS
-from sl_util.sl_util.json_utils import get_otm_as_json
 from slp_base import IacFileNotValidError
 from slp_base.slp_base.provider_resolver import ProviderResolver
 from slp_base.slp_base.provider_type import IacType
 from startleft.startleft.api.check_mime_type import check_mime_type
-from startleft.startleft.api.controllers.otm_controller import RESPONSE_STATUS_CODE, PREFIX, controller_responses
+from startleft.startleft.api.controllers.otm_controller import RESPONSE_STATUS_CODE, PREFIX, controller_responses, \
+    get_otm_response
 
 URL = '/iac'
 
@@ -47,4 +47,4 @@ def iac(iac_file: List[UploadFile]
     processor = provider_resolver.get_processor(iac_type, id, name, iac_data, mapping_data)
     otm = processor.process()
 
-    return Response(status_code=201, media_type="application/json", content=get_otm_as_json(otm))
+    return get_otm_response(otm)
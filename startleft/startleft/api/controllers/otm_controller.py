@@ -1,5 +1,11 @@
+import itertools
 from http import HTTPStatus
 
+from fastapi import Response
+from fastapi.responses import StreamingResponse
+
+from otm.otm.entity.otm import OTM
+from sl_util.sl_util.json_utils import iter_otm_json_chunks
 from startleft.startleft import messages
 from startleft.startleft.api.error_response import ErrorResponse
 
@@ -18,3 +24,25 @@ controller_responses = {
 PREFIX = '/api/v1/startleft'
 
 RESPONSE_STATUS_CODE = HTTPStatus.CREATED
+
+# OTMs whose JSON is bigger than this number of characters are streamed
+OTM_STREAMING_MIN_SIZE = 1024 * 1024
+
+
+def get_otm_response(otm: OTM) -> Response:
+    """
+    Returns the OTM JSON in a plain response, with its Content-Length, unless it is bigger than OTM_STREAMING_MIN_SIZE.
+    In that case it is streamed, but its first chunks are encoded before returning the response, so an error encoding
+    them is still returned as an error response instead of a truncated body
+    """
+    chunks = iter_otm_json_chunks(otm)
+    first_chunks = []
+    size = 0
+    for chunk in chunks:
+        first_chunks.append(chunk)
+        size += len(chunk)
+        if size > OTM_STREAMING_MIN_SIZE:
+            return StreamingResponse(itertools.chain(first_chunks, chunks), status_code=RESPONSE_STATUS_CODE,
+                                     media_type="application/json")
+
+    return Response(status_code=RESPONSE_STATUS_CODE, media_type="application/json", content=''.join(first_chunks))
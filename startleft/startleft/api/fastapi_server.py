@@ -11,6 +11,7 @@ from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
 from starlette.exceptions import HTTPException
 
+from slp_tf.slp_tf.load.tf_loader import shutdown_hcl2_parser_pools
 from startleft.startleft.api.controllers.diagram import diag_create_otm_controller
 from startleft.startleft.api.controllers.etm import etm_create_otm_controller
 from startleft.startleft.api.controllers.health import health_controller
@@ -64,6 +65,11 @@ def load_custom_openapi():
         return None
 
 
+@webapp.on_event("shutdown")
+def shutdown_parser_pools():
+    shutdown_hcl2_parser_pools()
+
+
 def run_webapp(host: str, port: int):
     uvicorn.run(webapp, host=host, port=port, log_config=get_log_config())
 
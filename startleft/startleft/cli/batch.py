@@ -0,0 +1,237 @@
+"""
+Batch conversion of several sources into OTM files. The jobs are read from a YAML manifest like:
+
+    jobs:
+      - type: TERRAFORM
+        source-files: [repo-a/main.tf, repo-a/network.tf]
+        mapping-files: [terraform-mapping.yaml]
+        project-name: Repo A
+        project-id: repo-a
+        output-file: otm/repo-a.otm
+
+where relative paths are resolved from the manifest folder, or from a glob of source files sharing the same type and
+mapping files. The jobs are distributed over a pool of processes, each of them loading the mapping files and the
+schemas only once.
+"""
+import glob
+import json
+import logging
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import List, Dict, Optional
+
+import yaml
+
+from _sl_build.modules import PROCESSORS
+from sl_util.sl_util.file_utils import get_byte_data
+from sl_util.sl_util.json_utils import write_otm_json
+from slp_base import CommonError, DiagramType, EtmType, IacType
+from slp_base.slp_base.otm_validator import OTMValidator
+from slp_base.slp_base.provider_resolver import ProviderResolver
+from slp_base.slp_base.schema import Schema
+
+logger = logging.getLogger(__name__)
+
+JOB_OK = 'OK'
+JOB_ERROR = 'ERROR'
+
+_provider_resolver: Optional[ProviderResolver] = None
+_mapping_data: Dict[str, bytes] = {}
+
+
+class BatchJob:
+    def __init__(self, source_type: str, source_files: List[str], mapping_files: List[str], project_name: str,
+                 project_id: str, output_file: str):
+        self.source_type = source_type.upper()
+        self.source_files = source_files
+        self.mapping_files = mapping_files
+        self.project_name = project_name
+        self.project_id = project_id
+        self.output_file = output_file
+
+    def __repr__(self):
+        return f'BatchJob(project_id="{self.project_id}", source_type="{self.source_type}", ' \
+               f'output_file="{self.output_file}")'
+
+
+class BatchJobResult:
+    def __init__(self, job: BatchJob, status: str, elapsed: float, error_type: str = None, error: str = None):
+        self.job = job
+        self.status = status
+        self.elapsed = elapsed
+        self.error_type = error_type
+        self.error = error
+
+    def json(self):
+        json = {
+            'projectId': self.job.project_id,
+            'status': self.status,
+            'outputFile': self.job.output_file,
+            'elapsedSeconds': round(self.elapsed, 3)
+        }
+
+        if self.error_type:
+            json['errorType'] = self.error_type
+            json['error'] = self.error
+
+        return json
+
+
+def __resolve_path(base_dir: str, path: str) -> str:
+    return path if os.path.isabs(path) else os.path.join(base_dir, path)
+
+
+def load_manifest_jobs(manifest_file: str) -> List[BatchJob]:
+    with open(manifest_file, 'r') as f:
+        manifest = yaml.safe_load(f)
+
+    base_dir = os.path.dirname(os.path.abspath(manifest_file))
+    jobs = []
+    for job in manifest['jobs']:
+        source_files = job['source-files']
+        source_files = [source_files] if isinstance(source_files, str) else source_files
+        jobs.append(BatchJob(
+            source_type=job['type'],
+            source_files=[__resolve_path(base_dir, source_file) for source_file in source_files],
+            mapping_files=[__resolve_path(base_dir, mapping_file) for mapping_file in job['mapping-files']],
+            project_name=job['project-name'],
+            project_id=job['project-id'],
+            output_file=__resolve_path(base_dir, job['output-file'])))
+
+    return jobs
+
+
+def get_project_id_from_path(path: str) -> str:
+    return re.sub(r'[^a-zA-Z0-9]+', '-', os.path.splitext(os.path.normpath(path))[0]).strip('-').lower()
+
+
+def load_glob_jobs(pattern: str, source_type: str, mapping_files: List[str], output_dir: str) -> List[BatchJob]:
+    jobs = []
+    for source_file in sorted(glob.glob(pattern, recursive=True)):
+        project_id = get_project_id_from_path(source_file)
+        jobs.append(BatchJob(
+            source_type=source_type,
+            source_files=[source_file],
+            mapping_files=mapping_files,
+            project_name=project_id,
+            project_id=project_id,
+            output_file=os.path.join(output_dir, f'{project_id}.otm')))
+
+    return jobs
+
+
+def init_worker(mapping_files: List[str]):
+    """
+    Loads once per process the mapping files and the schemas shared by all the jobs
+    """
+    global _provider_resolver
+    _provider_resolver = ProviderResolver(PROCESSORS)
+    Schema.from_package('otm', OTMValidator.schema_filename)
+
+    for mapping_file in mapping_files:
+        if mapping_file not in _mapping_data and os.path.isfile(mapping_file):
+            _mapping_data[mapping_file] = get_byte_data(mapping_file)
+
+
+def __get_mapping_data(mapping_file: str) -> bytes:
+    if mapping_file not in _mapping_data:
+        _mapping_data[mapping_file] = get_byte_data(mapping_file)
+
+    return _mapping_data[mapping_file]
+
+
+def __process_job(job: BatchJob):
+    mapping_data = [__get_mapping_data(mapping_file) for mapping_file in job.mapping_files]
+
+    if job.source_type in IacType.__members__:
+        processor = _provider_resolver.get_processor(
+            IacType(job.source_type), job.project_id, job.project_name,
+            [get_byte_data(source_file) for source_file in job.source_files], mapping_data)
+        return processor.process()
+
+    if job.source_type in DiagramType.__members__:
+        diagram_type = DiagramType(job.source_type)
+        with open(job.source_files[0], 'r') as file:
+            processor = _provider_resolver.get_processor(diagram_type, job.project_id, job.project_name, file,
+                                                         mapping_data, diag_type=diagram_type)
+            return processor.process()
+
+    if job.source_type in EtmType.__members__:
+        processor = _provider_resolver.get_processor(EtmType(job.source_type), job.project_id, job.project_name,
+                                                     get_byte_data(job.source_files[0]), mapping_data)
+        return processor.process()
+
+    raise ValueError(f'{job.source_type} is not a supported type for source data')
+
+
+def run_job(job: BatchJob) -> BatchJobResult:
+    """
+    Converts the sources of the job into its OTM file. Any error is returned in the result instead of raised, so a
+    failing job does not abort the rest of the batch
+    """
+    if not _provider_resolver:
+        init_worker(job.mapping_files)
+
+    start = time.perf_counter()
+    try:
+        otm = __process_job(job)
+
+        output_dir = os.path.dirname(job.output_file)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+        with open(job.output_file, 'w') as f:
+            write_otm_json(otm, f)
+    except CommonError as e:
+        return BatchJobResult(job, JOB_ERROR, time.perf_counter() - start, e.__class__.__name__,
+                              str(e.message or e.title))
+    except Exception as e:
+        return BatchJobResult(job, JOB_ERROR, time.perf_counter() - start, e.__class__.__name__, str(e))
+
+    return BatchJobResult(job, JOB_OK, time.perf_counter() - start)
+
+
+def run_batch(jobs: List[BatchJob], workers: int = None) -> List[BatchJobResult]:
+    """
+    Runs the jobs in a pool of processes
+    :return: the results of the jobs in the same order as the jobs
+    """
+    mapping_files = sorted({mapping_file for job in jobs for mapping_file in job.mapping_files})
+    results: List[Optional[BatchJobResult]] = [None] * len(jobs)
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(mapping_files,)) as executor:
+        futures = {executor.submit(run_job, job): index for index, job in enumerate(jobs)}
+        for future in as_completed(futures):
+            index = futures[future]
+            try:
+                results[index] = future.result()
+            except Exception as e:
+                results[index] = BatchJobResult(jobs[index], JOB_ERROR, 0, e.__class__.__name__, str(e))
+
+            logger.info(f'{results[index].status} {jobs[index].project_id} '
+                        f'({results[index].elapsed * 1000:.0f}ms)')
+
+    return results
+
+
+def write_batch_results(results: List[BatchJobResult], elapsed: float, results_file: str):
+    with open(results_file, 'w') as f:
+        json.dump({
+            'elapsedSeconds': round(elapsed, 3),
+            'jobsPerSecond': round(len(results) / elapsed, 3) if elapsed > 0 else 0,
+            'jobs': [result.json() for result in results]
+        }, f, indent=2)
+
+
+def log_batch_report(results: List[BatchJobResult], elapsed: float):
+    failed = [result for result in results if result.status != JOB_OK]
+
+    for result in results:
+        logger.info(f'{result.job.project_id}: {result.status} in {result.elapsed * 1000:.0f}ms')
+    for result in failed:
+        logger.error(f'{result.job.project_id} failed with {result.error_type}: {result.error}')
+
+    throughput = len(results) / elapsed if elapsed > 0 else 0
+    logger.info(f'Batch finished: {len(results)} jobs, {len(results) - len(failed)} succeeded, {len(failed)} failed '
+                f'in {elapsed:.2f}s ({throughput:.2f} jobs/s)')
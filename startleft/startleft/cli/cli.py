@@ -1,13 +1,14 @@
-import json
 import logging
 import re
 import sys
+import time
 
 import click
 
 from _sl_build.modules import PROCESSORS
 from otm.otm.entity.otm import OTM
 from sl_util.sl_util.file_utils import get_byte_data
+from sl_util.sl_util.json_utils import write_otm_json
 from slp_base import CommonError
 from slp_base import DiagramType, OTMGenerationError, EtmType
 from slp_base import IacType
@@ -18,6 +19,8 @@ from slp_cft.slp_cft.cft_searcher import CloudformationSearcher
 from slp_tf.slp_tf.tf_searcher import TerraformSearcher
 from startleft.startleft._version.version_loader import load_startleft_version
 from startleft.startleft.api import fastapi_server
+from startleft.startleft.cli.batch import load_manifest_jobs, load_glob_jobs, run_batch, log_batch_report, \
+    write_batch_results, JOB_OK
 from startleft.startleft.cli.clioptions.exclusion_option import Exclusion
 from startleft.startleft.log import get_log_level, configure_logging
 from startleft.startleft.messages import *
@@ -31,7 +34,7 @@ def get_otm_as_file(otm: OTM, out_file: str):
     logger.info(f"Writing OTM file to '{out_file}'")
     try:
         with open(out_file, "w") as f:
-            json.dump(otm.json(), f, indent=2)
+            write_otm_json(otm, f)
     except Exception as e:
         logger.error(f"Unable to create the threat model: {e}")
         raise OTMGenerationError("Unable to create the OTM", e.__class__.__name__, str(e.__cause__))
@@ -190,6 +193,50 @@ def parse_any(iac_type, diagram_type, etm_type, mapping_file, default_mapping_fi
         logger.warning('Unable to determine the parser type. Not diagram either iaC.')
 
 
+@cli.command(name='batch')
+@click.option(BATCH_MANIFEST_NAME, BATCH_MANIFEST_SHORTNAME,
+              help=BATCH_MANIFEST_DESC,
+              cls=Exclusion,
+              mandatory=True,
+              mutually_exclusion=['glob_pattern', 'source_type', 'mapping_file'])
+@click.option(BATCH_GLOB_NAME, BATCH_GLOB_SHORTNAME, 'glob_pattern',
+              help=BATCH_GLOB_DESC,
+              cls=Exclusion,
+              mandatory=True,
+              mutually_exclusion=['manifest'])
+@click.option(BATCH_TYPE_NAME, BATCH_TYPE_SHORTNAME, 'source_type',
+              type=click.Choice(BATCH_TYPE_SUPPORTED, case_sensitive=False),
+              help=BATCH_TYPE_DESC)
+@click.option(BATCH_MAPPING_FILE_NAME, BATCH_MAPPING_FILE_SHORTNAME, multiple=True, help=BATCH_MAPPING_FILE_DESC)
+@click.option(BATCH_OUTPUT_DIR_NAME, BATCH_OUTPUT_DIR_SHORTNAME, default='.', help=BATCH_OUTPUT_DIR_DESC)
+@click.option(BATCH_WORKERS_NAME, BATCH_WORKERS_SHORTNAME, type=click.IntRange(min=1), help=BATCH_WORKERS_DESC)
+@click.option(BATCH_RESULTS_FILE_NAME, BATCH_RESULTS_FILE_SHORTNAME, help=BATCH_RESULTS_FILE_DESC)
+@click.pass_context
+def batch(ctx, manifest, glob_pattern, source_type, mapping_file, output_dir, workers, results_file):
+    """
+    Converts several source files into Open Threat Model files in parallel
+    """
+    if manifest:
+        jobs = load_manifest_jobs(manifest)
+    else:
+        if not source_type or not mapping_file:
+            raise click.UsageError(f'{BATCH_TYPE_NAME} and {BATCH_MAPPING_FILE_NAME} are required with '
+                                   f'{BATCH_GLOB_NAME}')
+        jobs = load_glob_jobs(glob_pattern, source_type, list(mapping_file), output_dir)
+
+    logger.info(f'Converting {len(jobs)} jobs into OTM')
+    start = time.perf_counter()
+    results = run_batch(jobs, workers)
+    elapsed = time.perf_counter() - start
+
+    log_batch_report(results, elapsed)
+    if results_file:
+        write_batch_results(results, elapsed, results_file)
+
+    if any(result.status != JOB_OK for result in results):
+        ctx.exit(1)
+
+
 @cli.command(name='validate')
 @click.option(VALIDATE_MAPPING_FILE_NAME, VALIDATE_MAPPING_FILE_SHORTNAME,
               help=VALIDATE_MAPPING_FILE_DESC,
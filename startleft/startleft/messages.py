@@ -79,3 +79,33 @@ VALIDATE_MAPPING_FILE_TYPE_SHORTNAME = '-t'
 VALIDATE_MAPPING_FILE_TYPE_DESC = 'Mapping file type to validate.'
 MAPPING_FILE_TYPE_SUPPORTED = ['CLOUDFORMATION', 'TERRAFORM', 'VISIO', 'MTMT', 'LUCID']
 
+
+BATCH_MANIFEST_NAME = '--manifest'
+BATCH_MANIFEST_SHORTNAME = '-f'
+BATCH_MANIFEST_DESC = 'YAML manifest with the jobs to convert.'
+
+BATCH_GLOB_NAME = '--glob'
+BATCH_GLOB_SHORTNAME = '-p'
+BATCH_GLOB_DESC = 'Glob pattern of the source files to convert, one job per file.'
+
+BATCH_TYPE_NAME = '--type'
+BATCH_TYPE_SHORTNAME = '-t'
+BATCH_TYPE_DESC = 'The type of the source files matched by the glob pattern.'
+BATCH_TYPE_SUPPORTED = IAC_TYPE_SUPPORTED + DIAGRAM_TYPE_SUPPORTED + ETM_TYPE_SUPPORTED
+
+BATCH_MAPPING_FILE_NAME = '--mapping-file'
+BATCH_MAPPING_FILE_SHORTNAME = '-m'
+BATCH_MAPPING_FILE_DESC = 'Mapping file for the source files matched by the glob pattern. ' \
+                          'For diagrams and ETMs, the first one is the default mapping file.'
+
+BATCH_OUTPUT_DIR_NAME = '--output-dir'
+BATCH_OUTPUT_DIR_SHORTNAME = '-o'
+BATCH_OUTPUT_DIR_DESC = 'Folder of the OTM files generated from the glob pattern.'
+
+BATCH_WORKERS_NAME = '--workers'
+BATCH_WORKERS_SHORTNAME = '-w'
+BATCH_WORKERS_DESC = 'Number of worker processes. Defaults to the number of CPUs.'
+
+BATCH_RESULTS_FILE_NAME = '--results-file'
+BATCH_RESULTS_FILE_SHORTNAME = '-r'
+BATCH_RESULTS_FILE_DESC = 'JSON file where the result and timing of every job are written.'
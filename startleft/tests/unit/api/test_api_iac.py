@@ -6,6 +6,7 @@ import pytest
 
 import startleft.startleft.api.controllers.iac.iac_create_otm_controller as controller
 from otm.otm.otm_builder import OTMBuilder
+from sl_util.sl_util.json_utils import get_otm_as_json
 from slp_base import LoadingIacFileError, IacFileNotValidError, LoadingMappingFileError, OTMBuildingError, \
     OTMGenerationError
 from slp_base.slp_base.provider_type import IacType
@@ -191,7 +192,10 @@ class TestApiIac:
         # THEN a response with HTTP staus 201  and json media type is returned
         assert response.status_code == 201
         assert response.media_type == 'application/json'
-        assert response.body is not None
+
+        # AND the whole OTM is returned in the body
+        assert response.body == get_otm_as_json(OTM_SAMPLE).encode()
+        assert response.headers['content-length'] == str(len(response.body))
 
     @patch('slp_base.slp_base.otm_processor.OTMProcessor')
     @patch('slp_base.slp_base.provider_resolver.ProviderResolver.get_processor')
@@ -0,0 +1,64 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from fastapi.responses import StreamingResponse
+
+from otm.otm.entity.component import Component
+from otm.otm.otm_builder import OTMBuilder
+from sl_util.sl_util.json_utils import get_otm_as_json
+from slp_base.slp_base.provider_type import IacType
+from startleft.startleft.api.controllers.otm_controller import get_otm_response
+
+
+def build_otm(components: int = 0):
+    otm = OTMBuilder('id', 'name', IacType.CLOUDFORMATION).build()
+    otm.components = [Component(component_id=f'component-{index}', name=f'Component {index}', component_type='empty',
+                                parent='trustzone', parent_type='trustZone') for index in range(components)]
+    return otm
+
+
+async def read_body(response: StreamingResponse) -> str:
+    return ''.join([chunk async for chunk in response.body_iterator])
+
+
+class TestGetOtmResponse:
+
+    def test_small_otm_not_streamed(self):
+        # GIVEN a small OTM
+        otm = build_otm(components=10)
+
+        # WHEN its response is created
+        response = get_otm_response(otm)
+
+        # THEN it is a plain response with the whole OTM and its length
+        assert not isinstance(response, StreamingResponse)
+        assert response.status_code == 201
+        assert response.body == get_otm_as_json(otm).encode()
+        assert response.headers['content-length'] == str(len(response.body))
+
+    @patch('startleft.startleft.api.controllers.otm_controller.OTM_STREAMING_MIN_SIZE', 1024)
+    def test_big_otm_streamed(self):
+        # GIVEN an OTM bigger than the streaming size
+        otm = build_otm(components=100)
+
+        # WHEN its response is created
+        response = get_otm_response(otm)
+
+        # THEN it is streamed
+        assert isinstance(response, StreamingResponse)
+        assert response.status_code == 201
+
+        # AND the whole OTM is returned in the body
+        assert asyncio.run(read_body(response)) == get_otm_as_json(otm)
+
+    @patch('startleft.startleft.api.controllers.otm_controller.OTM_STREAMING_MIN_SIZE', 1024)
+    def test_encoding_error_raised_before_streaming(self):
+        # GIVEN an OTM bigger than the streaming size that cannot be encoded
+        otm = build_otm(components=100)
+        otm.components[0].attributes = {'invalid': object()}
+
+        # WHEN its response is created
+        # THEN the error is raised before returning the response
+        with pytest.raises(TypeError):
+            get_otm_response(otm)
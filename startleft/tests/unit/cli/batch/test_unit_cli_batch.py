@@ -0,0 +1,109 @@
+import json
+import os
+import shutil
+
+import yaml
+from click.testing import CliRunner
+
+from startleft.startleft.cli.batch import get_project_id_from_path, load_manifest_jobs
+from startleft.startleft.cli.cli import batch
+from tests.resources import test_resource_paths
+
+CLOUDFORMATION_FILE = test_resource_paths.cloudformation_for_mappings_tests_json
+CLOUDFORMATION_MAPPING = test_resource_paths.default_cloudformation_mapping
+
+
+def build_manifest_job(project_id: str, source_file: str) -> dict:
+    return {
+        'type': 'cloudformation',
+        'source-files': [source_file],
+        'mapping-files': [CLOUDFORMATION_MAPPING],
+        'project-name': project_id,
+        'project-id': project_id,
+        'output-file': f'otm/{project_id}.otm'
+    }
+
+
+def write_manifest(jobs: [dict]) -> str:
+    with open('manifest.yaml', 'w') as f:
+        yaml.dump({'jobs': jobs}, f)
+    return 'manifest.yaml'
+
+
+class TestCliBatch:
+
+    def test_batch_from_manifest(self):
+        runner = CliRunner()
+
+        with runner.isolated_filesystem():
+            # Given a manifest with two valid jobs and one job with a missing source file
+            manifest = write_manifest([
+                build_manifest_job('first', CLOUDFORMATION_FILE),
+                build_manifest_job('missing', 'missing-file.json'),
+                build_manifest_job('second', CLOUDFORMATION_FILE)
+            ])
+
+            # When the batch is run
+            result = runner.invoke(batch, ['--manifest', manifest, '--workers', '2', '--results-file', 'results.json'])
+
+            # Then the run does not abort but its exit code reports the failure
+            assert result.exit_code == 1
+
+            # And the OTM files of the valid jobs are generated
+            for project_id in ['first', 'second']:
+                with open(f'otm/{project_id}.otm') as f:
+                    assert json.load(f)['project']['id'] == project_id
+            assert not os.path.exists('otm/missing.otm')
+
+            # And the results of every job are written in order
+            with open('results.json') as f:
+                results = json.load(f)
+
+            assert [(job['projectId'], job['status']) for job in results['jobs']] == \
+                   [('first', 'OK'), ('missing', 'ERROR'), ('second', 'OK')]
+            assert results['jobs'][1]['errorType'] == 'FileNotFoundError'
+            assert all(job['elapsedSeconds'] >= 0 for job in results['jobs'])
+            assert results['jobsPerSecond'] > 0
+
+    def test_batch_from_glob(self):
+        runner = CliRunner()
+
+        with runner.isolated_filesystem():
+            # Given two repositories with a CloudFormation template
+            for repository in ['repo-a', 'repo-b']:
+                os.makedirs(repository)
+                shutil.copy(CLOUDFORMATION_FILE, os.path.join(repository, 'template.json'))
+
+            # When the batch is run for the glob pattern
+            result = runner.invoke(batch, ['--glob', '*/template.json', '--type', 'CLOUDFORMATION',
+                                           '--mapping-file', CLOUDFORMATION_MAPPING, '--output-dir', 'otm'])
+
+            # Then an OTM file is generated for every repository
+            assert result.exit_code == 0
+            assert sorted(os.listdir('otm')) == ['repo-a-template.otm', 'repo-b-template.otm']
+
+    def test_batch_glob_without_type(self):
+        runner = CliRunner()
+
+        # When the batch is run for a glob pattern without type
+        result = runner.invoke(batch, ['--glob', '*.json'])
+
+        # Then a usage error is returned
+        assert result.exit_code == 2
+
+    def test_manifest_relative_paths(self, tmp_path):
+        # Given a manifest with relative paths
+        manifest = tmp_path / 'manifest.yaml'
+        manifest.write_text(yaml.dump({'jobs': [build_manifest_job('project', 'sources/template.json')]}))
+
+        # When the manifest is loaded
+        job = load_manifest_jobs(str(manifest))[0]
+
+        # Then the paths are resolved from the manifest folder
+        assert job.source_files == [str(tmp_path / 'sources/template.json')]
+        assert job.mapping_files == [CLOUDFORMATION_MAPPING]
+        assert job.output_file == str(tmp_path / 'otm/project.otm')
+        assert job.source_type == 'CLOUDFORMATION'
+
+    def test_project_id_from_path(self):
+        assert get_project_id_from_path('./repos/Repo_A/main.tf') == 'repos-repo-a-main'
@@ -0,0 +1,57 @@
+"""
+Compares the per-request overhead of validating documents against the StartLeft schemas when the schema is loaded and
+the validator is built for every validation, as it was done before, and when the compiled schemas are reused.
+
+Usage:
+    python -m tests.benchmark.schema_validation_benchmark [repetitions]
+"""
+import json
+import sys
+import timeit
+
+import jsonschema
+import yaml
+
+from sl_util.sl_util.file_utils import get_byte_data
+from slp_base.slp_base.otm_validator import OTMValidator
+from slp_base.slp_base.schema import Schema, get_package_schema_path
+from slp_tfplan.slp_tfplan.validate.tfplan_validator import TFPLAN_SCHEMA_FILENAME
+from slp_tfplan.tests.resources.test_resource_paths import tfplan_official, otm_expected_official
+
+DEFAULT_REPETITIONS = 100
+
+BENCHMARKS = [
+    ('otm', OTMValidator.schema_filename, otm_expected_official),
+    ('slp_tfplan', TFPLAN_SCHEMA_FILENAME, tfplan_official)
+]
+
+
+def validate_without_cache(package: str, filename: str, document: dict):
+    with open(get_package_schema_path(package, filename), 'r') as f:
+        schema = yaml.load(f, Loader=yaml.BaseLoader)
+
+    try:
+        jsonschema.validate(document, schema)
+    except jsonschema.ValidationError:
+        pass
+
+
+def validate_with_cache(package: str, filename: str, document: dict):
+    Schema.from_package(package, filename).validate(document)
+
+
+def run_benchmark(repetitions: int):
+    print(f'{"schema":>25} {"before":>12} {"after":>12} {"speedup":>8}')
+
+    for package, filename, document_path in BENCHMARKS:
+        document = json.loads(get_byte_data(document_path))
+
+        before = timeit.timeit(lambda: validate_without_cache(package, filename, document), number=repetitions)
+        after = timeit.timeit(lambda: validate_with_cache(package, filename, document), number=repetitions)
+
+        print(f'{filename:>25} {before * 1000 / repetitions:>10.2f}ms {after * 1000 / repetitions:>10.2f}ms '
+              f'{before / after:>7.1f}x')
+
+
+if __name__ == '__main__':
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_REPETITIONS)
@@ -0,0 +1,93 @@
+"""
+Measures how the component stages of the Terraform and CloudFormation transformers (skipped, singleton and catchall
+components and parent types) scale with the number of components. With the id-keyed sets and the reverse id map
+index the time should grow linearly, so doubling the components should roughly double the time.
+
+Usage:
+    python -m tests.benchmark.transformer_components_benchmark [max_components]
+"""
+import gc
+import sys
+import time
+from unittest.mock import patch
+
+from otm.otm.entity.otm import OTM
+from otm.otm.entity.representation import RepresentationType
+from otm.otm.provider import Provider
+from slp_cft.slp_cft.parse.mapping.cft_transformer import CloudformationTransformer, \
+    ComponentLists as CloudformationComponentLists
+from slp_tf.slp_tf.parse.mapping.tf_transformer import TerraformTransformer, ComponentLists
+
+DEFAULT_MAX_COMPONENTS = 16000
+MIN_COMPONENTS = 1000
+SINGLETON_TYPES = 10
+REPETITIONS = 3
+
+IAC_MAPPING = {'trustzones': [{'id': 'tz', 'name': 'Trustzone', '$default': True}], 'components': [], 'dataflows': []}
+
+
+class BenchmarkProvider(str, Provider):
+    BENCHMARK = ("BENCHMARK", "Benchmark", RepresentationType.CODE)
+
+
+def build_component(component_id: str, component_type: str, parent: str) -> dict:
+    return {'id': component_id, 'name': component_id, 'type': component_type, 'parent': parent, 'tags': [],
+            'singleton_multiple_name': f'{component_type} (grouped)', 'singleton_multiple_tags': [component_id]}
+
+
+def build_components(size: int, component_lists_class):
+    """
+    Builds the components found for a source with the given number of resources: half of them are regular
+    components, each one being the parent of the next one, and the other half are split between singleton, catchall
+    and skipped components
+    """
+    component_lists = component_lists_class()
+    component_lists.components = [
+        build_component(f'c{i}', f'type-{i}', f'c{i - 1}' if i % 2 else 'tz') for i in range(size // 2)]
+    component_lists.singleton = [
+        build_component(f's{i}', f'singleton-{i % SINGLETON_TYPES}', 'tz') for i in range(size // 4)]
+    component_lists.catchall = [build_component(f'c{i}', 'catchall', 'tz') for i in range(0, size // 2, 4)] + \
+                               [build_component(f'a{i}', 'catchall', 'tz') for i in range(size // 8)]
+    component_lists.skip = [build_component(f'c{i}', 'skip', 'tz') for i in range(0, size // 2, 8)] + \
+                           [build_component(f'a{i}', 'skip', 'tz') for i in range(0, size // 8, 2)]
+    id_map = {f'resource.{component["id"]}': component['id']
+              for component in component_lists.components + component_lists.singleton}
+
+    return component_lists, id_map
+
+
+def transform_components(transformer_class, component_lists_class, size: int) -> float:
+    component_lists, id_map = build_components(size, component_lists_class)
+    transformer = transformer_class(threat_model=OTM('benchmark', 'benchmark', BenchmarkProvider.BENCHMARK))
+    transformer.iac_mapping = IAC_MAPPING
+    transformer.id_map.update(id_map)
+
+    with patch.object(transformer_class, f'_{transformer_class.__name__}__find_components',
+                      return_value=component_lists):
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            transformer.transform_components()
+            return time.perf_counter() - start
+        finally:
+            gc.enable()
+
+
+def run_benchmark(max_components: int):
+    print(f'{"transformer":>28} {"components":>10} {"time":>10} {"growth":>7}')
+
+    for transformer_class, component_lists_class in [(TerraformTransformer, ComponentLists),
+                                                     (CloudformationTransformer, CloudformationComponentLists)]:
+        previous = None
+        size = MIN_COMPONENTS
+        while size <= max_components:
+            elapsed = min(transform_components(transformer_class, component_lists_class, size)
+                          for _ in range(REPETITIONS))
+            growth = f'{elapsed / previous:>6.1f}x' if previous else f'{"-":>7}'
+            print(f'{transformer_class.__name__:>28} {size:>10} {elapsed * 1000:>8.1f}ms {growth}')
+            previous = elapsed
+            size *= 2
+
+
+if __name__ == '__main__':
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_MAX_COMPONENTS)